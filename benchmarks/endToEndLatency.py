@@ -0,0 +1,69 @@
+"""
+Latency of Big Five predictions from tokens, GloVe pipeline with ONNX
+bundle compared with the end-to-end ONNX model.
+
+The end-to-end model is built from the given GloVe database into a
+temporary directory. Profiles are drawn from the GloVe vocabulary.
+
+Run from the repository root:
+python -m benchmarks.endToEndLatency glovePath [numberOfCalls]
+"""
+import os
+import sys
+import tempfile
+import numpy
+
+from miping.interfaces import GloVe
+from miping.models import OnnxModel, GloVeOnnxModel, Profile
+from miping.training.features import Features
+from miping.trainedModels.trainedModels import TrainedModels
+
+from .onnxSessionLatency import measure
+
+
+def main():
+    glovePath = sys.argv[1]
+    numberOfCalls = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    trainedModels = TrainedModels()
+    glove = GloVe(glovePath, dataBaseMode=True)
+
+    random = numpy.random.RandomState(0)
+    wordList = glove.get_index_list()
+    profile = Profile(
+        userID='0',
+        text=' '.join(random.choice(wordList, size=3000))
+    )
+
+    pipeline = Features().createGloVeFeaturePipeline(
+        glovePath=glovePath,
+        dataBaseMode=True
+    )
+    bundle = OnnxModel('ONNX Bundle', 'big5')
+    bundle.importModelONNX(trainedModels.get_bundle_file_path())
+
+    with tempfile.TemporaryDirectory() as tempDir:
+        path = os.path.join(tempDir, 'glovebig5_end_to_end.ONNX')
+        trainedModels.build_end_to_end_onnx(glove, path)
+        endToEnd = GloVeOnnxModel('ONNX End-to-End Model', 'big5')
+        endToEnd.importModelONNX(path)
+
+        def pipelineAndBundle():
+            bundle.predict_all(pipeline.fit_transform([profile]))
+
+        def endToEndModel():
+            endToEnd.predict_token_ids(
+                endToEnd.get_token_ids(profile.get_tokens())
+            )
+
+        print("Latency for one profile with 3000 tokens, " +
+              str(numberOfCalls) + " calls (median / p95 in ms)")
+        for name, function in [
+            ('pipeline and bundle', pipelineAndBundle),
+            ('end-to-end model', endToEndModel),
+        ]:
+            median, p95 = measure(function, numberOfCalls)
+            print("%-22s %8.3f / %8.3f" % (name, median, p95))
+
+
+if __name__ == '__main__':
+    main()
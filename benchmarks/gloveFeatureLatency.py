@@ -0,0 +1,64 @@
+"""
+Latency of GloVe features for one profile with 3000 tokens (about 200
+tweets).
+
+Compares the vocabulary check that ran on every call before
+(get_index_list and numpy.setdiff1d) with the batch lookup used now
+(getGloVeMatrixByWordList), and shows the whole featureGloVe call.
+Works with every GloVe format: database (column or BLOB schema),
+memory-mapped store and flat file. A tenth of the tokens is unknown.
+
+Run from the repository root:
+python -m benchmarks.gloveFeatureLatency glovePath [numberOfCalls]
+"""
+import sys
+import numpy
+
+from miping.interfaces import GloVe
+from miping.models import Profile
+from miping.training.features import Features
+
+from .onnxSessionLatency import measure
+
+
+def main():
+    glovePath = sys.argv[1]
+    numberOfCalls = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    glove = GloVe(glovePath, dataBaseMode=glovePath.endswith('.db'))
+
+    random = numpy.random.RandomState(0)
+    wordList = glove.get_index_list()
+    unknownList = ['unbekannt' + str(num) for num in range(300)]
+    tokenList = list(random.choice(wordList, size=2700)) + list(
+        random.choice(unknownList, size=300)
+    )
+    random.shuffle(tokenList)
+    profile = Profile(userID='0', text=' '.join(tokenList))
+
+    features = Features()
+    features.glove = glove
+
+    def indexListAndSetdiff():
+        index_as_list = glove.get_index_list()
+        numpy.setdiff1d(tokenList, index_as_list)
+
+    def matrixByWordList():
+        glove.getGloVeMatrixByWordList(wordList=tokenList)
+
+    def featureGloVe():
+        features.featureGloVe([profile])
+
+    print("Latency for one profile with 3000 tokens, " +
+          str(len(wordList)) + " words in GloVe, " +
+          str(numberOfCalls) + " calls (median / p95 in ms)")
+    for name, function in [
+        ('index list and setdiff', indexListAndSetdiff),
+        ('matrix by word list', matrixByWordList),
+        ('featureGloVe', featureGloVe),
+    ]:
+        median, p95 = measure(function, numberOfCalls)
+        print("%-22s %8.3f / %8.3f" % (name, median, p95))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Per-call latency of Big Five predictions with the shipped ONNX models.
+
+Compares creating an InferenceSession for every prediction (behaviour
+before sessions were reused) with the session created once on import,
+and with the bundle predicting all dimensions in one run.
+
+Run from the repository root:
+python -m benchmarks.onnxSessionLatency [numberOfCalls]
+"""
+import sys
+import time
+import numpy
+import onnxruntime as oonxrt
+
+from miping.models import OnnxModel
+from miping.trainedModels.trainedModels import TrainedModels
+
+
+def measure(function, numberOfCalls):
+    """
+    Return median and 95th percentile of call duration in ms.
+    """
+    # warm up
+    function()
+    durations = []
+    for num in range(numberOfCalls):
+        start = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return numpy.median(durations), numpy.percentile(durations, 95)
+
+
+def main():
+    numberOfCalls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    trainedModels = TrainedModels()
+    pathDict = trainedModels.get_onnx_path_dict()
+    X = numpy.random.RandomState(0).rand(1, 900).astype(numpy.float32)
+
+    modelBytes = {}
+    models = {}
+    for dimension, modelPath in pathDict.items():
+        with open(modelPath, 'rb') as in_file:
+            modelBytes[dimension] = in_file.read()
+        models[dimension] = OnnxModel('ONNX Model', dimension)
+        models[dimension].importModelONNX(modelPath)
+
+    bundle = OnnxModel('ONNX Bundle', 'big5')
+    bundle.importModelONNX(trainedModels.get_bundle_file_path())
+
+    def sessionPerCall():
+        for data in modelBytes.values():
+            sess = oonxrt.InferenceSession(data)
+            sess.run(
+                [sess.get_outputs()[0].name],
+                {sess.get_inputs()[0].name: X}
+            )
+
+    def reusedSessions():
+        for model in models.values():
+            model.predict(X)
+
+    def bundleSession():
+        bundle.predict_all(X)
+
+    print("Latency for 5 dimensions, one profile, " +
+          str(numberOfCalls) + " calls (median / p95 in ms)")
+    for name, function in [
+        ('session per call', sessionPerCall),
+        ('reused sessions', reusedSessions),
+        ('reused bundle session', bundleSession),
+    ]:
+        median, p95 = measure(function, numberOfCalls)
+        print("%-22s %8.3f / %8.3f" % (name, median, p95))
+
+
+if __name__ == '__main__':
+    main()
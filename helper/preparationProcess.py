@@ -21,6 +21,7 @@ class PreparationProcess:
         config,
         ibm=None,
         twitter=None,
+        fileSuffix='.csv',
     ):
         """
         Init function to save configuration and API objects.
@@ -33,10 +34,16 @@ class PreparationProcess:
             Initialized IbmAPI object, ready for calls.
         twitter : miping.interfaces.TwitterAPI, default=None
             Initialized TwitterAPI object, ready for calls.
+        fileSuffix : string, default='.csv'
+            Suffix of LIWC enriched profile files, '.parquet' for
+            Parquet files. Files read by LIWC stay CSV.
         """
         # save config
         self.config = config
 
+        # suffix of stage files
+        self.fileSuffix = fileSuffix
+
         # save ibm object
         self.ibm = ibm
 
@@ -57,6 +64,8 @@ class PreparationProcess:
         scraped data. This function allows to import a CSV file containing
         only user IDs and automatically fetching related user objects and
         for each user up to the latest 250 tweets. Private users are skipped.
+        Timelines of several users are fetched concurrently, the number
+        of threads is configured in twitter:fetch_threads.
         The CSV file path is hard coded.
         Expected CSV path: 'data/04' + country + 'UserIDs.csv'
 
@@ -101,12 +110,12 @@ class PreparationProcess:
         tweetCol = TweetCollection(
             additionalAttributes=self.config["twitter"]["add_attributes"]
         )
-        for user in usersCol.userList:
-            # get tweets for given user
-            singleTweetCol = self.twitter.funcGetTweetListByUser(
-                    userID=user.id_str,
-                    limit=250,
-            )
+        # get tweets for given users, in order of usersCol
+        for singleTweetCol in self.twitter.iter_tweet_lists_by_users(
+                userIDList=[user.id_str for user in usersCol.userList],
+                limit=250,
+                maxWorkers=self.config["twitter"]["fetch_threads"],
+        ):
             # add to total collection
             tweetCol.add_tweet_collection(singleTweetCol)
 
@@ -123,6 +132,7 @@ class PreparationProcess:
         readFiles=False,
         writeFiles=False,
         hydrateUsers=False,
+        cleanJobs=1,
     ):
         """
         Actual data preparation for each user. Combining tweets to string.
@@ -165,6 +175,8 @@ class PreparationProcess:
             and take its results as input for condensing. In this case
             verifiedTweetCol and verifiedUsers can be passed as empty
             objects.
+        cleanJobs : integer, default=1
+            Number of processes for cleaning the texts, -1 for all cores.
 
         Returns
         -------
@@ -213,23 +225,35 @@ class PreparationProcess:
                     country=country
                 )
 
+            # group tweets by user in a single pass over all tweets
+            tweetsByUser = dict(verifiedTweetCol.group_by_user())
+
             # iterate over all users to condense their tweets
-            # and create a profile to add to profileCollection
+            userIDList = []
+            tweetCountList = []
+            textList = []
             for user in verifiedUsers.userList:
                 userID = user.id_str
                 # get all saved tweets for this user
-                userTweetCol = verifiedTweetCol.get_tweets_of_userid(
-                    userID=userID
-                )
+                userTweetCol = tweetsByUser.get(userID)
+                if userTweetCol is None:
+                    userTweetCol = TweetCollection()
+                userIDList.append(userID)
                 # save number of tweets in list
-                tweetCount = len(userTweetCol.tweetList)
+                tweetCountList.append(len(userTweetCol.tweetList))
                 # combine all tweets into one string
-                textString = userTweetCol.combine_tweet_text()
-                # call data cleansing for combined string
-                textString = dataPre.clean_text(
-                    textString=textString
-                )
+                textList.append(userTweetCol.combine_tweet_text())
+
+            # call data cleansing for all combined strings
+            textList = dataPre.clean_many(
+                textList=textList,
+                n_jobs=cleanJobs
+            )
 
+            # create a profile to add to profileCollection
+            for userID, tweetCount, textString in zip(
+                userIDList, tweetCountList, textList
+            ):
                 # count words (based on any whitespace)
                 wordCount = len(textString.split())
 
@@ -459,7 +483,7 @@ class PreparationProcess:
             file_directory_string = (
                 'data/06' +
                 country +
-                'liwc_profiles.csv'
+                'liwc_profiles' + self.fileSuffix
             )
             file_path = Path(file_directory_string)
 
@@ -507,7 +531,7 @@ class PreparationProcess:
                 file_directory_string = (
                     'data/06' +
                     country +
-                    'liwc_profiles.csv'
+                    'liwc_profiles' + self.fileSuffix
                 )
                 file_path = Path(file_directory_string)
 
@@ -3,6 +3,8 @@ import random
 from pathlib import Path
 from miping.models.tweetCollection import TweetCollection
 from miping.models.userCollection import UserCollection
+from miping.models.columnarFile import ColumnarFile
+from miping.interfaces.tweetSink import TweetSink
 
 
 class Scraping:
@@ -18,6 +20,7 @@ class Scraping:
         config,
         twitter,
         maps=None,
+        fileSuffix='.csv',
     ):
         """
         Init function for configuration and APIs.
@@ -30,9 +33,13 @@ class Scraping:
             Initialized TwitterAPI object, ready for calls.
         maps : miping.interfaces.MapsAPI, default=None
             Initialized Google Maps API, ready for calls, optional.
+        fileSuffix : string, default='.csv'
+            Suffix of tweet and user files, '.parquet' for Parquet files.
         """
         self.config = config
 
+        self.fileSuffix = fileSuffix
+
         self.twitter = twitter
 
         self.maps = maps
@@ -48,8 +55,13 @@ class Scraping:
         Allows imports and exports of results via CSV. Expected path is
         'data/01streamed' + countryConf['name'] + 'tweet.csv'.
         Based on coordinates from configuration, Twitter API's
-        stream_tweets_by_location() by location is called. This streams
-        tweets in these coordinates for the given time limit (from config).
+        stream_tweets_by_locations() is called once for all countries.
+        This streams tweets in these coordinates for the given time limit
+        (from config) and assigns each tweet to its country.
+        During streaming, tweets are written batch-wise to part files in
+        'data/01streamed' + countryConf['name'] + 'tweet_parts', so they
+        are not lost if the program stops. Afterwards the part files are
+        read batch by batch and appended to the export file.
         Additionally, selection criteria from config regarding
         maximum and minimum follower count, as well as minimum status
         count are passed.
@@ -68,6 +80,8 @@ class Scraping:
         -------
         returnDictCollection : dict
             Dictionary containing one TweetCollection for each country.
+            To keep memory bounded, it only contains the first tweet of
+            each user, which is all doFollowerSelection needs.
         """
         if writeFiles is True and readFiles is True:
             raise Exception(
@@ -94,17 +108,19 @@ class Scraping:
                 file_directory_string = (
                     'data/01streamed' +
                     countryConf['name'] +
-                    'tweet.csv'
+                    'tweet' + self.fileSuffix
                 )
                 file_path = Path(file_directory_string)
 
-                scrapedTweets = TweetCollection(
+                tweetCol = TweetCollection(
                     additionalAttributes=(
                         self.config["twitter"]["add_attributes"]
                     )
                 )
-                scrapedTweets.read_tweet_list_file(
-                    full_path=file_path
+                scrapedTweets = self.collectUserTweets(
+                    batchIter=tweetCol.iter_tweet_list_file(
+                        full_path=file_path
+                    )
                 )
 
                 # add collection to dict
@@ -113,50 +129,136 @@ class Scraping:
             print("Files successfully loaded")
         else:
             print("\nBegin scraping by location")
+            scrapeConfig = self.config['scraping']
+            # all countries are streamed at once
+            locationDict = {}
+            tweetSinkDict = {}
             for country in self.config['twitter']['coordinates']:
                 # getting coordinates for streaming
                 countryConf = self.config['twitter']['coordinates'][country]
 
-                location = [
+                locationDict[countryConf['name']] = [
                     countryConf['southwest']['lng'],
                     countryConf['southwest']['lat'],
                     countryConf['northeast']['lng'],
                     countryConf['northeast']['lat']
                 ]
-                print(
-                    "Streaming for country: " +
-                    countryConf['name']
-                )
 
-                scrapeConfig = self.config['scraping']
-                scrapedTweets = self.twitter.stream_tweets_by_location(
-                    location=location,
-                    timeLimit=scrapeConfig['timer'],
-                    maxFollowerCount=scrapeConfig['user_max_followers'],
-                    minStatusesCount=scrapeConfig['users_min_tweet_no'],
-                    minFollowerCount=scrapeConfig['user_min_followers'],
+                # streamed tweets are written to disk during streaming
+                tweetSinkDict[countryConf['name']] = TweetSink(
+                    directory=(
+                        'data/01streamed' +
+                        countryConf['name'] +
+                        'tweet_parts'
+                    ),
+                    additionalAttributes=(
+                        self.config["twitter"]["add_attributes"]
+                    ),
+                    fileSuffix=self.fileSuffix,
+                    batchSize=scrapeConfig['sink_batch_size'],
+                    queueSize=scrapeConfig['sink_queue_size'],
+                    rotateTweets=scrapeConfig['sink_rotate_tweets'],
                 )
 
+            print(
+                "Streaming for countries: " +
+                ", ".join(locationDict)
+            )
+            # sinks are returned, tweets are read from their part files
+            tweetSinkDict = self.twitter.stream_tweets_by_locations(
+                locationDict=locationDict,
+                timeLimit=scrapeConfig['timer'],
+                maxFollowerCount=scrapeConfig['user_max_followers'],
+                minStatusesCount=scrapeConfig['users_min_tweet_no'],
+                minFollowerCount=scrapeConfig['user_min_followers'],
+                tweetSinkDict=tweetSinkDict,
+            )
+
+            for countryName, tweetSink in tweetSinkDict.items():
+                file_path = None
                 # only write file if specified
                 if writeFiles is True:
                     # path for saving tweets
                     file_directory_string = (
                         'data/01streamed' +
-                        countryConf['name'] +
-                        'tweet.csv'
+                        countryName +
+                        'tweet' + self.fileSuffix
                     )
                     file_path = Path(file_directory_string)
 
-                    scrapedTweets.write_tweet_list_file(
-                        full_path=file_path
-                    )
+                scrapedTweets = self.collectUserTweets(
+                    batchIter=tweetSink.iter_tweets(),
+                    file_path=file_path
+                )
 
                 # add collection to dict
-                returnDictCollection[countryConf['name']] = scrapedTweets
+                returnDictCollection[countryName] = scrapedTweets
             print("End scraping by location")
 
         return returnDictCollection
 
+    def collectUserTweets(
+        self,
+        batchIter,
+        file_path=None,
+    ):
+        """
+        Keep first tweet of each user from batches of tweets.
+
+        Only one batch and one tweet per user are kept in memory.
+        If file_path is given, all tweets are written to it batch
+        by batch.
+
+        Parameters
+        ----------
+        batchIter : iterable, default=None, required
+            TweetCollections, e.g. from TweetSink.iter_tweets.
+        file_path : string, default=None
+            Full path of file all tweets are written to.
+
+        Returns
+        -------
+        userTweetCol : TweetCollection
+            First tweet of each user, in order of appearance.
+        """
+        userTweetCol = TweetCollection(
+            additionalAttributes=self.config["twitter"]["add_attributes"]
+        )
+        userIDSet = set()
+        # parquet writer, if file_path is a Parquet file
+        writer = None
+        fileStarted = False
+
+        try:
+            for batchCol in batchIter:
+                if file_path is not None:
+                    if ColumnarFile.is_columnar_path(file_path):
+                        writer = batchCol.append_tweet_list_parquet(
+                            writer=writer,
+                            full_path=file_path
+                        )
+                    else:
+                        # first batch replaces an existing file
+                        batchCol.write_tweet_list_file(
+                            full_path=file_path,
+                            append=fileStarted
+                        )
+                    fileStarted = True
+
+                for tweet in batchCol.tweetList:
+                    if tweet.user_id not in userIDSet:
+                        userIDSet.add(tweet.user_id)
+                        userTweetCol.funcAddTweet(tweet)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if file_path is not None and fileStarted is False:
+            # no tweets, write empty file anyway
+            userTweetCol.write_tweet_list_file(full_path=file_path)
+
+        return userTweetCol
+
     def doFollowerSelection(
         self,
         tweetSampleCol,
@@ -224,7 +326,7 @@ class Scraping:
             # users where we know the location
             file_path_loc = Path(
                     file_directory_string +
-                    'users_location_verified.csv'
+                    'users_location_verified' + self.fileSuffix
             )
             locationUsersCol = UserCollection()
             locationUsersCol.read_user_list_file(
@@ -233,7 +335,7 @@ class Scraping:
 
             file_path_fol = Path(
                     file_directory_string +
-                    'users_location_follower.csv'
+                    'users_location_follower' + self.fileSuffix
             )
             # selected followers, we need to verify location
             eligibleFollowersCol = UserCollection()
@@ -316,7 +418,7 @@ class Scraping:
 
                 file_path_loc = Path(
                     file_directory_string +
-                    'users_location_verified.csv'
+                    'users_location_verified' + self.fileSuffix
                 )
                 # users where we know the location
                 locationUsersCol.write_user_list_file(
@@ -325,7 +427,7 @@ class Scraping:
 
                 file_path_fol = Path(
                     file_directory_string +
-                    'users_location_follower.csv'
+                    'users_location_follower' + self.fileSuffix
                 )
                 # selected followers, we need to verify location
                 eligibleFollowersCol.write_user_list_file(
@@ -406,7 +508,7 @@ class Scraping:
             # verified and selected users
             file_path_user = Path(
                     file_directory_string +
-                    'users.csv'
+                    'users' + self.fileSuffix
             )
             verifiedUsers = UserCollection()
             verifiedUsers.read_user_list_file(
@@ -415,7 +517,7 @@ class Scraping:
             # tweets of verified and selected users
             file_path_tweets = Path(
                     file_directory_string +
-                    'tweets.csv'
+                    'tweets' + self.fileSuffix
             )
             verifiedTweetCol = TweetCollection(
                 additionalAttributes=self.config["twitter"]["add_attributes"]
@@ -472,7 +574,7 @@ class Scraping:
                 # verified and selected users
                 file_path_user = Path(
                         file_directory_string +
-                        'users.csv'
+                        'users' + self.fileSuffix
                 )
                 verifiedUsers.write_user_list_file(
                     full_path=file_path_user
@@ -480,7 +582,7 @@ class Scraping:
                 # tweets of verified and selected users
                 file_path_tweets = Path(
                         file_directory_string +
-                        'tweets.csv'
+                        'tweets' + self.fileSuffix
                 )
                 verifiedTweetCol.write_tweet_list_file(
                     full_path=file_path_tweets
@@ -552,15 +654,25 @@ class Scraping:
             additionalAttributes=self.config["twitter"]["add_attributes"]
         )
 
-        for num, user in enumerate(usersCol.userList):
-            # retrieve user timeline upto max number of tweets
-            max_tweets = self.config["twitter"]["user_max_tweet_no"]
+        # retrieve user timelines upto max number of tweets
+        # timelines of next users are fetched concurrently
+        max_tweets = self.config["twitter"]["user_max_tweet_no"]
+        timelines = self.twitter.iter_tweet_lists_by_users(
+            userIDList=[user.id_str for user in usersCol.userList],
+            limit=max_tweets,
+            maxWorkers=self.config["twitter"]["fetch_threads"],
+        )
+
+        for num, (user, userTweetCol) in enumerate(
+            zip(usersCol.userList, timelines)
+        ):
             result, tweetCol = self.checkUserLanguage(
                 user,
                 targetLanguage=targetLanguage,
                 langThreshold=langThreshold,
                 otherLangThreshold=otherLangThreshold,
-                limit=max_tweets
+                limit=max_tweets,
+                tweetCol=userTweetCol
             )
 
             if result is True:
@@ -600,6 +712,8 @@ class Scraping:
                         )
 
             if verifiedCounter >= userLimit:
+                # stops fetching further timelines
+                timelines.close()
                 break
 
         print(
@@ -621,6 +735,7 @@ class Scraping:
         langThreshold=1,  # 100%
         otherLangThreshold=0,  # 0 %
         limit=3200,
+        tweetCol=None,
     ):
         """
         Check if user timeline matches criteria and return results.
@@ -648,6 +763,9 @@ class Scraping:
             Maximum number of tweets to select from user. 3200 is
             API limit set by Twitter for free API. This limit includes
             retweets, but those are excluded in the process.
+        tweetCol : TweetCollection, default=None
+            Already retrieved tweets from user timeline. If None,
+            they are retrieved.
 
         Returns
         -------
@@ -666,10 +784,11 @@ class Scraping:
         otherLangTweets = 0
 
         # get tweets for given user
-        tweetCol = self.twitter.funcGetTweetListByUser(
-                user.id_str,
-                limit=limit
-        )
+        if tweetCol is None:
+            tweetCol = self.twitter.funcGetTweetListByUser(
+                    user.id_str,
+                    limit=limit
+            )
         # total number of tweets
         totalTweets = len(tweetCol.tweetList)
 
@@ -4,8 +4,11 @@ from pathlib import Path
 import numpy as np
 
 from miping.training.features import Features
+from miping.training.featureCache import FeatureCache
+from miping.training.featureStore import FeatureStore
 from miping.training.modelTraining import ModelTraining
 from miping.models.profileCollection import ProfileCollection
+from miping.trainedModels import TrainedModels
 from miping.interfaces.helper import Helper
 from .preparationProcess import PreparationProcess
 from scipy.stats.stats import pearsonr
@@ -23,6 +26,7 @@ class TrainingProcess:
         self,
         config,
         modelConfig,
+        fileSuffix='.csv',
     ):
         """
         Init function for configurations.
@@ -34,13 +38,43 @@ class TrainingProcess:
         modelConfig : dict, default=None, required
             Configuration object for model training and grid search
             as returned from ConfigLoader class.
+        fileSuffix : string, default='.csv'
+            Suffix of profile files, '.parquet' for Parquet files.
         """
 
         self.config = config
         self.modelConfig = modelConfig
+        # suffix of stage files
+        self.fileSuffix = fileSuffix
 
         return
 
+    def createFeatureCache(
+        self,
+    ):
+        """
+        Create FeatureCache as configured or return None.
+
+        "feature_cache_path" in the configuration is the SQLite file of
+        the cache, if it's empty no cache is used.
+        "feature_cache_max_mb" limits the cache size.
+
+        Returns
+        -------
+        featureCache : FeatureCache
+            Opened cache or None.
+        """
+        cachePath = self.config["feature_cache_path"]
+        if not cachePath:
+            return None
+
+        featureCache = FeatureCache(
+            filePath=Path(cachePath),
+            maxBytes=self.config["feature_cache_max_mb"] * 1024 * 1024
+        )
+
+        return featureCache
+
     def createModels(
         self,
         step='LIWC',
@@ -245,10 +279,16 @@ class TrainingProcess:
                 labelsGlobalList=self.config['labelsGlobalList'],
                 printIntermediateResults=self.config['printDetailResults']
             )
+            # features are calculated once from the columnar LIWC
+            # matrix and used for selection and complete training
+            liwcFeatures = liwcFeaturePipeline.fit_transform(
+                profileCol.get_liwc_matrix()
+            )
             globalBestModels = modelTraining.startModelSelection(
                 modelObjList=modelList,
                 featurePipeline=liwcFeaturePipeline,
                 profileColTraining=profileCol,
+                precalculatedFeatures=liwcFeatures,
             )
 
             # fully train model in different method of modelTraining
@@ -257,6 +297,7 @@ class TrainingProcess:
                 modelCollection=globalBestModels,
                 featurePipeline=liwcFeaturePipeline,
                 profileColTraining=profileCol,
+                precalculatedFeatures=liwcFeatures,
             )
 
             # only export models if specified
@@ -380,7 +421,7 @@ class TrainingProcess:
             file_directory_string = (
                 'data/07' +
                 country +
-                'full_profiles.csv'
+                'full_profiles' + self.fileSuffix
             )
             file_path = Path(file_directory_string)
 
@@ -408,8 +449,9 @@ class TrainingProcess:
                 # create feature pipeline
                 features = Features()
                 liwcFeaturePipeline = features.createLIWCFeaturePipeline()
-                profileList = profileCol.profileList
-                features = liwcFeaturePipeline.fit_transform(profileList)
+                features = liwcFeaturePipeline.fit_transform(
+                    profileCol.get_liwc_matrix()
+                )
                 print(
                     "Feature shape " +
                     str(features.shape)
@@ -426,19 +468,18 @@ class TrainingProcess:
                     length=50
                 )
 
+                # for each dimension predict all profiles at once
+                # with respective model
+                predictions = {
+                    dimension: modelBase.model.predict(features)
+                    for dimension, modelBase in globalLIWCModels.items()
+                }
+
                 # iterate over all profiles
                 # and enrich profiles with prediction
                 for num, profile in enumerate(profileCol.profileList):
-                    # we just take the row with this profile's features
-                    singleFeature = np.array([features[num]])
-                    # for each dimension use respective model
-                    for dimension, modelBase in globalLIWCModels.items():
-                        profile = self.predict_profile(
-                            profile=profile,
-                            features=singleFeature,
-                            dimension=dimension,
-                            model=modelBase.model
-                        )
+                    for dimension, result in predictions.items():
+                        setattr(profile, dimension, float(result[num]))
 
                     # add filled profile to collection
                     returnProfileCol.add_profile(profile)
@@ -458,7 +499,7 @@ class TrainingProcess:
                 file_directory_string = (
                     'data/07' +
                     country +
-                    'full_profiles.csv'
+                    'full_profiles' + self.fileSuffix
                 )
                 file_path = Path(file_directory_string)
 
@@ -639,21 +680,119 @@ class TrainingProcess:
 
         return globalTrainedModels
 
+    def openFeatureStore(
+        self,
+        profileCol=None,
+    ):
+        """
+        Open GloVe feature store 'data/08gloveFeatures'.
+
+        If the store does not exist yet, but the former single file
+        'data/08gloveFeatures.npy' does, it is imported once. Its rows
+        are assigned to the profiles of profileCol in order. The file
+        does not contain user ids, so it is only imported if its row
+        count matches and the features of up to 20 profiles spread over
+        the file are the same when calculated again. Otherwise the
+        file is ignored and features are calculated as needed.
+
+        Parameters
+        ----------
+        profileCol : ProfileCollection, default=None
+            Profiles of former feature file, only used for import.
+
+        Returns
+        -------
+        featureStore : FeatureStore
+            Opened feature store.
+        """
+        file_directory_string = (
+            'data/08gloveFeatures'
+        )
+        storeExists = Path(file_directory_string, 'meta.json').exists()
+        featureStore = FeatureStore(
+            directory=Path(file_directory_string),
+            featureType='glove',
+            dim=900
+        )
+
+        legacyPath = Path(file_directory_string + ".npy")
+        if storeExists is False and legacyPath.exists():
+            legacyFeatures = np.load(
+                file=legacyPath,
+                mmap_mode='r',
+                allow_pickle=False
+            )
+            profileList = []
+            if profileCol is not None:
+                profileList = profileCol.profileList
+
+            legacyMatches = False
+            if (
+                len(profileList) > 0 and
+                legacyFeatures.shape == (len(profileList), featureStore.dim)
+            ):
+                # calculate sample of rows again to compare
+                calc_features, gloveFeaturePipeline, features = (
+                    self.prepareFeaturesGloVe(
+                        readFeatureFile=False,
+                        profileCol=profileCol
+                    )
+                )
+                sampleRows = np.unique(
+                    np.linspace(
+                        0,
+                        len(profileList) - 1,
+                        num=min(len(profileList), 20)
+                    ).astype(int)
+                )
+                sampleFeatures = gloveFeaturePipeline.fit_transform(
+                    [profileList[num] for num in sampleRows]
+                )
+                legacyMatches = bool(np.allclose(
+                    sampleFeatures,
+                    legacyFeatures[sampleRows],
+                    rtol=1e-4,
+                    atol=1e-6
+                ))
+
+            if legacyMatches is True:
+                print("Importing " + str(legacyPath) + " into feature store")
+                featureStore.check_fingerprint(
+                    features.glove.get_fingerprint()
+                )
+                featureStore.append(
+                    profileList=profileList,
+                    featureMatrix=legacyFeatures
+                )
+            else:
+                print(
+                    str(legacyPath) +
+                    " does not match profiles, not imported"
+                )
+
+        return featureStore
+
     def prepareFeaturesGloVe(
         self,
         readFeatureFile,
+        profileCol,
     ):
         """
         Depending on parameter import precalculated features or prepare
         feature pipeline.
 
         To save time precalculated features (exported in a previous run),
-        can be imported. Expected path is 'data/08gloveFeatures.npy'.
-        If those are not imported the glove feature pipeline is created
-        and returned.
+        can be imported from the feature store 'data/08gloveFeatures'
+        (see openFeatureStore). Only the rows of the profiles in
+        profileCol are read. Profiles missing in the store (or with
+        changed text) are calculated and appended first.
+        If features are not imported the glove feature pipeline is
+        created and returned.
         For glove feature pipeline "glove_path" and "glove_database"
         have to be set in the global configuration to point to the glove
-        vector file.
+        vector file. "glove_n_jobs" sets the number of processes.
+        If "feature_cache_path" is set, features of unchanged profiles
+        are read from the cache (see createFeatureCache).
         All variables are returned, but might be empty depending on flag.
 
         Parameters
@@ -661,6 +800,8 @@ class TrainingProcess:
         readFeatureFile : boolean, default=None, required
             Flag to indicate if precalculated features should be read
             or only pipeline should be prepared.
+        profileCol : ProfileCollection, default=None, required
+            Profiles to read features for.
 
         Returns
         -------calc_features, gloveFeaturePipeline, features
@@ -677,19 +818,35 @@ class TrainingProcess:
         if readFeatureFile is True:
             print("reading featureFile")
             print("\nImporting calculated features")
-            # path for saved features
-            file_directory_string = (
-                'data/08gloveFeatures'
-            )
-            # concatenate file path
-            file_path = Path(
-                file_directory_string +
-                ".npy"
-            )
-            # call numpy load function
-            calc_features = np.load(
-                file=file_path,
-                allow_pickle=False
+            profileList = profileCol.profileList
+            featureStore = self.openFeatureStore(profileCol)
+
+            # calculate only profiles not in store yet
+            missingProfiles = featureStore.get_missing_profiles(profileList)
+            if len(missingProfiles) > 0:
+                print(
+                    "Calculating features for " +
+                    str(len(missingProfiles)) +
+                    " profiles missing in feature store"
+                )
+                calc_features, gloveFeaturePipeline, features = (
+                    self.prepareFeaturesGloVe(
+                        readFeatureFile=False,
+                        profileCol=profileCol
+                    )
+                )
+                featureStore.check_fingerprint(
+                    features.glove.get_fingerprint()
+                )
+                featureStore.append(
+                    profileList=missingProfiles,
+                    featureMatrix=gloveFeaturePipeline.fit_transform(
+                        missingProfiles
+                    )
+                )
+
+            calc_features = featureStore.get_features(
+                [profile.userID for profile in profileList]
             )
             print("Feature shape: " + str(calc_features.shape))
             gloveFeaturePipeline = None
@@ -705,7 +862,9 @@ class TrainingProcess:
             features = Features()
             gloveFeaturePipeline = features.createGloVeFeaturePipeline(
                 glovePath=file_path,
-                dataBaseMode=self.config["glove_database"]
+                dataBaseMode=self.config["glove_database"],
+                n_jobs=self.config["glove_n_jobs"],
+                featureCache=self.createFeatureCache()
             )
         return calc_features, gloveFeaturePipeline, features
 
@@ -753,10 +912,11 @@ class TrainingProcess:
             If True, instead of training trained models will be imported
             from ONNX files.
         writeFeatureFile : boolean, default=False
-            Calculated features will be exported via numpy.dump function
-            if True.
+            Calculated features of new or changed profiles will be
+            appended to the feature store if True.
         readFeatureFile : boolean, default=False
             Previously exported features can be imported if True.
+            Missing profiles are calculated and appended.
 
         Returns
         -------
@@ -796,7 +956,8 @@ class TrainingProcess:
             # features from file or prepare feature pipeline
             calc_features, gloveFeaturePipeline, featuresClass = (
                 self.prepareFeaturesGloVe(
-                    readFeatureFile
+                    readFeatureFile=readFeatureFile,
+                    profileCol=profileCol
                 )
             )
 
@@ -847,25 +1008,38 @@ class TrainingProcess:
                     "Minimum word coverage: " +
                     str(np.min(featuresClass.coverageStatistics))
                 )
+                if featuresClass.featureCache is not None:
+                    print(
+                        "Feature cache: " +
+                        str(featuresClass.featureCache.get_statistics())
+                    )
 
             # write feature file
             if writeFeatureFile is True:
                 print("\nExporting calculated features")
                 calc_features = modelTraining.features
-                # path for saving features
-                file_directory_string = (
-                    'data/08gloveFeatures'
+                profileList = profileCol.profileList
+                featureStore = self.openFeatureStore()
+                featureStore.check_fingerprint(
+                    featuresClass.glove.get_fingerprint()
                 )
-                # concatenate file path
-                file_path = Path(
-                    file_directory_string +
-                    ".npy"
+                # append only new or changed profiles
+                missingProfiles = set(
+                    id(profile) for profile in
+                    featureStore.get_missing_profiles(profileList)
                 )
-                # call numpy save function
-                np.save(
-                    file=file_path,
-                    arr=calc_features,
-                    allow_pickle=False
+                missingRows = [
+                    num for num, profile in enumerate(profileList)
+                    if id(profile) in missingProfiles
+                ]
+                featureStore.append(
+                    profileList=[profileList[num] for num in missingRows],
+                    featureMatrix=calc_features[missingRows]
+                )
+                print(
+                    "Feature store contains " +
+                    str(len(featureStore)) +
+                    " profiles"
                 )
 
             # only export models if specified
@@ -900,6 +1074,7 @@ class TrainingProcess:
                 )
 
                 # save models
+                pathDict = {}
                 for model in globalTrainedModels.values():
                     # concatenate file path
                     file_path = Path(
@@ -907,6 +1082,7 @@ class TrainingProcess:
                         model.labelName +
                         ".ONNX"
                     )
+                    pathDict[model.labelName] = file_path
                     # call export function for model
                     # since it's GloVe model, 900 is input dimension
                     model.exportModelONNX(
@@ -915,6 +1091,19 @@ class TrainingProcess:
                         inputName='glove_input',
                     )
 
+                # additionally export all dimensions in one bundle
+                # so all can be predicted with one session run
+                # bundle is built from the files above and stores their
+                # hash, so an outdated bundle is detected when loading
+                file_path = Path(
+                    file_directory_string +
+                    "big5_bundle.ONNX"
+                )
+                mipingModels.ModelBase.exportONNXBundleFromFiles(
+                    pathDict=pathDict,
+                    path=file_path,
+                )
+
             print("\nEnd of GloVe Model Training\n")
 
         return globalTrainedModels
@@ -941,7 +1130,7 @@ class TrainingProcess:
         globalGloVeModels : dict, default=None, required
             Dictionary with fully trained GloVe models.
         readFeatureFile : boolean, default=False
-            If True features are read from file.
+            If True features are read from feature store.
 
         Returns
         -------
@@ -954,7 +1143,8 @@ class TrainingProcess:
         # features from file or prepare feature pipeline
         calc_features, gloveFeaturePipeline, featuresClass = (
             self.prepareFeaturesGloVe(
-                readFeatureFile
+                readFeatureFile=readFeatureFile,
+                profileCol=profileCol
             )
         )
 
@@ -1016,6 +1206,82 @@ class TrainingProcess:
 
         return prediction
 
+    def validateQuantizedGloVe(
+        self,
+        profileCol,
+        quantizedPath,
+    ):
+        """
+        Compare Big Five scores of quantized and float32 GloVe.
+
+        Features are calculated twice for the profiles, once with
+        "glove_path" from the global configuration (reference) and once
+        with the quantized store (see GloVe.exportMemmapStore).
+        Both are predicted with the shipped ONNX models in
+        miping/trainedModels. Max and mean absolute deviation of the
+        scores are printed for each Big Five dimension.
+        Profiles should not be part of the training set.
+
+        Parameters
+        ----------
+        profileCol : ProfileCollection, default=None, required
+            Held-out profiles to predict.
+        quantizedPath : string, default=None, required
+            Path to quantized memory-mapped store (.npy).
+
+        Returns
+        -------
+        deviation : dict
+            Big Five dimension as key and tuple of max and mean absolute
+            deviation as value.
+        """
+        print("\nValidating quantized GloVe " + str(quantizedPath))
+
+        profileList = profileCol.profileList
+
+        # reference features with float32 GloVe
+        features = Features()
+        pipeline = features.createGloVeFeaturePipeline(
+            glovePath=Path(self.config["glove_path"]),
+            dataBaseMode=self.config["glove_database"]
+        )
+        referenceFeatures = pipeline.fit_transform(profileList)
+
+        # features with quantized store
+        features = Features()
+        pipeline = features.createGloVeFeaturePipeline(
+            glovePath=Path(quantizedPath),
+            dataBaseMode=False
+        )
+        quantizedFeatures = pipeline.fit_transform(profileList)
+
+        # shipped models, as used by the web application
+        trainedModelPaths = TrainedModels()
+        filePathDict = trainedModelPaths.get_file_path_dict()
+
+        deviation = {}
+        for label in self.config['labelsGlobalList']:
+            onnx = mipingModels.OnnxModel(
+                modelName="ONNX Model",
+                labelName=label,
+            )
+            onnx.importModelONNX(filePathDict[label]['onnx'])
+
+            difference = np.abs(
+                onnx.predict(quantizedFeatures) -
+                onnx.predict(referenceFeatures)
+            )
+            deviation[label] = (difference.max(), difference.mean())
+            print(
+                label +
+                ": max deviation " +
+                str(deviation[label][0]) +
+                ", mean deviation " +
+                str(deviation[label][1])
+            )
+
+        return deviation
+
     def extractLabels(
         self,
         profileList,
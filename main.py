@@ -15,6 +15,9 @@ def main():
     # get configuration
     globalConfig, config_models, apiKeys = initialize()
 
+    # suffix of files written and read between the steps
+    fileSuffix = "." + globalConfig["process"]["stageFileFormat"]
+
     # initialize Twitter API with keys
     twitter = miping.interfaces.TwitterAPI(
         consumer_key=apiKeys['twitter']['ConsumerKey'],
@@ -44,6 +47,7 @@ def main():
             config=globalConfig,
             twitter=twitter,
             maps=maps,
+            fileSuffix=fileSuffix,
         )
         # get data from stream
         scrapedTweetsDict = scraping.doScrapingByLocation(
@@ -84,7 +88,8 @@ def main():
         preparation = helper.PreparationProcess(
             config=globalConfig,
             ibm=ibmApi,
-            twitter=twitter
+            twitter=twitter,
+            fileSuffix=fileSuffix,
         )
 
         # contains profile collections for each country
@@ -108,7 +113,8 @@ def main():
                 country=country,
                 readFiles=preparationConfig["condenseTweets"]["readFile"],
                 writeFiles=preparationConfig["condenseTweets"]["writeFile"],
-                hydrateUsers=preparationConfig["hydrateUserID"]
+                hydrateUsers=preparationConfig["hydrateUserID"],
+                cleanJobs=preparationConfig["clean_n_jobs"]
             )
 
             # for desginated countries fill profiles with ibm data
@@ -157,7 +163,8 @@ def main():
         # init helper class
         trainingSteps = helper.TrainingProcess(
             config=trainConf,
-            modelConfig=config_models
+            modelConfig=config_models,
+            fileSuffix=fileSuffix,
         )
         # build LIWC model based on English texts
         globalLIWCModels = trainingSteps.doLIWCModelTraining(
@@ -174,7 +181,8 @@ def main():
         # init helper class
         trainingSteps = helper.TrainingProcess(
             config=trainConf,
-            modelConfig=config_models
+            modelConfig=config_models,
+            fileSuffix=fileSuffix,
         )
         # set variables to None, if we read files,
         # because they are not needed
@@ -213,7 +221,8 @@ def main():
         # init helper class
         trainingSteps = helper.TrainingProcess(
             config=trainConf,
-            modelConfig=config_models
+            modelConfig=config_models,
+            fileSuffix=fileSuffix,
         )
         # build GloVe model based on German texts
         globalGloVeModels = trainingSteps.doGloVeModelTraining(
@@ -234,9 +243,62 @@ def main():
             readFeatureFile=trainConf["readFeatureFile"],
         )
 
+    # deviation of Big Five scores caused by quantized GloVe
+    validateQuantization(
+        globalConfig=globalConfig,
+        config_models=config_models,
+    )
+
     print("Finished")
 
 
+def validateQuantization(
+    globalConfig,
+    config_models,
+):
+    """
+    If enabled in the process configuration, compare the shipped
+    models' scores for quantized and float32 GloVe.
+
+    The shipped models were trained on the German profiles, so the
+    held-out profiles of "glove_validation_profiles" are used.
+
+    Parameters
+    ----------
+    globalConfig : dict, default=None, required
+        Global config, controlling the overall flow and parameters.
+    config_models : dict, default=None, required
+        Model configuration for grid search and tuning.
+    """
+    if globalConfig["process"]["validateQuantizedGloVe"] is not True:
+        return
+
+    trainConf = globalConfig["modelTraining"]
+    validationPath = Path(trainConf["glove_validation_profiles"])
+    if validationPath.exists() is False:
+        print(
+            "Held-out profiles " +
+            str(validationPath) +
+            " not found, quantized GloVe is not validated."
+        )
+        return
+
+    # profiles which are not part of the training set
+    profileCol = miping.models.ProfileCollection()
+    profileCol.read_profile_list_file(full_path=validationPath)
+    # init helper class
+    trainingSteps = helper.TrainingProcess(
+        config=trainConf,
+        modelConfig=config_models
+    )
+    trainingSteps.validateQuantizedGloVe(
+        profileCol=profileCol,
+        quantizedPath=trainConf["glove_quantized_path"],
+    )
+
+    return
+
+
 def initialize():
     """
     Initialize function reads configurations and environment variables
@@ -1,10 +1,13 @@
+import os
 import re
 import logging
+import threading
+import numpy as np
 
 from ..interfaces.twitter import TwitterAPI
 from ..training.features import Features
 from ..training.dataPreparation import DataPreparation
-from ..models import OnnxModel, Profile, ModelBase
+from ..models import OnnxModel, GloVeOnnxModel, Profile, ModelBase
 
 from tweepy import TweepError
 from .predictionErrors import UserNameError, NotASuitableUserError
@@ -21,6 +24,9 @@ class ModelApplication:
     all requests will be faster.
     """
 
+    # guards initialization of class variables
+    _initLock = threading.Lock()
+
     # will hold twitter api object for class
     twitter = None
     """Twitter API object"""
@@ -28,9 +34,9 @@ class ModelApplication:
     glove_pipeline = None
     """GloVe feature pipeline"""
 
-    # useful for coverage statistics
+    # calculates features and coverage statistics
     featuresObj = None
-    """Feature object instance for coverage statistics"""
+    """Feature object instance used for GloVe features"""
 
     # trained and imported models
     big5_openness = None
@@ -43,6 +49,10 @@ class ModelApplication:
     """Imported model for Agreeableness"""
     big5_neuroticism = None
     """Imported model for Neuroticism"""
+    big5_bundle = None
+    """Imported ONNX bundle predicting all dimensions at once"""
+    big5_end_to_end = None
+    """Imported end-to-end ONNX model from token ids to Big Five"""
     # big 5 list for loops
     big5List = [
         'big5_openness',
@@ -61,6 +71,9 @@ class ModelApplication:
         dataBaseMode,
         modelPathDict,
         use_onnx_models=True,
+        onnx_session_config=None,
+        onnx_bundle_path=None,
+        onnx_end_to_end_path=None,
     ):
         """
         Initialize necessary APIs and import models.
@@ -94,14 +107,72 @@ class ModelApplication:
         use_onnx_models : string, default=True
             If True, use ONNX models. If False, use pickle models.
             Pickle models might provide more feature, but are a security risk.
+        onnx_session_config : dict, default=None
+            Keyword arguments for OnnxModel to configure the
+            InferenceSession, e.g. {'intraOpNumThreads': 1}.
+        onnx_bundle_path : string, default=None
+            Path to ONNX bundle with one output per Big Five dimension
+            (see TrainedModels.get_bundle_file_path). If the file exists
+            and ONNX models are used, all dimensions are predicted with
+            one session run. Otherwise, single models are imported.
+        onnx_end_to_end_path : string, default=None
+            Path to end-to-end ONNX model containing GloVe
+            (see TrainedModels.build_end_to_end_onnx). If the file exists
+            and ONNX models are used, neither GloVe pipeline nor other
+            models are loaded.
         """
 
+        # class variables are initialized by the first request,
+        # concurrent requests wait until initialization is complete
+        with ModelApplication._initLock:
+            self._initialize(
+                twitter_consumer_key=twitter_consumer_key,
+                twitter_consumer_secret=twitter_consumer_secret,
+                glove_file_path=glove_file_path,
+                dataBaseMode=dataBaseMode,
+                modelPathDict=modelPathDict,
+                use_onnx_models=use_onnx_models,
+                onnx_session_config=onnx_session_config,
+                onnx_bundle_path=onnx_bundle_path,
+                onnx_end_to_end_path=onnx_end_to_end_path,
+            )
+
+        return
+
+    def _initialize(
+        self,
+        twitter_consumer_key,
+        twitter_consumer_secret,
+        glove_file_path,
+        dataBaseMode,
+        modelPathDict,
+        use_onnx_models,
+        onnx_session_config,
+        onnx_bundle_path,
+        onnx_end_to_end_path,
+    ):
+        """
+        Initialize APIs, GloVe pipeline and models,
+        see __init__ for parameters.
+        """
         # initialize twitter api
         self.get_twitter(
             twitter_consumer_key,
             twitter_consumer_secret
         )
 
+        if (
+            use_onnx_models is True and
+            onnx_end_to_end_path is not None and
+            os.path.exists(onnx_end_to_end_path)
+        ):
+            # GloVe is part of the end-to-end model
+            self.importEndToEndModel(
+                onnx_end_to_end_path=onnx_end_to_end_path,
+                onnx_session_config=onnx_session_config
+            )
+            return
+
         # initialize glove_pipeline
         self.get_glove_pipeline(
             file_path=glove_file_path,
@@ -111,7 +182,9 @@ class ModelApplication:
         # import models once
         self.importModels(
             modelPathDict=modelPathDict,
-            use_onnx_models=use_onnx_models
+            use_onnx_models=use_onnx_models,
+            onnx_session_config=onnx_session_config,
+            onnx_bundle_path=onnx_bundle_path
         )
 
         return
@@ -120,10 +193,17 @@ class ModelApplication:
         self,
         modelPathDict,
         use_onnx_models,
+        onnx_session_config=None,
+        onnx_bundle_path=None,
     ):
         """
         Import trained models once and save in class variables.
 
+        If an ONNX bundle exists, it is imported instead of the
+        single models. The single models are used as fallback, also if
+        they changed since the bundle was built
+        (see TrainedModels.build_onnx_bundle).
+
         Parameters
         ----------
         modelPathDict : string, default=None, required
@@ -140,7 +220,63 @@ class ModelApplication:
         use_onnx_models : string, default=True
             If True, use ONNX models. If False, use pickle models.
             Pickle models might provide more feature, but are a security risk.
+        onnx_session_config : dict, default=None
+            Keyword arguments for OnnxModel to configure the
+            InferenceSession. Sessions are created once during import.
+            The additional key 'optimizedModelDirectory' sets a directory
+            in which the optimized graph of each dimension is cached.
+        onnx_bundle_path : string, default=None
+            Path to ONNX bundle with one output per Big Five dimension.
         """
+        # copy, so passed config is not modified
+        sessionConfig = dict(onnx_session_config or {})
+        optimizedModelDirectory = sessionConfig.pop(
+            'optimizedModelDirectory',
+            None
+        )
+
+        useBundle = (
+            use_onnx_models is True and
+            onnx_bundle_path is not None and
+            os.path.exists(onnx_bundle_path)
+        )
+        if useBundle is True and ModelApplication.big5_bundle is None:
+            onnxPathDict = {
+                dimension: modelPathDict[dimension]['onnx']
+                for dimension in self.big5List
+            }
+            if not ModelBase.isONNXBundleCurrent(
+                onnx_bundle_path,
+                onnxPathDict
+            ):
+                print(
+                    "ONNX bundle " +
+                    str(onnx_bundle_path) +
+                    " does not match single models, " +
+                    "using single models instead."
+                )
+                useBundle = False
+
+        if useBundle is True:
+            # check if already loaded
+            if ModelApplication.big5_bundle is None:
+                if optimizedModelDirectory is not None:
+                    sessionConfig['optimizedModelFilePath'] = (
+                        os.path.join(
+                            optimizedModelDirectory,
+                            'big5_bundle.optimized.ONNX'
+                        )
+                    )
+                bundle = OnnxModel(
+                    modelName="ONNX Bundle",
+                    labelName="big5",
+                    **sessionConfig
+                )
+                bundle.importModelONNX(onnx_bundle_path)
+                ModelApplication.big5_bundle = bundle
+            # single models are not needed
+            return
+
         for dimension in self.big5List:
             # check if already loaded
             if getattr(ModelApplication, dimension) is None:
@@ -149,10 +285,19 @@ class ModelApplication:
                 if use_onnx_models is True:
                     # path for saved trained models
                     filepath = modelPathDict[dimension]['onnx']
+                    # one optimized graph file per dimension
+                    if optimizedModelDirectory is not None:
+                        sessionConfig['optimizedModelFilePath'] = (
+                            os.path.join(
+                                optimizedModelDirectory,
+                                (str(dimension) + '.optimized.ONNX')
+                            )
+                        )
                     # import onnx model
                     onnx = OnnxModel(
                         modelName="ONNX Model",
                         labelName=dimension,
+                        **sessionConfig
                     )
                     onnx.importModelONNX(filepath)
                     model = onnx
@@ -169,6 +314,46 @@ class ModelApplication:
 
         return
 
+    def importEndToEndModel(
+        self,
+        onnx_end_to_end_path,
+        onnx_session_config=None,
+    ):
+        """
+        Import end-to-end ONNX model once and save in class variable.
+
+        Parameters
+        ----------
+        onnx_end_to_end_path : string, default=None, required
+            Path to end-to-end ONNX model. Vocabulary is expected
+            under onnx_end_to_end_path + '.vocab'.
+        onnx_session_config : dict, default=None
+            Keyword arguments for OnnxModel to configure the
+            InferenceSession.
+        """
+        # check if already loaded
+        if ModelApplication.big5_end_to_end is None:
+            # copy, so passed config is not modified
+            sessionConfig = dict(onnx_session_config or {})
+            optimizedModelDirectory = sessionConfig.pop(
+                'optimizedModelDirectory',
+                None
+            )
+            if optimizedModelDirectory is not None:
+                sessionConfig['optimizedModelFilePath'] = os.path.join(
+                    optimizedModelDirectory,
+                    'big5_end_to_end.optimized.ONNX'
+                )
+            model = GloVeOnnxModel(
+                modelName="ONNX End-to-end Model",
+                labelName="big5",
+                **sessionConfig
+            )
+            model.importModelONNX(onnx_end_to_end_path)
+            ModelApplication.big5_end_to_end = model
+
+        return
+
     def get_twitter(
         self,
         twitter_consumer_key,
@@ -337,19 +522,20 @@ class ModelApplication:
         if len(textString) == 0:
             raise NotASuitableUserError("No text inside user's tweets")
         # call data cleansing for combined string
+        # tokens are kept in profile for GloVe features
         dataPre = DataPreparation()
-        textString = dataPre.clean_text(
+        tokenList = dataPre.tokenize_text(
             textString=textString
         )
-        if len(textString) == 0:
-            eString = "No text inside user's tweets after cleansing"
-            raise NotASuitableUserError(eString)
 
-        # save string in profile
+        # save cleaned string and tokens in profile
         profile = Profile(
             userID=userID,
-            text=textString
         )
+        profile.set_tokens(tokenList)
+        if len(profile.text) == 0:
+            eString = "No text inside user's tweets after cleansing"
+            raise NotASuitableUserError(eString)
 
         return profile
 
@@ -364,6 +550,8 @@ class ModelApplication:
         An exception is raised if no matching GloVe vectors could
         be found. Do prediction with previously saved models
         for each dimension and save to returnDict.
+        No state is changed, so this can be called from many
+        threads at once.
 
         Parameters
         ----------
@@ -378,12 +566,19 @@ class ModelApplication:
             count results.
         """
 
-        # feature pipeline
-        pipeline = ModelApplication.glove_pipeline
+        if ModelApplication.big5_end_to_end is not None:
+            # features are calculated inside the model
+            return self._get_personality_end_to_end(profileList)
 
         # calculate features
+        # statistics are returned, not read from the shared object,
+        # so concurrent requests cannot mix up their results
         try:
-            features = pipeline.fit_transform(profileList)
+            features, coverageStatistics, wordCounts = (
+                ModelApplication.featuresObj.featureGloVeWithStatistics(
+                    profileList
+                )
+            )
         except NoGloveValueError:
             # this means, that the user's tweets
             # are not compatible with the used GloVe values
@@ -398,18 +593,68 @@ class ModelApplication:
             'big5_extraversion': None,
             'big5_agreeableness': None,
             'big5_neuroticism': None,
-            'coverage': ModelApplication.featuresObj.coverageStatistics,
-            'wordCount': ModelApplication.featuresObj.wordCounts
+            'coverage': coverageStatistics,
+            'wordCount': wordCounts
+        }
+
+        if ModelApplication.big5_bundle is not None:
+            # all dimensions with one session run
+            bundleResult = ModelApplication.big5_bundle.predict_all(features)
+            for dimension in self.big5List:
+                returnDict[dimension] = bundleResult[dimension]
+        else:
+            # for every big5 dimension apply prediction
+            for dimension in self.big5List:
+                model = getattr(ModelApplication, dimension)
+                # apply prediction
+                big5result = model.predict(features)
+                # save result in returnDict
+                # contains predictions for all profiles
+                returnDict[dimension] = big5result
+
+        # instead of print, do log
+        logging.log(level=logging.INFO, msg="Finished prediction")
+
+        return returnDict
+
+    def _get_personality_end_to_end(
+        self,
+        profileList,
+    ):
+        """
+        Return Big Five predictions for all profiles in profileList
+        based on the end-to-end ONNX model.
+
+        Tokens are mapped to GloVe row ids, everything else happens
+        in one session run per profile. Return value has the same
+        structure as in get_personality.
+        """
+        model = ModelApplication.big5_end_to_end
+
+        returnDict = {
+            'coverage': [],
+            'wordCount': [],
         }
+        predictionList = []
 
-        # for every big5 dimension apply prediction
+        for profile in profileList:
+            # same tokens as in Features.featureGloVe
+            tokens = profile.get_tokens()
+            tokenIds = model.get_token_ids(tokens)
+
+            if len(tokenIds) == 0:
+                eString = "User's tweets have no matching words."
+                raise NotASuitableUserError(eString)
+
+            predictionList.append(model.predict_token_ids(tokenIds))
+            returnDict['coverage'].append(len(tokenIds) / len(tokens))
+            returnDict['wordCount'].append(len(tokens))
+
+        # one entry per profile for each dimension
         for dimension in self.big5List:
-            model = getattr(ModelApplication, dimension)
-            # apply prediction
-            big5result = model.predict(features)
-            # save result in returnDict
-            # contains predictions for all profiles
-            returnDict[dimension] = big5result
+            returnDict[dimension] = np.concatenate(
+                [prediction[dimension] for prediction in predictionList]
+            )
 
         # instead of print, do log
         logging.log(level=logging.INFO, msg="Finished prediction")
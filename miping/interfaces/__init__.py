@@ -2,5 +2,7 @@ from .glove import GloVe
 from .ibm import IbmAPI
 from .liwc import LiwcAPI
 from .twitter import TwitterAPI
+from .tweetSink import TweetSink
+from .rateLimiter import RateLimiter
 from .maps import MapsAPI
 from .helper import Helper
\ No newline at end of file
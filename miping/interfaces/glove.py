@@ -1,6 +1,10 @@
 import sqlite3
+import threading
+import hashlib
+import numpy
 import pandas
 from os import path
+from os import stat
 # this line logs an error, because the module contains a C libray
 # which is not inspected, but the code works as it is
 from sqlite3 import Error
@@ -9,9 +13,29 @@ from sqlite3 import Error
 class GloVe:
     """
     GloVe API class encloses communication related to GloVe data.
-    Either GloVe SQLite database or direct flat file.
+    Either GloVe SQLite database, direct flat file or memory-mapped
+    binary store (.npy file).
+    The SQLite database either has one column per dimension or
+    the compact schema with one little-endian BLOB per word
+    (see exportBlobDatabase). The schema is detected automatically.
     """
 
+    blobDtypes = {
+        'float32': '<f4',
+        'float16': '<f2',
+    }
+    """Allowed storage types for BLOB schema"""
+
+    memmapSuffix = '.npy'
+    """File ending which identifies the memory-mapped store"""
+
+    memmapDtypes = {
+        'float32': numpy.float32,
+        'float16': numpy.float16,
+        'int8': numpy.int8,
+    }
+    """Allowed storage types for memory-mapped store"""
+
     def __init__(
         self,
         filePath,
@@ -21,30 +45,51 @@ class GloVe:
         Initialization of GloVe to establish DB connection
         or load flat file into memory. DB connection is more
         memory efficient.
+        If filePath ends with .npy, the memory-mapped store (as written
+        by exportMemmapStore) is opened instead, regardless of
+        dataBaseMode. All processes opening the same store share its
+        pages via the operating system's page cache.
 
         Parameters
         ----------
         filePath : string, default=None, required
-            Full path to GloVe vector file (either database or
-            plain text file).
+            Full path to GloVe vector file (either database,
+            plain text file or .npy file).
         dataBaseMode : boolean, default=True
             If True, glove_file_path points to SQLite database file.
             If False, flat vector file.
         """
+        # memory-mapped store is identified by file ending
+        self.memmapMode = str(filePath).endswith(self.memmapSuffix)
+        # set after connecting, if database uses the BLOB schema
+        self.blobSchema = False
+        if self.memmapMode is True:
+            dataBaseMode = False
+
         # save in instance
         self.dataBaseMode = dataBaseMode
+        self.filePath = str(filePath)
+        # sqlite connections must not be shared between threads
+        self._threadLocal = threading.local()
 
         if path.exists(filePath) is False:
             # file does not exist
             eString = "Did not find GloVe file passed in GloVe class"
             raise Exception(eString)
 
-        if dataBaseMode is True:
+        if self.memmapMode is True:
+            print("Using GloVe memory-mapped store")
+            self._open_memmap_store(
+                filePath=str(filePath)
+            )
+        elif dataBaseMode is True:
             print("Using GloVe database")
             self.connection = self._create_connection(
                 # sql lite needs string as path
                 db_file=str(filePath)
             )
+            # one column per dimension or one BLOB per word
+            self._detect_schema()
         else:
             print("Using GloVe file")
             # load pre trained GloVe word embedding
@@ -56,6 +101,59 @@ class GloVe:
 
         return
 
+    @property
+    def connection(
+        self,
+    ):
+        """
+        Database connection of the current thread.
+
+        sqlite3 connections can only be used in the thread that created
+        them, so each thread gets its own connection on first access.
+        """
+        connection = getattr(self._threadLocal, 'connection', None)
+        if connection is None:
+            connection = self._create_connection(
+                db_file=self.filePath
+            )
+            self._threadLocal.connection = connection
+
+        return connection
+
+    @connection.setter
+    def connection(
+        self,
+        connection,
+    ):
+        """
+        Set database connection of the current thread.
+        """
+        self._threadLocal.connection = connection
+
+    def get_fingerprint(
+        self,
+    ):
+        """
+        Return fingerprint of the GloVe file, e.g. for feature caches.
+
+        Hashing a multi GB file on every start is too slow, so file name,
+        size and modification time are used. Any rewrite of the file
+        changes the fingerprint.
+
+        Returns
+        -------
+        fingerprint : string
+            Fingerprint of GloVe file.
+        """
+        fileStat = stat(self.filePath)
+        fingerprint = (
+            path.basename(self.filePath) +
+            ':' + str(fileStat.st_size) +
+            ':' + str(fileStat.st_mtime_ns)
+        )
+
+        return fingerprint
+
     def getGloVeByWordList(
         self,
         wordList
@@ -63,9 +161,11 @@ class GloVe:
         """
         For each word in wordList get the corresponding GloVe vector.
 
-        If none exists just ignore the word. Since SQLite database
-        is limited in query length, the query is split into 999er chunks.
+        If none exists just ignore the word. For the SQLite database
+        the distinct words are loaded into a temporary table and all
+        vectors are fetched with one joined query.
         If flat file is use, the approach is more simple.
+        In memory-mapped mode all rows are fetched with one fancy-index.
         The returned DataFrame includes duplicates, to represent the
         input list as close as possible (for personality prediciton this
         is usually the preferred approach, because it caputes word
@@ -84,40 +184,35 @@ class GloVe:
         """
 
         if self.dataBaseMode is True:
-            # since sqlite is limited in its query length
-            # 999 chunks
-            apiChunks = 999
-            chunks = [
-                wordList[
-                    x:x+apiChunks
-                ] for x in range(0, len(wordList), apiChunks)
-            ]
-            chunkCollectionDF = pandas.DataFrame()
-            # for each 999er chunk, we will perform an SQL request
-            for chunkList in chunks:
-                # compose sql with length of chunk of word list
-                # so that question marks ? can be added
-                sql = "SELECT * FROM glove WHERE words IN ({seq})".format(
-                        seq=','.join(['?']*len(chunkList))
-                    )
-                # query database and get data frame with unique values
-                unique_glove_df = pandas.read_sql_query(
-                    con=self.connection,
-                    sql=sql,
-                    params=chunkList,
-                    index_col='words'
-                )
-                # add to data frame
-                chunkCollectionDF = chunkCollectionDF.append(unique_glove_df)
-            # make returned rows unique
-            # due to chunks some duplicates are possible
-            completeUniqueDF = chunkCollectionDF.drop_duplicates()
-            # since returned values are unique we have to get the intersection
-            # including duplicates now
-            glove_val_df = (
-                completeUniqueDF.loc[
-                    completeUniqueDF.index.intersection(wordList)
-                ]
+            # each distinct word is fetched exactly once
+            distinctWords = list(dict.fromkeys(wordList))
+            foundWords, columnNames, vectors = self._fetch_vectors_db(
+                distinctWords
+            )
+            # expand duplicates with integer index into fetched rows
+            wordRows = {word: num for num, word in enumerate(foundWords)}
+            rows = numpy.fromiter(
+                (wordRows[word] for word in wordList if word in wordRows),
+                dtype=numpy.int64
+            )
+            glove_val_df = pandas.DataFrame(
+                vectors[rows],
+                index=pandas.Index(
+                    [foundWords[row] for row in rows],
+                    name='words'
+                ),
+                columns=columnNames
+            )
+        elif self.memmapMode is True:
+            # one lookup in hash index and one fancy-index in matrix
+            rows, found = self._lookup_rows(wordList)
+            glove_val_df = pandas.DataFrame(
+                self._dequantize_rows(rows),
+                index=pandas.Index(
+                    numpy.asarray(wordList, dtype=object)[found],
+                    name='words'
+                ),
+                columns=range(1, self.gloveMatrix.shape[1] + 1)
             )
         else:
             # get values from loaded glove
@@ -127,6 +222,125 @@ class GloVe:
 
         return glove_val_df
 
+    def getGloVeMatrixByWordList(
+        self,
+        wordList,
+    ):
+        """
+        Get GloVe vectors for distinct words of wordList as matrix.
+
+        In contrast to getGloVeByWordList each word is returned only
+        once and no DataFrame is built. Used to fetch the vocabulary
+        of many profiles at once. Unknown words are ignored.
+        If a word exists more than once in the flat file, the first
+        vector is used.
+
+        Parameters
+        ----------
+        wordList : list, default=None, required
+            List of words to get GloVe vector values for.
+
+        Returns
+        -------
+        foundWords : list
+            Distinct words with GloVe vector, in row order of vectors.
+        vectors : numpy.array
+            Float32 matrix with one row per found word.
+        """
+        distinctWords = list(dict.fromkeys(wordList))
+
+        if self.dataBaseMode is True:
+            foundWords, columnNames, vectors = self._fetch_vectors_db(
+                distinctWords
+            )
+        elif self.memmapMode is True:
+            rows, found = self._lookup_rows(distinctWords)
+            foundWords = [
+                word for word, isIn in zip(distinctWords, found) if isIn
+            ]
+            vectors = self._dequantize_rows(rows)
+        else:
+            glove_val_df = self.glove_df.loc[
+                self.glove_df.index.intersection(distinctWords)
+            ]
+            glove_val_df = glove_val_df[~glove_val_df.index.duplicated()]
+            foundWords = list(glove_val_df.index)
+            vectors = glove_val_df.to_numpy(dtype=numpy.float32)
+
+        return foundWords, vectors
+
+    def _fetch_vectors_db(
+        self,
+        distinctWords,
+    ):
+        """
+        Fetch vectors for distinct words with a single joined query.
+
+        Words are inserted into a temporary table, so the query is not
+        limited by the maximum number of SQL variables.
+        Vectors are written into a preallocated float32 array.
+
+        Parameters
+        ----------
+        distinctWords : list, default=None, required
+            Words to fetch, without duplicates.
+
+        Returns
+        -------
+        foundWords : list
+            Words that exist in GloVe, row order of vectors.
+        columnNames : list
+            Names of the vector columns in the glove table.
+        vectors : numpy.array
+            Float32 array with one row per found word.
+        """
+        connection = self.connection
+        connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lookup_words " +
+            "(word TEXT PRIMARY KEY);"
+        )
+        connection.execute("DELETE FROM temp.lookup_words;")
+        connection.executemany(
+            "INSERT INTO temp.lookup_words (word) VALUES (?);",
+            ((word,) for word in distinctWords)
+        )
+
+        if self.blobSchema is True:
+            cursor = connection.execute(
+                "SELECT glove.words, glove.vec FROM temp.lookup_words " +
+                "JOIN glove ON glove.words = lookup_words.word;"
+            )
+            foundWords, vectors = self._decode_blob_rows(cursor)
+            connection.execute("DELETE FROM temp.lookup_words;")
+            # same column names as in column schema
+            columnNames = [str(num) for num in range(1, self.blobDim + 1)]
+            return foundWords, columnNames, vectors
+
+        cursor = connection.execute(
+            "SELECT glove.* FROM temp.lookup_words " +
+            "JOIN glove ON glove.words = lookup_words.word;"
+        )
+        columns = [description[0] for description in cursor.description]
+        wordColumn = columns.index('words')
+        columnNames = [
+            name for num, name in enumerate(columns) if num != wordColumn
+        ]
+
+        # at most every distinct word is found
+        vectors = numpy.empty(
+            (len(distinctWords), len(columnNames)),
+            dtype=numpy.float32
+        )
+        foundWords = []
+        for num, row in enumerate(cursor):
+            row = tuple(row)
+            foundWords.append(row[wordColumn])
+            vectors[num] = row[:wordColumn] + row[wordColumn + 1:]
+
+        connection.execute("DELETE FROM temp.lookup_words;")
+
+        return foundWords, columnNames, vectors[:len(foundWords)]
+
     def get_index_list(
         self,
     ):
@@ -154,12 +368,446 @@ class GloVe:
             )
             # convert to list
             index_list = list(dataFrame.index)
+        elif self.memmapMode is True:
+            # words in row order
+            index_list = list(self._get_vocabulary())
         else:
             # get index from fully loaded glove
             index_list = list(self.glove_df.index)
 
         return index_list
 
+    def getGloVeMatrix(
+        self,
+    ):
+        """
+        Return all words and the complete GloVe matrix.
+
+        The row number of each word in the matrix equals its
+        position in the word list. Used to embed GloVe in
+        other formats (e.g. as ONNX initializer).
+
+        Returns
+        -------
+        wordList : list
+            All words existing in GloVe.
+        gloveMatrix : numpy.array
+            Float32 matrix with one row per word.
+        """
+
+        if self.memmapMode is True:
+            if self.gloveMatrix.dtype == numpy.float32:
+                # already in the right format
+                return list(self._get_vocabulary()), self.gloveMatrix
+            # quantized store is dequantized completely
+            return (
+                list(self._get_vocabulary()),
+                self._dequantize_rows(slice(None))
+            )
+
+        if self.blobSchema is True:
+            cursor = self.connection.execute(
+                "SELECT words, vec FROM glove;"
+            )
+            wordList, gloveMatrix = self._decode_blob_rows(cursor)
+            return wordList, gloveMatrix
+
+        if self.dataBaseMode is True:
+            # get all vectors from data base
+            sql = "SELECT * FROM glove;"
+            glove_df = pandas.read_sql_query(
+                con=self.connection,
+                sql=sql,
+                index_col='words'
+            )
+        else:
+            glove_df = self.glove_df
+
+        wordList = list(glove_df.index)
+        gloveMatrix = glove_df.to_numpy(dtype=numpy.float32)
+
+        return wordList, gloveMatrix
+
+    def exportBlobDatabase(
+        self,
+        filePath,
+        dtype='float32',
+    ):
+        """
+        Write loaded GloVe into a new SQLite database with BLOB schema.
+
+        The table is glove (words TEXT PRIMARY KEY, vec BLOB)
+        WITHOUT ROWID. Each vector is stored as little-endian bytes.
+        Storage type and dimension are saved in table glove_meta.
+        Used to migrate an existing glove.db (or flat file).
+
+        Parameters
+        ----------
+        filePath : string, default=None, required
+            Full path for the new database file. Must not exist.
+        dtype : string, default='float32'
+            Storage type, 'float32' or 'float16'.
+        """
+        if dtype not in self.blobDtypes:
+            raise ValueError("Unknown dtype for BLOB schema " + str(dtype))
+        if path.exists(filePath) is True:
+            raise Exception("Target GloVe database exists already")
+
+        print("Exporting GloVe database with BLOB schema to " + str(filePath))
+
+        wordList, gloveMatrix = self.getGloVeMatrix()
+        storeMatrix = numpy.ascontiguousarray(
+            gloveMatrix,
+            dtype=self.blobDtypes[dtype]
+        )
+
+        connection = sqlite3.connect(str(filePath))
+        # WITHOUT ROWID tables move rows larger than about 1/4 of a page
+        # to overflow pages, a 300 dim float32 vector needs 8 KiB pages
+        connection.execute("PRAGMA page_size = 8192;")
+        with connection:
+            connection.execute(
+                "CREATE TABLE glove " +
+                "(words TEXT PRIMARY KEY, vec BLOB) WITHOUT ROWID;"
+            )
+            connection.execute(
+                "CREATE TABLE glove_meta " +
+                "(key TEXT PRIMARY KEY, value TEXT);"
+            )
+            connection.executemany(
+                "INSERT INTO glove_meta (key, value) VALUES (?, ?);",
+                [('dtype', dtype), ('dim', str(storeMatrix.shape[1]))]
+            )
+            # OR IGNORE keeps first occurence of duplicate words
+            connection.executemany(
+                "INSERT OR IGNORE INTO glove (words, vec) VALUES (?, ?);",
+                (
+                    (str(word), storeMatrix[num].tobytes())
+                    for num, word in enumerate(wordList)
+                )
+            )
+        connection.execute("VACUUM;")
+        connection.close()
+
+        print(
+            "GloVe database exported with " +
+            str(len(wordList)) +
+            " as count of words."
+        )
+
+        return
+
+    def _detect_schema(
+        self,
+    ):
+        """
+        Check if the glove table uses the BLOB schema and, if so,
+        read storage type and dimension from glove_meta.
+        """
+        columns = [
+            row[1] for row in self.connection.execute(
+                "PRAGMA table_info(glove);"
+            )
+        ]
+        if 'vec' in columns:
+            self.blobSchema = True
+            meta = dict(
+                tuple(row) for row in self.connection.execute(
+                    "SELECT key, value FROM glove_meta;"
+                )
+            )
+            self.blobDtype = self.blobDtypes[meta['dtype']]
+            self.blobDim = int(meta['dim'])
+        else:
+            self.blobSchema = False
+
+        return
+
+    def _decode_blob_rows(
+        self,
+        cursor,
+    ):
+        """
+        Decode (words, vec) rows of BLOB schema into words and matrix.
+
+        All BLOBs are joined and decoded with one numpy.frombuffer call.
+        float16 is converted to float32.
+
+        Parameters
+        ----------
+        cursor : sqlite3.Cursor, default=None, required
+            Executed query returning words and vec.
+
+        Returns
+        -------
+        wordList : list
+            Words in row order.
+        vectors : numpy.array
+            Float32 matrix with one row per word.
+        """
+        wordList = []
+        blobList = []
+        for row in cursor:
+            wordList.append(row[0])
+            blobList.append(row[1])
+
+        vectors = numpy.frombuffer(
+            b''.join(blobList),
+            dtype=self.blobDtype
+        ).reshape(len(wordList), self.blobDim)
+        # frombuffer is read only, astype returns a writeable array
+        # without copying twice for float32
+        vectors = vectors.astype(numpy.float32)
+
+        return wordList, vectors
+
+    def exportMemmapStore(
+        self,
+        filePath,
+        dtype='float32',
+    ):
+        """
+        Convert the loaded GloVe (database or flat file) into the
+        memory-mapped store.
+
+        Three files are written:
+        filePath: matrix in numpy .npy format.
+        filePath + '.index.npy': sorted 64 bit word hashes and the
+        matrix row for each hash.
+        filePath + '.vocab': words in row order, one per line.
+        If a word exists more than once, the first row is used.
+
+        The matrix can be quantized to cut memory: float16 halves it,
+        int8 quarters it. For int8 each row is scaled by its maximum
+        absolute value and the float32 scales are written to
+        filePath + '.scale.npy'. Vectors are dequantized on lookup.
+
+        Parameters
+        ----------
+        filePath : string, default=None, required
+            Full path for the store, must end with .npy.
+        dtype : string, default='float32'
+            Storage type, 'float32', 'float16' or 'int8'.
+        """
+        filePath = str(filePath)
+        if filePath.endswith(self.memmapSuffix) is False:
+            raise ValueError(
+                "Path for memory-mapped GloVe store must end with " +
+                self.memmapSuffix
+            )
+        if dtype not in self.memmapDtypes:
+            raise ValueError("Unknown dtype for GloVe store " + str(dtype))
+
+        print("Exporting GloVe memory-mapped store to " + filePath)
+
+        wordList, gloveMatrix = self.getGloVeMatrix()
+        wordList = [str(word) for word in wordList]
+
+        # hash index, sorted for binary search
+        hashes = self._hash_words(wordList)
+        # unique keeps first occurence of duplicate words
+        sortedHashes, firstRows = numpy.unique(hashes, return_index=True)
+        hashIndex = numpy.vstack([
+            sortedHashes,
+            firstRows.astype(numpy.uint64)
+        ])
+
+        gloveMatrix = numpy.asarray(gloveMatrix, dtype=numpy.float32)
+        if dtype == 'int8':
+            # symmetric per row scale, rows of zeros keep scale 1
+            rowScale = numpy.abs(gloveMatrix).max(axis=1) / 127
+            rowScale[rowScale == 0] = 1
+            storeMatrix = numpy.rint(
+                gloveMatrix / rowScale[:, None]
+            ).astype(numpy.int8)
+            numpy.save(
+                filePath + '.scale.npy',
+                rowScale.astype(numpy.float32),
+                allow_pickle=False
+            )
+        else:
+            storeMatrix = numpy.ascontiguousarray(
+                gloveMatrix,
+                dtype=self.memmapDtypes[dtype]
+            )
+
+        numpy.save(
+            filePath,
+            storeMatrix,
+            allow_pickle=False
+        )
+        numpy.save(
+            filePath + '.index.npy',
+            hashIndex,
+            allow_pickle=False
+        )
+        with open(
+            filePath + '.vocab', "w", newline='\n', encoding='utf-8'
+        ) as outfile:
+            outfile.write('\n'.join(wordList))
+
+        print(
+            "GloVe store exported with " +
+            str(len(wordList)) +
+            " as count of words."
+        )
+
+        return
+
+    def _open_memmap_store(
+        self,
+        filePath,
+    ):
+        """
+        Open matrix and hash index of memory-mapped store.
+
+        Nothing is read except the file headers, pages are loaded
+        on access by the operating system.
+
+        Parameters
+        ----------
+        filePath : string, default=None, required
+            Full path to .npy file of the store.
+        """
+        self.memmapPath = filePath
+        self.gloveMatrix = numpy.load(
+            filePath,
+            mmap_mode='r',
+            allow_pickle=False
+        )
+        # row 0 hashes, row 1 matrix rows
+        self._hashIndex = numpy.load(
+            filePath + '.index.npy',
+            mmap_mode='r',
+            allow_pickle=False
+        )
+        # per row scales of int8 store
+        if self.gloveMatrix.dtype == numpy.int8:
+            self._rowScale = numpy.load(
+                filePath + '.scale.npy',
+                mmap_mode='r',
+                allow_pickle=False
+            )
+        else:
+            self._rowScale = None
+        # loaded only if needed
+        self._vocabulary = None
+
+        return
+
+    def _dequantize_rows(
+        self,
+        rows,
+    ):
+        """
+        Return rows of memory-mapped store as float32 array.
+
+        Only the selected rows are read and converted, so a quantized
+        store is never held in memory as float32.
+
+        Parameters
+        ----------
+        rows : numpy.array or slice, default=None, required
+            Row numbers (or slice) to select from the matrix.
+
+        Returns
+        -------
+        vectors : numpy.array
+            Float32 array with one row per selected row.
+        """
+        vectors = self.gloveMatrix[rows].astype(numpy.float32)
+        if self._rowScale is not None:
+            vectors *= self._rowScale[rows][:, None]
+
+        return vectors
+
+    def _get_vocabulary(
+        self,
+    ):
+        """
+        Return words of memory-mapped store in row order.
+        File is read on first call.
+        """
+        if self._vocabulary is None:
+            with open(
+                self.memmapPath + '.vocab', "r", newline='\n',
+                encoding='utf-8'
+            ) as infile:
+                self._vocabulary = infile.read().split('\n')
+
+        return self._vocabulary
+
+    @staticmethod
+    def _hash_words(
+        wordList,
+    ):
+        """
+        Return stable 64 bit hashes for words as numpy array.
+        Python's hash() differs per process, so blake2b is used.
+        """
+        hashes = numpy.fromiter(
+            (
+                int.from_bytes(
+                    hashlib.blake2b(
+                        word.encode('utf-8'),
+                        digest_size=8
+                    ).digest(),
+                    'little'
+                ) for word in wordList
+            ),
+            dtype=numpy.uint64,
+            count=len(wordList)
+        )
+
+        return hashes
+
+    def _lookup_rows(
+        self,
+        wordList,
+    ):
+        """
+        Look up matrix rows for words in memory-mapped store.
+
+        Parameters
+        ----------
+        wordList : list, default=None, required
+            Words to look up, duplicates allowed.
+
+        Returns
+        -------
+        rows : numpy.array
+            Matrix rows of found words, in order of wordList.
+        found : numpy.array
+            Boolean mask over wordList, True if word exists in GloVe.
+        """
+        sortedHashes = self._hashIndex[0]
+
+        # texts repeat words a lot, so each distinct word is hashed once
+        wordPositions = {}
+        inverse = numpy.fromiter(
+            (
+                wordPositions.setdefault(str(word), len(wordPositions))
+                for word in wordList
+            ),
+            dtype=numpy.int64,
+            count=len(wordList)
+        )
+        hashes = self._hash_words(list(wordPositions))
+
+        # binary search in sorted hashes
+        positions = numpy.searchsorted(sortedHashes, hashes)
+        # words behind the last hash are not found
+        positions[positions == len(sortedHashes)] = 0
+        distinctFound = sortedHashes[positions] == hashes
+
+        # expand distinct results to all words
+        found = distinctFound[inverse]
+        rows = self._hashIndex[1][positions[inverse[found]]].astype(
+            numpy.int64
+        )
+
+        return rows, found
+
     def _create_connection(
         self,
         db_file
@@ -225,3 +873,61 @@ class GloVe:
         )
 
         return glove_df
+
+
+if __name__ == "__main__":
+    # migrate glove.db to BLOB schema or memory-mapped store, e.g.:
+    # python -m miping.interfaces.glove -s data/glove/glove.db
+    # -t data/glove/glove_blob.db --float16
+    # python -m miping.interfaces.glove -s data/glove/glove.db
+    # -t data/glove/glove_int8.npy --int8
+    import sys
+    import getopt
+
+    argv = sys.argv[1:]
+    usage = (
+        'python -m miping.interfaces.glove -s <source glove.db> ' +
+        '-t <target .db or .npy> [--float16 | --int8]'
+    )
+    try:
+        opts, args = getopt.getopt(
+            argv,
+            "hs:t:",
+            ["source=", "target=", "float16", "int8"]
+        )
+    except getopt.GetoptError:
+        print(usage)
+        sys.exit(2)
+    source = None
+    target = None
+    dtype = 'float32'
+    for opt, arg in opts:
+        if opt == '-h':
+            print(usage)
+            sys.exit()
+        elif opt in ("-s", "--source"):
+            source = arg
+        elif opt in ("-t", "--target"):
+            target = arg
+        elif opt == "--float16":
+            dtype = 'float16'
+        elif opt == "--int8":
+            dtype = 'int8'
+    if source is None or target is None:
+        print(usage)
+        sys.exit(2)
+
+    glove = GloVe(
+        filePath=source,
+        dataBaseMode=source.endswith('.db')
+    )
+    if target.endswith(GloVe.memmapSuffix):
+        glove.exportMemmapStore(
+            filePath=target,
+            dtype=dtype
+        )
+    else:
+        glove.exportBlobDatabase(
+            filePath=target,
+            dtype=dtype
+        )
@@ -1,7 +1,5 @@
 import csv
 
-from decimal import Decimal
-
 from ..models.profile import Profile
 
 
@@ -54,7 +52,12 @@ class LiwcAPI:
             # and skip everything else
             columnHeader = next(reader)
 
-            for rowNum, row in enumerate(reader):
+            # map columns of the file to LIWC categories once
+            sourceColumns, targetColumns = self._map_liwc_columns(
+                columnHeader
+            )
+
+            for row in reader:
                 # due to next(), we do not need
                 # to explicitly skip the header
 
@@ -67,35 +70,61 @@ class LiwcAPI:
                     userID=userID
                 )
 
-                # we will read csv file column by column
-                # if one header matches the LIWC category
-                # list we will set this attribute
-                # otherwise we will not load this column
-                # read liwc categories column by column
-                for colIdx, columnName in enumerate(columnHeader):
-                    # via index we find the description of the column
-                    # and check if it exists in list
-                    if columnName in Profile.liwc_category_list:
-                        # column is a liwc category, so we assign
-                        # the value to the profile
-                        # this modifies the profile directly in
-                        # the collection
-
-                        # replace comma with dot, for american number format
-                        value = row[colIdx].replace(',', '.')
-                        # convert value to decimal
-                        setattr(profileInst, columnName, Decimal(value))
-                    elif columnName == 'you_total':
-                        # German LIWC category has different name for 'you'
-                        # replace comma with dot, for american number format
-                        value = row[colIdx].replace(',', '.')
-                        # convert value to decimal
-                        setattr(profileInst, 'you', Decimal(value))
-                    elif columnName == 'achiev':
-                        # in the German LIWC achiev is spelled wrong
-                        # replace comma with dot, for american number format
-                        value = row[colIdx].replace(',', '.')
-                        # convert value to decimal
-                        setattr(profileInst, 'achieve', Decimal(value))
+                # write mapped columns into the profile's LIWC row
+                # this modifies the profile directly in
+                # the collection
+                # replace comma with dot, for american number format
+                profileInst.get_liwc_values()[targetColumns] = [
+                    float(row[colIdx].replace(',', '.'))
+                    for colIdx in sourceColumns
+                ]
 
         return profileCol
+
+    def _map_liwc_columns(
+        self,
+        columnHeader,
+    ):
+        """
+        Return which columns of LIWC export file contain which
+        LIWC category.
+
+        If one header matches the LIWC category list the column
+        is loaded, otherwise it is skipped. German LIWC names
+        'you_total' and 'achiev' are mapped to 'you' and 'achieve'.
+
+        Parameters
+        ----------
+        columnHeader : list, default=None, required
+            Header row of LIWC export file.
+
+        Returns
+        -------
+        sourceColumns : list
+            Column indices in file.
+        targetColumns : list
+            Matching indices in Profile.liwc_category_list.
+        """
+        # German LIWC category has different name for 'you'
+        # and in the German LIWC achiev is spelled wrong
+        aliasDict = {
+            'you_total': 'you',
+            'achiev': 'achieve',
+        }
+        categoryIndex = {
+            attrName: num
+            for num, attrName in enumerate(Profile.liwc_category_list)
+        }
+
+        # category to column, for duplicate categories the last
+        # column wins
+        columnDict = {}
+        for colIdx, columnName in enumerate(columnHeader):
+            attrName = aliasDict.get(columnName, columnName)
+            if attrName in categoryIndex:
+                columnDict[categoryIndex[attrName]] = colIdx
+
+        targetColumns = list(columnDict)
+        sourceColumns = [columnDict[num] for num in targetColumns]
+
+        return sourceColumns, targetColumns
@@ -0,0 +1,247 @@
+import time
+import threading
+
+from datetime import datetime
+
+
+class RateLimiter:
+    """
+    Token buckets for rate limited Twitter API endpoints.
+
+    Each endpoint (e.g. '/followers/ids') has its own bucket with the
+    number of calls left in the current window and the time the window
+    resets. A call takes one token. Only if the bucket of its endpoint
+    is empty, the caller sleeps until the window resets, calls to other
+    endpoints are not delayed.
+    Buckets start with the documented limits and are corrected with
+    the rate limit headers of each response or with the result of
+    rate_limit_status. The limiter can be shared between threads.
+    """
+
+    windowSeconds = 900
+    """Length of Twitter's rate limit window in seconds."""
+
+    defaultLimits = {
+        '/followers/ids': 15,
+        '/statuses/user_timeline': 900,
+        '/statuses/lookup': 300,
+        '/users/lookup': 300,
+        '/users/show/:id': 900,
+    }
+    """Calls per window, lower limit of user and app authentication."""
+
+    def __init__(
+        self,
+        limits=None,
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        """
+        Create buckets for endpoints.
+
+        Parameters
+        ----------
+        limits : dict, default=None
+            Endpoint as key and calls per window as value. Overrides
+            defaultLimits, unknown endpoints have no limit.
+        clock : function, default=time.time
+            Returns current time in seconds since epoch.
+        sleep : function, default=time.sleep
+            Sleeps for given seconds.
+        """
+        self.limits = dict(self.defaultLimits)
+        if limits is not None:
+            self.limits.update(limits)
+
+        self.clock = clock
+        self.sleep = sleep
+
+        # endpoint to [limit, remaining, reset time]
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+        # counters for waiting
+        self.waitCounter = 0
+        self.waitSeconds = 0.0
+
+        return
+
+    def acquire(
+        self,
+        endpoint,
+    ):
+        """
+        Take one call from bucket of endpoint, sleep if it is empty.
+
+        Parameters
+        ----------
+        endpoint : string, default=None, required
+            Endpoint as named in rate_limit_status, e.g. '/users/lookup'.
+        """
+        while True:
+            waitTime = self.try_acquire(endpoint)
+            if waitTime == 0:
+                return
+
+            print(
+                "Rate limit reached for " +
+                endpoint +
+                ". Sleeping for: " +
+                str(round(waitTime))
+            )
+            current_time = datetime.now().strftime("%H:%M:%S")
+            print("Current Time =", current_time)
+            with self._lock:
+                self.waitCounter += 1
+                self.waitSeconds += waitTime
+            self.sleep(waitTime)
+
+    def try_acquire(
+        self,
+        endpoint,
+    ):
+        """
+        Take one call from bucket of endpoint without sleeping.
+
+        Returns
+        -------
+        waitTime : float
+            0 if call was taken, otherwise seconds until the
+            bucket is refilled.
+        """
+        if endpoint not in self.limits and endpoint not in self.buckets:
+            # endpoint is not limited
+            return 0
+
+        with self._lock:
+            now = self.clock()
+            bucket = self._get_bucket(endpoint, now)
+            if bucket[1] > 0:
+                bucket[1] -= 1
+                return 0
+
+            # one extra second, in case clocks differ slightly
+            return max(bucket[2] - now, 0) + 1
+
+    def get_remaining(
+        self,
+        endpoint,
+    ):
+        """
+        Return number of calls left for endpoint in current window.
+        """
+        with self._lock:
+            return self._get_bucket(endpoint, self.clock())[1]
+
+    def update_from_headers(
+        self,
+        endpoint,
+        headers,
+    ):
+        """
+        Correct bucket with rate limit headers of a response.
+
+        Parameters
+        ----------
+        endpoint : string, default=None, required
+            Endpoint the response belongs to.
+        headers : dict, default=None, required
+            Response headers, uses x-rate-limit-limit,
+            x-rate-limit-remaining and x-rate-limit-reset.
+        """
+        remaining = headers.get('x-rate-limit-remaining')
+        reset = headers.get('x-rate-limit-reset')
+        if remaining is None or reset is None:
+            return
+
+        limit = headers.get('x-rate-limit-limit')
+        self.update(
+            endpoint=endpoint,
+            limit=None if limit is None else int(limit),
+            remaining=int(remaining),
+            reset=int(reset)
+        )
+
+        return
+
+    def update_from_status(
+        self,
+        rateLimitStatus,
+    ):
+        """
+        Correct buckets with result of API's rate_limit_status.
+
+        Parameters
+        ----------
+        rateLimitStatus : dict, default=None, required
+            Result of tweepy.API.rate_limit_status().
+        """
+        for resourceDict in rateLimitStatus['resources'].values():
+            for endpoint, status in resourceDict.items():
+                self.update(
+                    endpoint=endpoint,
+                    limit=status['limit'],
+                    remaining=status['remaining'],
+                    reset=status['reset']
+                )
+
+        return
+
+    def update(
+        self,
+        endpoint,
+        limit,
+        remaining,
+        reset,
+    ):
+        """
+        Correct bucket of endpoint with values reported by Twitter.
+
+        Within the same window the bucket keeps the lower number of
+        remaining calls, as calls which are still running might not
+        be counted by Twitter yet.
+
+        Parameters
+        ----------
+        endpoint : string, default=None, required
+            Endpoint to correct.
+        limit : integer, default=None, required
+            Calls per window, None keeps the known limit.
+        remaining : integer, default=None, required
+            Calls left in current window.
+        reset : integer, default=None, required
+            Time the window resets in seconds since epoch.
+        """
+        with self._lock:
+            if limit is not None:
+                self.limits[endpoint] = limit
+            bucket = self._get_bucket(endpoint, self.clock())
+            if limit is not None:
+                bucket[0] = limit
+            if reset == bucket[2]:
+                bucket[1] = min(bucket[1], remaining)
+            else:
+                bucket[1] = remaining
+                bucket[2] = reset
+
+        return
+
+    def _get_bucket(
+        self,
+        endpoint,
+        now,
+    ):
+        """
+        Return bucket of endpoint, refilled if its window is over.
+        Lock has to be held by caller.
+        """
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            limit = self.limits[endpoint]
+            bucket = [limit, limit, now + self.windowSeconds]
+            self.buckets[endpoint] = bucket
+        elif now >= bucket[2]:
+            bucket[1] = bucket[0]
+            bucket[2] = now + self.windowSeconds
+
+        return bucket
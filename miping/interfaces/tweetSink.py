@@ -0,0 +1,348 @@
+import os
+import re
+import time
+import queue
+import threading
+
+from ..models import TweetCollection
+from ..models import ColumnarFile
+
+
+class TweetSink:
+    """
+    Write streamed tweets batch-wise to rotating files on disk.
+
+    Tweets are collected in batches. Full batches are passed via a
+    bounded queue to a background thread, which writes them to part
+    files in the sink directory (part00001.csv, part00002.csv, ...).
+    A new part file is started after rotateTweets tweets.
+    CSV parts are appended batch by batch, Parquet parts get one row
+    group per batch and are complete once the next part is started.
+    If the writer cannot keep up and the queue is full, the batch is
+    dropped instead of blocking the stream. Only when the sink is
+    closed, the last batch waits for the writer.
+    """
+
+    def __init__(
+        self,
+        directory,
+        additionalAttributes=None,
+        fileSuffix='.csv',
+        batchSize=1000,
+        queueSize=100,
+        rotateTweets=100000,
+    ):
+        """
+        Create sink directory and start writer thread.
+
+        Parameters
+        ----------
+        directory : string, default=None, required
+            Directory for part files, created if it does not exist.
+            Existing part files are kept, numbering continues after them.
+        additionalAttributes : list, default=None
+            Additional tweet attributes, as for TweetCollection.
+        fileSuffix : string, default='.csv'
+            Suffix of part files, '.parquet' for Parquet files.
+        batchSize : integer, default=1000
+            Number of tweets passed to the writer at once.
+        queueSize : integer, default=100
+            Maximum number of batches waiting for the writer.
+        rotateTweets : integer, default=100000
+            Number of tweets per part file.
+        """
+        self.directory = str(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.additionalAttributes = additionalAttributes
+        self.fileSuffix = fileSuffix
+        self.batchSize = batchSize
+        self.rotateTweets = rotateTweets
+
+        # part files written by this sink
+        self.partPathList = []
+        self._partNumber = self._get_last_part_number()
+        self._partPath = None
+        self._partTweets = 0
+        # parquet writer of current part and its written tweets,
+        # they count as written once the part is complete
+        self._partWriter = None
+        self._partWritten = 0
+
+        # counters, dropped is only changed by stream thread
+        # written and failed only by writer thread
+        self.acceptedCounter = 0
+        self.droppedCounter = 0
+        self.writtenCounter = 0
+        self.failedCounter = 0
+        self.startTime = time.time()
+
+        self._batch = self._new_collection()
+        self._queue = queue.Queue(maxsize=queueSize)
+        self._writerThread = threading.Thread(
+            target=self._write_batches,
+            name='TweetSinkWriter',
+            daemon=True
+        )
+        self._writerThread.start()
+
+        return
+
+    def put(
+        self,
+        tweetObj,
+    ):
+        """
+        Add tweet to current batch, batch is queued if it is full.
+
+        Parameters
+        ----------
+        tweetObj : TweetObj, default=None, required
+            Tweet to write.
+        """
+        self.acceptedCounter += 1
+        self._batch.funcAddTweet(tweetObj)
+        if len(self._batch.tweetList) >= self.batchSize:
+            self.flush()
+
+        return
+
+    def flush(
+        self,
+        block=False,
+    ):
+        """
+        Queue current batch for the writer, even if it is not full.
+
+        Parameters
+        ----------
+        block : boolean, default=False
+            If True, wait for a free slot in the queue instead of
+            dropping the batch if the queue is full.
+        """
+        if len(self._batch.tweetList) == 0:
+            return
+
+        try:
+            self._queue.put(self._batch, block=block)
+        except queue.Full:
+            # writer cannot keep up, do not block the stream
+            self.droppedCounter += len(self._batch.tweetList)
+        self._batch = self._new_collection()
+
+        return
+
+    def close(
+        self,
+    ):
+        """
+        Write remaining tweets, stop writer thread and print counters.
+
+        Returns
+        -------
+        statistics : dict
+            Counters as returned by get_statistics.
+        """
+        # stream is over, so waiting for the writer does not hurt
+        self.flush(block=True)
+        # remaining batches are written before stop
+        self._queue.put(None)
+        self._writerThread.join()
+
+        statistics = self.get_statistics()
+        print(
+            "Sink wrote " +
+            str(statistics['written']) +
+            " of " +
+            str(statistics['accepted']) +
+            " tweet(s) to " +
+            str(len(self.partPathList)) +
+            " file(s) in " +
+            self.directory +
+            " (" +
+            str(round(statistics['tweetsPerSecond'], 2)) +
+            " tweets/s), dropped " +
+            str(statistics['dropped']) +
+            " tweet(s) because of full queue and " +
+            str(statistics['failed']) +
+            " because of write errors."
+        )
+
+        return statistics
+
+    def get_statistics(
+        self,
+    ):
+        """
+        Return sink counters.
+
+        Returns
+        -------
+        statistics : dict
+            accepted, written, dropped and failed tweets, running
+            time in seconds and written tweets per second.
+        """
+        seconds = time.time() - self.startTime
+        statistics = {
+            'accepted': self.acceptedCounter,
+            'written': self.writtenCounter,
+            'dropped': self.droppedCounter,
+            'failed': self.failedCounter,
+            'seconds': seconds,
+            'tweetsPerSecond': (
+                self.writtenCounter / seconds if seconds > 0 else 0.0
+            ),
+        }
+
+        return statistics
+
+    def read_tweets(
+        self,
+    ):
+        """
+        Read all tweets written by this sink, call after close.
+
+        Returns
+        -------
+        tweetCol : TweetCollection
+            Tweets of all part files of this sink.
+        """
+        tweetCol = self._new_collection()
+        for batchCol in self.iter_tweets():
+            tweetCol.add_tweet_collection(batchCol)
+
+        return tweetCol
+
+    def iter_tweets(
+        self,
+        batchSize=10000,
+    ):
+        """
+        Read tweets written by this sink in batches, call after close.
+
+        Only one batch is kept in memory at a time.
+
+        Parameters
+        ----------
+        batchSize : integer, default=10000
+            Maximum number of tweets per batch.
+
+        Yields
+        ------
+        batchCol : TweetCollection
+            Collection with the next tweets of the part files.
+        """
+        tweetCol = self._new_collection()
+        for partPath in self.partPathList:
+            for batchCol in tweetCol.iter_tweet_list_file(
+                full_path=partPath,
+                batchSize=batchSize
+            ):
+                yield batchCol
+
+        return
+
+    def _get_last_part_number(
+        self,
+    ):
+        """
+        Return highest number of part files in sink directory, 0 if
+        there are none, so existing parts are not overwritten.
+        """
+        partNumber = 0
+        for fileName in os.listdir(self.directory):
+            match = re.match(r'part(\d+)', fileName)
+            if match is not None:
+                partNumber = max(partNumber, int(match.group(1)))
+
+        return partNumber
+
+    def _new_collection(
+        self,
+    ):
+        """
+        Return empty TweetCollection with sink attributes.
+        """
+        return TweetCollection(self.additionalAttributes)
+
+    def _write_batches(
+        self,
+    ):
+        """
+        Writer thread, writes queued batches until None is queued.
+        """
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                print("Error while writing tweets to sink:")
+                print(e)
+                self.failedCounter += len(batch.tweetList)
+
+        try:
+            self._finish_part()
+        except Exception as e:
+            print("Error while writing tweets to sink:")
+            print(e)
+
+        return
+
+    def _write_batch(
+        self,
+        batch,
+    ):
+        """
+        Write batch to current part file, start new part if necessary.
+        """
+        if self._partPath is None or self._partTweets >= self.rotateTweets:
+            self._finish_part()
+            self._partNumber += 1
+            self._partPath = os.path.join(
+                self.directory,
+                'part' + str(self._partNumber).zfill(5) + self.fileSuffix
+            )
+            self._partTweets = 0
+
+        self._partTweets += len(batch.tweetList)
+        if self._partPath not in self.partPathList:
+            self.partPathList.append(self._partPath)
+        if ColumnarFile.is_columnar_path(self._partPath):
+            self._partWriter = batch.append_tweet_list_parquet(
+                writer=self._partWriter,
+                full_path=self._partPath
+            )
+            self._partWritten += len(batch.tweetList)
+        else:
+            batch.write_tweet_list_file(
+                full_path=self._partPath,
+                append=True
+            )
+            self.writtenCounter += len(batch.tweetList)
+
+        return
+
+    def _finish_part(
+        self,
+    ):
+        """
+        Close Parquet writer of current part, CSV parts are complete.
+        """
+        if self._partWriter is None:
+            return
+
+        partWriter = self._partWriter
+        partWritten = self._partWritten
+        self._partWriter = None
+        self._partWritten = 0
+        try:
+            partWriter.close()
+        except Exception:
+            # file is incomplete without its footer
+            self.failedCounter += partWritten
+            raise
+        self.writtenCounter += partWritten
+
+        return
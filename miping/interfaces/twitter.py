@@ -1,12 +1,14 @@
 import tweepy
 import time
 
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from ..models import TweetObj
 from ..models import TweetCollection
 from ..models import User
 from ..models import UserCollection
+from .rateLimiter import RateLimiter
 
 
 class TwitterAPI:
@@ -24,7 +26,8 @@ class TwitterAPI:
         wait_on_rate_limit_notify=True,
         additionalAttributes=None,
         removeNewLineChar=True,
-        ignoreRetweets=True
+        ignoreRetweets=True,
+        rateLimiter=None,
     ):
         """
         Initialization function to establish Authentication.
@@ -58,6 +61,10 @@ class TwitterAPI:
             This is useful for CSV exports
         ignoreRetweets : boolean, default=True
             For all tweet queries exclude retweets.
+        rateLimiter : miping.interfaces.RateLimiter, default=None
+            Schedules API calls within the rate limits of each endpoint.
+            If None, a new one is created. Tweepy's wait_on_rate_limit
+            only applies if a limit is hit anyway.
 
         Returns
         -------
@@ -95,6 +102,71 @@ class TwitterAPI:
         self.removeNewLineChar = removeNewLineChar
         self.ignoreRetweets = ignoreRetweets
 
+        if rateLimiter is None:
+            rateLimiter = RateLimiter()
+        self.rateLimiter = rateLimiter
+
+    def sync_rate_limits(
+        self,
+    ):
+        """
+        Load current rate limits of all endpoints into rateLimiter.
+
+        Useful if the API keys were used shortly before, otherwise
+        limits are corrected with each response.
+        """
+        self.rateLimiter.update_from_status(self.api.rate_limit_status())
+
+        return
+
+    def _limited(
+        self,
+        endpoint,
+        method,
+    ):
+        """
+        Wrap tweepy API method to wait for rate limit budget.
+
+        Before each call, one call is taken from the endpoint's bucket.
+        Afterwards the bucket is corrected with the response headers.
+        The returned function can be used with tweepy.Cursor.
+
+        Parameters
+        ----------
+        endpoint : string, default=None, required
+            Endpoint as named in rate_limit_status, e.g. '/users/lookup'.
+        method : function, default=None, required
+            Tweepy API method calling this endpoint.
+
+        Returns
+        -------
+        limitedMethod : function
+            Method with same arguments and result.
+        """
+        # path of endpoint in request url, e.g. /users/show.json
+        urlPath = endpoint.split('/:')[0] + '.json'
+
+        def limitedMethod(*args, **kwargs):
+            if kwargs.get('create') is True:
+                # tweepy.Cursor only creates method object, no request
+                return method(*args, **kwargs)
+            self.rateLimiter.acquire(endpoint)
+            result = method(*args, **kwargs)
+            response = getattr(self.api, 'last_response', None)
+            # with several threads, response can belong to other call
+            if response is not None and urlPath in response.url:
+                self.rateLimiter.update_from_headers(
+                    endpoint,
+                    response.headers
+                )
+            return result
+
+        # needed by tweepy.Cursor to choose pagination
+        if hasattr(method, 'pagination_mode'):
+            limitedMethod.pagination_mode = method.pagination_mode
+
+        return limitedMethod
+
     def funcGetUserID(
         self,
         screen_name,
@@ -112,7 +184,9 @@ class TwitterAPI:
         user.id_str : string
             User id fitting the screen_name.
         """
-        user = self.api.get_user(screen_name=screen_name)
+        user = self._limited('/users/show/:id', self.api.get_user)(
+            screen_name=screen_name
+        )
 
         return user.id_str
 
@@ -168,7 +242,7 @@ class TwitterAPI:
         # for each 100er chunk, we will perform an API request
         for chunkList in chunks:
             # get all users in given id list
-            result = self.api.lookup_users(
+            result = self._limited('/users/lookup', self.api.lookup_users)(
                 user_ids=chunkList,
             )
 
@@ -239,7 +313,9 @@ class TwitterAPI:
 
         # check if user exists
         try:
-            self.api.get_user(user_id=userID)
+            self._limited('/users/show/:id', self.api.get_user)(
+                user_id=userID
+            )
         except tweepy.error.TweepError as e:
             if reRaiseExceptions is True:
                 raise(e)
@@ -252,7 +328,10 @@ class TwitterAPI:
             try:
                 # loop over all tweets in user timeline
                 for tweet in tweepy.Cursor(
-                    self.api.user_timeline,
+                    self._limited(
+                        '/statuses/user_timeline',
+                        self.api.user_timeline
+                    ),
                     user_id=userID,
                     tweet_mode='extended',
                     include_rts=(not self.ignoreRetweets),
@@ -283,6 +362,83 @@ class TwitterAPI:
 
         return tweetCol
 
+    def iter_tweet_lists_by_users(
+        self,
+        userIDList,
+        limit=0,
+        reRaiseExceptions=False,
+        maxWorkers=8,
+    ):
+        """
+        Get tweets for many user ids concurrently and yield them in order.
+
+        Timelines of up to maxWorkers users are fetched at the same time
+        via funcGetTweetListByUser, so waiting for responses overlaps.
+        The rateLimiter keeps all threads within the API limits.
+        Results are yielded in order of userIDList and only a few
+        users ahead are fetched, so the caller can stop early.
+        Fetches not started yet are cancelled then.
+
+        Parameters
+        ----------
+        userIDList : list, default=None, required
+            User ids to get tweets for.
+        limit : integer, default=0
+            Limit tweets to retrieve per user. Limit = 0 means no limit.
+        reRaiseExceptions : boolean, default=False
+            If exceptions are encountered, reRaise them. They are raised
+            when the failed user is reached, in order of userIDList.
+        maxWorkers : integer, default=8
+            Number of users fetched at the same time. 1 fetches
+            sequentially without threads.
+
+        Yields
+        ------
+        tweetCol : TweetCollection
+            TweetCollection for each user id, as returned by
+            funcGetTweetListByUser.
+        """
+        if maxWorkers <= 1:
+            for userID in userIDList:
+                yield self.funcGetTweetListByUser(
+                    userID,
+                    limit=limit,
+                    reRaiseExceptions=reRaiseExceptions
+                )
+            return
+
+        executor = ThreadPoolExecutor(max_workers=maxWorkers)
+        userIter = iter(userIDList)
+        futures = deque()
+
+        def submitNext():
+            for userID in userIter:
+                futures.append(executor.submit(
+                    self.funcGetTweetListByUser,
+                    userID,
+                    limit=limit,
+                    reRaiseExceptions=reRaiseExceptions
+                ))
+                return
+
+        try:
+            # queue more users than threads, so no thread is idle
+            for num in range(2 * maxWorkers):
+                submitNext()
+            while len(futures) > 0:
+                # raises exception of this user, if any
+                tweetCol = futures.popleft().result()
+                submitNext()
+                yield tweetCol
+        finally:
+            # caller stopped early or exception was raised
+            for future in futures:
+                future.cancel()
+            # running fetches finish in background
+            executor.shutdown(wait=False)
+
+        return
+
     def get_tweets_by_list(
         self,
         idList,
@@ -324,7 +480,10 @@ class TwitterAPI:
             # get all tweets in given id list
             # omit those we cannot retrieve (via map_)
             # (e.g. deleted or private)
-            result = self.api.statuses_lookup(
+            result = self._limited(
+                '/statuses/lookup',
+                self.api.statuses_lookup
+            )(
                 id_=chunkList,
                 trim_user=True,
                 map_=False,
@@ -378,45 +537,23 @@ class TwitterAPI:
         """
 
         followerIDs = []
-        sleepTime = 900
 
-        # twitter's API limits us to 15 calls
-        # so we split our given list in 15er chunks
-        # after that we need to wait 15 minutes
-        # this prevents timeouts of the connection
-        apiPart = 15
-        chunks = [
-            userIDList[x:x+apiPart] for x in range(0, len(userIDList), apiPart)
-        ]
-        chunkLen = len(chunks)
+        # twitter's API limits us to 15 calls per 15 minutes
+        # the rate limiter only sleeps if no calls are left
+        getFollowerIDs = self._limited(
+            '/followers/ids',
+            self.api.followers_ids
+        )
 
         # for all IDs in list, get followers
-        # for each 15er chunk, we will perform an API request
-        # and sleep afterwards
-        for num, chunkList in enumerate(chunks):
-            for userID in chunkList:
-                # get follower ids of specified user
-                for user in tweepy.Cursor(
-                    self.api.followers_ids,
-                    user_id=userID,
-                ).items(limit):
-                    # add ID to list
-                    followerIDs.append(str(user))
-            if ((num + 1) < chunkLen):
-                # num is 0 based index
-                # if we have another chunk waiting, we need to sleep
-                # to comply with API limit
-                print(
-                    "Rate limit reached for Followers. Sleeping for: " +
-                    str(sleepTime)
-                )
-                # print current time
-                now = datetime.now()
-                current_time = now.strftime("%H:%M:%S")
-                print("Current Time =", current_time)
-                # sleep for 15 minutes
-                # necessary to avoid timeouts in tweepy
-                time.sleep(sleepTime)
+        for userID in userIDList:
+            # get follower ids of specified user
+            for user in tweepy.Cursor(
+                getFollowerIDs,
+                user_id=userID,
+            ).items(limit):
+                # add ID to list
+                followerIDs.append(str(user))
 
         return followerIDs
 
@@ -427,6 +564,7 @@ class TwitterAPI:
         maxFollowerCount=0,
         minStatusesCount=0,
         minFollowerCount=0,
+        tweetSink=None,
     ):
         """
         Get live tweet via streaming API matching location and other criteria.
@@ -454,47 +592,135 @@ class TwitterAPI:
         minFollowerCount : integer, default=0
             Selection criteria - if user has less than minimum number
             of followers, he/she is excluded. If 0, not applied.
+        tweetSink : miping.interfaces.TweetSink, default=None
+            If given, tweets are written batch-wise to disk during
+            streaming instead of being kept in memory. The sink is
+            closed when the stream ends, even after an error.
 
         Returns
         -------
         myStreamListener.tweetCollect : TweetCollection
             All tweets that were streamed during the time limit and matched
-            the given criteria.
+            the given criteria. With tweetSink, the closed sink is returned
+            instead, its tweets can be read batch-wise via iter_tweets.
         """
-        # holds tweets with attributes as TweetObj
-        # passed in streamListener to save tweets
-        tweetCol = TweetCollection(self.additionalAttributes)
+        tweetSinkDict = None
+        if tweetSink is not None:
+            tweetSinkDict = {'location': tweetSink}
+
+        tweetColDict = self.stream_tweets_by_locations(
+            locationDict={'location': location},
+            timeLimit=timeLimit,
+            maxFollowerCount=maxFollowerCount,
+            minStatusesCount=minStatusesCount,
+            minFollowerCount=minFollowerCount,
+            tweetSinkDict=tweetSinkDict,
+        )
+        if tweetColDict is None:
+            return
+
+        return tweetColDict['location']
+
+    def stream_tweets_by_locations(
+        self,
+        locationDict,
+        timeLimit=5,
+        maxFollowerCount=0,
+        minStatusesCount=0,
+        minFollowerCount=0,
+        tweetSinkDict=None,
+    ):
+        """
+        Get live tweets for several locations with one stream.
+
+        The stream is filtered by all locations at once and each tweet
+        is assigned to the locations it belongs to, the same way the
+        streaming API matches locations: if the tweet has exact
+        coordinates, they have to be inside the location. Otherwise
+        the bounding box of the tweet's place has to intersect it.
+        A tweet can belong to several overlapping locations.
 
+        Parameters
+        ----------
+        locationDict : dict, default=None, required
+            Name of location (e.g. country) as key and list of GPS
+            coordinates as value, structure as location in
+            stream_tweets_by_location.
+        timeLimit : integer, default=5
+            Time in seconds the stream will be running.
+        maxFollowerCount : integer, default=0
+            Selection criteria - if user has more than given number
+            of maximum follower, he/she is excluded. If 0, not applied.
+        minStatusesCount : integer, default=0
+            Selection criteria - if user has less than minimum number
+            of status counts, he/she is excluded. If 0, not applied.
+        minFollowerCount : integer, default=0
+            Selection criteria - if user has less than minimum number
+            of followers, he/she is excluded. If 0, not applied.
+        tweetSinkDict : dict, default=None
+            Name of location as key and miping.interfaces.TweetSink as
+            value. If given, tweets are written batch-wise to disk
+            during streaming instead of being kept in memory. Sinks
+            are closed when the stream ends, even after an error.
+
+        Returns
+        -------
+        tweetColDict : dict
+            Name of location as key and TweetCollection with all tweets
+            that were streamed during the time limit and matched the
+            given criteria as value. With tweetSinkDict, the closed
+            sinks are returned instead, so the tweets are not loaded
+            into memory at once (see TweetSink.iter_tweets).
+        """
         if self.streaming_enabled is False:
             print(
                 "Streaming tweets is disabled. " +
-                "Function stream_tweets_by_location."
+                "Function stream_tweets_by_locations."
             )
             return
 
+        # holds tweets with attributes as TweetObj for each location
+        # passed in streamListener to save tweets
+        tweetColDict = {}
+        streamLocations = []
+        for name, location in locationDict.items():
+            tweetColDict[name] = TweetCollection(self.additionalAttributes)
+            streamLocations.extend(location)
+
         print("Time limit is set to: " + str(timeLimit))
 
         # build stream objects
         myStreamListener = _MyStreamListener(
-            tweetCollect=tweetCol,
+            tweetCollectDict=tweetColDict,
             additionalAttributes=self.additionalAttributes,
+            locationDict=locationDict,
             time_limit=timeLimit,
             removeNewLineChar=self.removeNewLineChar,
             ignoreRetweets=self.ignoreRetweets,
             maxFollowerCount=maxFollowerCount,
             minStatusesCount=minStatusesCount,
             minFollowerCount=minFollowerCount,
+            tweetSinkDict=tweetSinkDict,
         )
         myStream = tweepy.Stream(
             auth=self.api.auth,
             listener=myStreamListener
         )
 
-        # get tweets based on coordinates
-        myStream.filter(locations=location)
+        # get tweets based on coordinates of all locations
+        try:
+            myStream.filter(locations=streamLocations)
+        finally:
+            if tweetSinkDict is not None:
+                # write remaining tweets and report counters
+                for tweetSink in tweetSinkDict.values():
+                    tweetSink.close()
+
+        if tweetSinkDict is not None:
+            return tweetSinkDict
 
         # after timeout we can return collected tweets
-        return myStreamListener.tweetCollect
+        return tweetColDict
 
 
 class _MyStreamListener(
@@ -505,14 +731,16 @@ class _MyStreamListener(
     """
     def __init__(
         self,
-        tweetCollect,
+        tweetCollectDict,
         additionalAttributes,
+        locationDict,
         time_limit=10,
         removeNewLineChar=True,
         ignoreRetweets=True,
         maxFollowerCount=0,
         minStatusesCount=0,
         minFollowerCount=0,
+        tweetSinkDict=None,
     ):
         """
         Init function for streamer class
@@ -521,9 +749,14 @@ class _MyStreamListener(
         self.start_time = time.time()
         self.limit = time_limit
 
-        self.tweetCollect = tweetCollect
+        self.tweetCollectDict = tweetCollectDict
+        # if given, tweets are passed to sinks instead of collections
+        self.tweetSinkDict = tweetSinkDict
         self.additionalAttributes = additionalAttributes
 
+        # name and bounding box (sw lng, sw lat, ne lng, ne lat)
+        self.locationDict = locationDict
+
         self.removeNewLineChar = removeNewLineChar
         self.ignoreRetweets = ignoreRetweets
 
@@ -534,16 +767,76 @@ class _MyStreamListener(
         # keep track of how many tweets we skip
         self.skipFollowerCounter = 0
         self.skipStatusesCounter = 0
+        self.skipLocationCounter = 0
+
+        # keep track of how many tweets each location gets
+        self.locationCounter = dict.fromkeys(locationDict, 0)
 
         super(_MyStreamListener, self).__init__()
 
+    @staticmethod
+    def get_tweet_bbox(
+        tweet,
+    ):
+        """
+        Return location of tweet as bounding box.
+
+        Exact coordinates are returned as box with zero size,
+        otherwise the bounding box of the tweet's place is used.
+
+        Returns
+        -------
+        bbox : tuple
+            (sw lng, sw lat, ne lng, ne lat) or None if tweet has
+            neither coordinates nor place.
+        """
+        coordinates = getattr(tweet, 'coordinates', None)
+        if coordinates is not None:
+            lng, lat = coordinates['coordinates']
+            return (lng, lat, lng, lat)
+
+        place = getattr(tweet, 'place', None)
+        if place is not None and place.bounding_box is not None:
+            polygon = place.bounding_box.coordinates[0]
+            lngList = [point[0] for point in polygon]
+            latList = [point[1] for point in polygon]
+            return (min(lngList), min(latList), max(lngList), max(latList))
+
+        return None
+
+    def get_tweet_locations(
+        self,
+        tweet,
+    ):
+        """
+        Return names of all locations the tweet belongs to.
+        """
+        # the stream only returns tweets of this location
+        if len(self.locationDict) == 1:
+            return list(self.locationDict)
+
+        bbox = self.get_tweet_bbox(tweet)
+        if bbox is None:
+            return []
+
+        nameList = []
+        for name, location in self.locationDict.items():
+            # boxes intersect, points have to be inside
+            if (
+                bbox[0] <= location[2] and bbox[2] >= location[0] and
+                bbox[1] <= location[3] and bbox[3] >= location[1]
+            ):
+                nameList.append(name)
+
+        return nameList
+
     def on_status(
         self,
         tweet
     ):
         """
         Function that is run on each streamed tweet.
-        Checks criteria and saves to TweetCollection.
+        Checks criteria and saves to TweetCollection of its location.
         """
         # check time limit
         if (time.time() - self.start_time) < self.limit:
@@ -579,14 +872,26 @@ class _MyStreamListener(
                     self.skipFollowerCounter = self.skipFollowerCounter + 1
                     return True
 
+            # find locations this tweet belongs to
+            nameList = self.get_tweet_locations(tweet)
+            if len(nameList) == 0:
+                # streaming API matched it, but it is outside our boxes
+                self.skipLocationCounter = self.skipLocationCounter + 1
+                return True
+
             # convert incoming tweet to custom tweet object
             twInstance = TweetObj(
                 tweet,
                 self.additionalAttributes,
                 self.removeNewLineChar
             )
-            # add tweet to collection
-            self.tweetCollect.funcAddTweet(twInstance)
+            for name in nameList:
+                self.locationCounter[name] = self.locationCounter[name] + 1
+                # add tweet to sink or collection
+                if self.tweetSinkDict is not None:
+                    self.tweetSinkDict[name].put(twInstance)
+                else:
+                    self.tweetCollectDict[name].funcAddTweet(twInstance)
             return True
         else:
             # time is up
@@ -600,6 +905,17 @@ class _MyStreamListener(
                 str(self.skipFollowerCounter) +
                 " tweet(s) because user has too many followers."
             )
+            if len(self.locationDict) > 1:
+                print(
+                    "Tweets per location: " +
+                    ", ".join(
+                        name + ": " + str(count)
+                        for name, count in self.locationCounter.items()
+                    ) +
+                    ". Skipped " +
+                    str(self.skipLocationCounter) +
+                    " tweet(s) outside of all locations."
+                )
             return False
 
     def on_error(
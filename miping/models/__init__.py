@@ -5,6 +5,7 @@ from .gaussianProcessRegressor import GaussianProcessRegressor
 from .randomForest import RandomForest
 from .bayesianRidge import BayesianRidge
 from .onnxModel import OnnxModel
+from .gloveOnnxModel import GloVeOnnxModel
 from .supportVectorMachine import SupportVectorMachine
 from .profile import Profile
 from .profileCollection import ProfileCollection
@@ -12,3 +13,4 @@ from .tweetObj import TweetObj
 from .tweetCollection import TweetCollection
 from .user import User
 from .userCollection import UserCollection
+from .columnarFile import ColumnarFile
@@ -0,0 +1,247 @@
+class ColumnarFile:
+    """
+    Read and write collections as typed columns in Parquet files.
+
+    Parquet support needs the optional package pyarrow, it is only
+    imported when a Parquet file is used. CSV files work without it.
+    """
+
+    suffix = '.parquet'
+    """File suffix which selects Parquet instead of CSV."""
+
+    @staticmethod
+    def is_columnar_path(
+        full_path,
+    ):
+        """
+        Return True if full_path points to a Parquet file.
+        """
+
+        return str(full_path).endswith(ColumnarFile.suffix)
+
+    @staticmethod
+    def _import_pyarrow():
+        """
+        Return pyarrow and pyarrow.parquet modules.
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "Parquet files require pyarrow. " +
+                "Install it via 'pip install miping[parquet]' " +
+                "or use CSV files."
+            )
+
+        return pyarrow, pyarrow.parquet
+
+    @staticmethod
+    def write_columns(
+        full_path,
+        columnList,
+    ):
+        """
+        Write columns to Parquet file.
+
+        Parameters
+        ----------
+        full_path : string, default=None, required
+            Full path for export file.
+        columnList : list, default=None, required
+            Tuples of column name, type name and list of values.
+            Type names are pyarrow types, e.g. 'string', 'int64'
+            or 'float32'. Values can be lists or numpy arrays,
+            None and NaN are written as null.
+        """
+        pa, pq = ColumnarFile._import_pyarrow()
+
+        table = ColumnarFile._create_table(columnList)
+        pq.write_table(table, str(full_path))
+
+        return
+
+    @staticmethod
+    def append_columns(
+        writer,
+        full_path,
+        columnList,
+    ):
+        """
+        Write columns as new row group to Parquet file.
+
+        Rows are written to disk immediately, the file is complete
+        once the returned writer is closed.
+
+        Parameters
+        ----------
+        writer : pyarrow.parquet.ParquetWriter, default=None, required
+            Writer returned by the previous call for this file,
+            None to create the file.
+        full_path : string, default=None, required
+            Full path for export file.
+        columnList : list, default=None, required
+            Columns as for write_columns, names and types have to be
+            the same for all row groups of the file.
+
+        Returns
+        -------
+        writer : pyarrow.parquet.ParquetWriter
+            Writer for further row groups, call close() when done.
+        """
+        pa, pq = ColumnarFile._import_pyarrow()
+
+        table = ColumnarFile._create_table(columnList)
+        if writer is None:
+            writer = pq.ParquetWriter(str(full_path), table.schema)
+        writer.write_table(table)
+
+        return writer
+
+    @staticmethod
+    def _create_table(
+        columnList,
+    ):
+        """
+        Return pyarrow.Table with columns of columnList.
+        """
+        pa, pq = ColumnarFile._import_pyarrow()
+
+        arrays = []
+        names = []
+        for name, typeName, values in columnList:
+            names.append(name)
+            arrays.append(
+                pa.array(
+                    values,
+                    type=pa.type_for_alias(typeName),
+                    from_pandas=True
+                )
+            )
+
+        return pa.Table.from_arrays(arrays, names=names)
+
+    @staticmethod
+    def read_columns(
+        full_path,
+        columns=None,
+    ):
+        """
+        Read columns from Parquet file.
+
+        Only the given columns are read from disk, e.g. user ids
+        without tweet texts.
+
+        Parameters
+        ----------
+        full_path : string, default=None, required
+            Full path for import file.
+        columns : list, default=None
+            Names of columns to read, all if None. Columns not
+            in the file are skipped.
+
+        Returns
+        -------
+        table : pyarrow.Table
+            Table with the read columns.
+        """
+        pa, pq = ColumnarFile._import_pyarrow()
+
+        if columns is not None:
+            fileColumns = set(pq.read_schema(str(full_path)).names)
+            columns = [name for name in columns if name in fileColumns]
+
+        return pq.read_table(str(full_path), columns=columns)
+
+    @staticmethod
+    def iter_columns(
+        full_path,
+        columns=None,
+        batchSize=10000,
+    ):
+        """
+        Read columns from Parquet file in batches of rows.
+
+        Parameters
+        ----------
+        full_path : string, default=None, required
+            Full path for import file.
+        columns : list, default=None
+            Names of columns to read, all if None. Columns not
+            in the file are skipped.
+        batchSize : integer, default=10000
+            Maximum number of rows per batch.
+
+        Yields
+        ------
+        table : pyarrow.Table
+            Table with the read columns for one batch of rows.
+        """
+        pa, pq = ColumnarFile._import_pyarrow()
+
+        parquetFile = pq.ParquetFile(str(full_path))
+        if columns is not None:
+            fileColumns = set(parquetFile.schema_arrow.names)
+            columns = [name for name in columns if name in fileColumns]
+
+        for recordBatch in parquetFile.iter_batches(
+            batch_size=batchSize,
+            columns=columns
+        ):
+            yield pa.Table.from_batches([recordBatch])
+
+    @staticmethod
+    def to_float_list(
+        values,
+    ):
+        """
+        Convert values (e.g. strings read from CSV) to floats,
+        empty strings become None.
+        """
+
+        return [
+            None if value is None or value == '' else float(value)
+            for value in values
+        ]
+
+    @staticmethod
+    def to_int_list(
+        values,
+    ):
+        """
+        Convert values (e.g. strings read from CSV) to integers,
+        empty strings become None.
+        """
+
+        return [
+            None if value is None or value == '' else int(value)
+            for value in values
+        ]
+
+    @staticmethod
+    def to_string_list(
+        values,
+    ):
+        """
+        Convert values to strings, None stays None.
+        """
+
+        return [
+            None if value is None else str(value)
+            for value in values
+        ]
+
+    @staticmethod
+    def to_csv_value_list(
+        values,
+    ):
+        """
+        Convert values read from Parquet to the strings read from CSV,
+        None becomes an empty string. Floats are written in their
+        shortest representation, e.g. '0.5' instead of '0.50'.
+        """
+
+        return [
+            '' if value is None else str(value)
+            for value in values
+        ]
@@ -0,0 +1,262 @@
+import onnx
+import numpy
+
+from onnx import helper
+from onnx import numpy_helper
+from onnx import TensorProto
+
+from .onnxModel import OnnxModel
+
+
+class GloVeOnnxModel(OnnxModel):
+    """
+    GloVeOnnxModel Subclass of OnnxModel
+    End-to-end ONNX model from token ids to Big Five scores.
+    The GloVe matrix is part of the graph, so the feature pipeline
+    (lookup, mean, max, min) runs inside onnxruntime.
+    Next to the ONNX file a vocabulary file (path + '.vocab')
+    maps each word to its row in the GloVe matrix.
+    """
+
+    @staticmethod
+    def exportEndToEndONNX(
+        bundle,
+        wordList,
+        gloveMatrix,
+        path,
+        inputName='token_ids',
+    ):
+        """
+        Build end-to-end ONNX model and export it with its vocabulary.
+
+        The graph is: Gather on the GloVe initializer, followed by
+        ReduceMean, ReduceMax, ReduceMin over all tokens, Concat to the
+        900 dim feature vector, and finally the regressors in bundle.
+        This is the same computation as Features.featureGloVe.
+
+        Parameters
+        ----------
+        bundle : onnx.ModelProto, default=None, required
+            Trained regressor(s) with a single input of 900 dimensions,
+            e.g. as returned by ModelBase.mergeModelsONNX.
+        wordList : list, default=None, required
+            Words of GloVe, position equals row in gloveMatrix.
+        gloveMatrix : numpy.array, default=None, required
+            GloVe matrix with one row per word.
+        path : string, default=None, required
+            Full path for export file. Vocabulary is saved to
+            path + '.vocab'.
+        inputName : string, default='token_ids'
+            Name for the int64 token id input.
+
+        Returns
+        -------
+        model : onnx.ModelProto
+            End-to-end ONNX model.
+        """
+        print(
+            "Exporting end-to-end ONNX model with " +
+            str(len(wordList)) +
+            " words to path " +
+            str(path)
+        )
+
+        gloveMatrix = numpy.asarray(gloveMatrix, dtype=numpy.float32)
+        if gloveMatrix.shape[0] != len(wordList):
+            raise ValueError("wordList and gloveMatrix do not match.")
+        # protobuf cannot serialize files larger than 2GB
+        if gloveMatrix.nbytes > 2000000000:
+            raise ValueError(
+                "GloVe matrix is too large to be embedded in ONNX file."
+            )
+
+        featureName = bundle.graph.input[0].name
+
+        # reduce operations need opset of default domain
+        opsets = {}
+        for opset in bundle.opset_import:
+            opsets[opset.domain] = opset.version
+        # opset 11 is supported by all onnxruntime versions in use
+        opsetVersion = max(opsets.get('', 0), 11)
+        opsets[''] = opsetVersion
+
+        initializers = [
+            numpy_helper.from_array(gloveMatrix, name='glove_embeddings')
+        ]
+        nodes = [
+            helper.make_node(
+                'Gather',
+                inputs=['glove_embeddings', inputName],
+                outputs=['glove_token_vectors'],
+                name='glove_gather',
+                axis=0,
+            )
+        ]
+
+        # mean, max, min over all tokens of the profile
+        pooledNames = []
+        for op, shortName in (
+            ('ReduceMean', 'mean'),
+            ('ReduceMax', 'max'),
+            ('ReduceMin', 'min'),
+        ):
+            pooledName = 'glove_' + shortName
+            if opsetVersion >= 18:
+                # axes moved from attribute to input in opset 18
+                if len(initializers) == 1:
+                    initializers.append(
+                        numpy_helper.from_array(
+                            numpy.array([0], dtype=numpy.int64),
+                            name='glove_axes'
+                        )
+                    )
+                node = helper.make_node(
+                    op,
+                    inputs=['glove_token_vectors', 'glove_axes'],
+                    outputs=[pooledName],
+                    name=pooledName,
+                    keepdims=1,
+                )
+            else:
+                node = helper.make_node(
+                    op,
+                    inputs=['glove_token_vectors'],
+                    outputs=[pooledName],
+                    name=pooledName,
+                    axes=[0],
+                    keepdims=1,
+                )
+            nodes.append(node)
+            pooledNames.append(pooledName)
+
+        # 900 dim vector is the input of the regressors
+        nodes.append(
+            helper.make_node(
+                'Concat',
+                inputs=pooledNames,
+                outputs=[featureName],
+                name='glove_concat',
+                axis=1,
+            )
+        )
+
+        graph = onnx.GraphProto()
+        graph.CopyFrom(bundle.graph)
+        graph.name = 'miping_end_to_end'
+        del graph.input[:]
+        graph.input.extend([
+            helper.make_tensor_value_info(
+                inputName,
+                TensorProto.INT64,
+                [None]
+            )
+        ])
+        # pooling nodes have to run before the regressors
+        regressorNodes = list(graph.node)
+        del graph.node[:]
+        graph.node.extend(nodes + regressorNodes)
+        graph.initializer.extend(initializers)
+
+        model = onnx.ModelProto()
+        model.CopyFrom(bundle)
+        model.graph.CopyFrom(graph)
+        del model.opset_import[:]
+        for domain, version in opsets.items():
+            opset = model.opset_import.add()
+            opset.domain = domain
+            opset.version = version
+
+        onnx.save(model, str(path))
+
+        # save vocabulary, one word per line in row order
+        with open(
+            str(path) + '.vocab', "w", newline='\n', encoding='utf-8'
+        ) as outfile:
+            outfile.write('\n'.join(wordList))
+
+        return model
+
+    def importModelONNX(
+        self,
+        path
+    ):
+        """
+        Import model from ONNX file, create InferenceSession and
+        load vocabulary from path + '.vocab'.
+
+        Parameters
+        ----------
+        path : string, default=None, required
+            Full path for ONNX file to import.
+        """
+        super().importModelONNX(path)
+
+        print("Importing vocabulary for end-to-end ONNX model")
+        with open(
+            str(path) + '.vocab', "r", newline='\n', encoding='utf-8'
+        ) as infile:
+            wordList = infile.read().split('\n')
+
+        # word to row number in GloVe matrix
+        self.vocabulary = {word: num for num, word in enumerate(wordList)}
+
+        return
+
+    def get_token_ids(
+        self,
+        tokens,
+    ):
+        """
+        Map tokens to their row in the GloVe matrix.
+
+        Tokens without GloVe vector are ignored, duplicates are kept.
+
+        Parameters
+        ----------
+        tokens : list, default=None, required
+            Tokens of a profile's text.
+
+        Returns
+        -------
+        tokenIds : numpy.array
+            Int64 array with one entry per known token.
+        """
+        vocabulary = self.vocabulary
+        tokenIds = numpy.fromiter(
+            (vocabulary[token] for token in tokens if token in vocabulary),
+            dtype=numpy.int64
+        )
+
+        return tokenIds
+
+    def predict_token_ids(
+        self,
+        tokenIds,
+    ):
+        """
+        Run end-to-end model for the token ids of one profile.
+
+        Parameters
+        ----------
+        tokenIds : numpy.array, default=None, required
+            Int64 token ids as returned by get_token_ids.
+            Must not be empty.
+
+        Returns
+        -------
+        predictionDict : dict
+            Output name as key and flattened numpy array as value.
+        """
+        if self._session is None:
+            self._create_session()
+
+        results = self._session.run(
+            self._output_names,
+            {self._input_name: tokenIds}
+        )
+
+        predictionDict = {}
+        for outputName, result in zip(self._output_names, results):
+            predictionDict[outputName] = result.flatten()
+
+        return predictionDict
@@ -1,3 +1,6 @@
+import os
+import onnx
+import hashlib
 import onnxmltools
 from skl2onnx.common.data_types import FloatTensorType
 from joblib import dump, load
@@ -10,6 +13,9 @@ class ModelBase:
     This ensures a unified interface.
     """
 
+    onnxSourceHashKey = 'miping_source_hash'
+    """Metadata key of single model hash in ONNX bundles."""
+
     @staticmethod
     def importModelPickle(
         path
@@ -141,6 +147,36 @@ class ModelBase:
             str(path)
         )
 
+        onnx_model = self._convertModelONNX(
+            numDim=numDim,
+            inputName=inputName,
+        )
+
+        # export model to file
+        onnxmltools.utils.save_model(onnx_model, path)
+
+        return onnx_model
+
+    def _convertModelONNX(
+        self,
+        numDim,
+        inputName,
+    ):
+        """
+        Convert model object to ONNX model and return it.
+
+        Parameters
+        ----------
+        numDim : integer, default=None, required
+            Number of dimensions in features used to train this model.
+        inputName : string, default=None, required
+            Name for Input, e.g. liwc_input. Can be any string.
+
+        Returns
+        -------
+        onnx_model : onnx.ModelProto
+            Converted model.
+        """
         # The following line means for example we have a 93-Dimensional
         # float feature vector (-> the LIWC values)
         # and its name is "liwc_input" in ONNX.
@@ -153,7 +189,260 @@ class ModelBase:
             initial_types=initial_type
         )
 
+        return onnx_model
+
+    @staticmethod
+    def exportONNXBundleFromFiles(
+        pathDict,
+        path,
+    ):
+        """
+        Merge exported single ONNX models into one bundle and save it.
+
+        The bundle has one shared input and one output per model,
+        named after the dict key (e.g. big5_openness). This way all
+        dimensions are predicted with a single session run.
+        A hash of the single model files is saved in the bundle, see
+        isONNXBundleCurrent.
+
+        Parameters
+        ----------
+        pathDict : dict, default=None, required
+            Dictionary with label name as key and path to single
+            ONNX model as value.
+        path : string, default=None, required
+            Full path for export file.
+
+        Returns
+        -------
+        bundle : onnx.ModelProto
+            Merged ONNX model.
+        """
+        print(
+            "Exporting ONNX bundle of " +
+            str(len(pathDict)) +
+            " models to path " +
+            str(path)
+        )
+
+        onnxModelDict = {}
+        for labelName, modelPath in pathDict.items():
+            onnxModelDict[labelName] = onnx.load(str(modelPath))
+
+        bundle = ModelBase.mergeModelsONNX(
+            onnxModelDict,
+            sourceHash=ModelBase.getONNXFilesHash(pathDict)
+        )
+
         # export model to file
-        onnxmltools.utils.save_model(onnx_model, path)
+        onnxmltools.utils.save_model(bundle, str(path))
 
-        return onnx_model
+        return bundle
+
+    @staticmethod
+    def getONNXFilesHash(
+        pathDict,
+    ):
+        """
+        Return hash over label names and bytes of ONNX model files.
+
+        Parameters
+        ----------
+        pathDict : dict, default=None, required
+            Dictionary with label name as key and path to ONNX model
+            as value.
+
+        Returns
+        -------
+        sourceHash : string
+            Hex digest, independent of dict order.
+        """
+        digest = hashlib.sha256()
+        for labelName in sorted(pathDict):
+            digest.update(str(labelName).encode('utf-8') + b'\x00')
+            with open(pathDict[labelName], 'rb') as in_file:
+                digest.update(in_file.read())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def isONNXBundleCurrent(
+        bundlePath,
+        pathDict,
+    ):
+        """
+        Check if bundle was built from the given single model files.
+
+        Parameters
+        ----------
+        bundlePath : string, default=None, required
+            Path to ONNX bundle.
+        pathDict : dict, default=None, required
+            Dictionary with label name as key and path to single
+            ONNX model as value.
+
+        Returns
+        -------
+        isCurrent : boolean
+            False if the single models changed since the bundle was
+            built or the bundle has no hash. True if they match or
+            single models do not exist (bundle is the only source).
+        """
+        if not all(os.path.exists(str(p)) for p in pathDict.values()):
+            return True
+
+        bundle = onnx.load(str(bundlePath), load_external_data=False)
+        metadata = {
+            prop.key: prop.value for prop in bundle.metadata_props
+        }
+
+        return (
+            metadata.get(ModelBase.onnxSourceHashKey) ==
+            ModelBase.getONNXFilesHash(pathDict)
+        )
+
+    @staticmethod
+    def mergeModelsONNX(
+        onnxModelDict,
+        sourceHash=None,
+    ):
+        """
+        Merge single output ONNX models with the same input into one model.
+
+        All node, initializer and intermediate names are prefixed with
+        the dict key to avoid collisions. The output of each model is
+        renamed to its dict key. IR version and opsets are taken from the
+        given models, so the bundle runs wherever the single models run.
+
+        Parameters
+        ----------
+        onnxModelDict : dict, default=None, required
+            Dictionary with output name as key and onnx.ModelProto
+            as value. All models need the same single input.
+        sourceHash : string, default=None
+            Hash of the single models, saved in the bundle's metadata.
+
+        Returns
+        -------
+        bundle : onnx.ModelProto
+            Merged model with one input and one output per key.
+        """
+        if len(onnxModelDict) == 0:
+            raise ValueError("No ONNX models passed to merge.")
+
+        firstModel = next(iter(onnxModelDict.values()))
+        graphInput = firstModel.graph.input[0]
+        inputName = graphInput.name
+
+        bundleGraph = onnx.GraphProto()
+        bundleGraph.name = 'miping_bundle'
+        bundleGraph.input.extend([graphInput])
+
+        # collect highest opset version per domain
+        opsets = {}
+
+        for outputName, model in onnxModelDict.items():
+            graph = model.graph
+            if (
+                len(graph.input) != 1 or
+                graph.input[0].name != inputName
+            ):
+                raise ValueError(
+                    "ONNX model for " +
+                    str(outputName) +
+                    " does not have the shared input " +
+                    str(inputName)
+                )
+            if len(graph.output) != 1:
+                raise ValueError(
+                    "ONNX model for " +
+                    str(outputName) +
+                    " must have exactly one output."
+                )
+
+            # shared input keeps its name, model output gets the key
+            # everything else is prefixed
+            renameDict = {
+                inputName: inputName,
+                graph.output[0].name: outputName,
+            }
+
+            for initializer in graph.initializer:
+                newInit = bundleGraph.initializer.add()
+                newInit.CopyFrom(initializer)
+                newInit.name = ModelBase._renameONNXValue(
+                    initializer.name, renameDict, outputName
+                )
+
+            for node in graph.node:
+                newNode = bundleGraph.node.add()
+                newNode.CopyFrom(node)
+                newNode.name = outputName + '_' + node.name
+                del newNode.input[:]
+                newNode.input.extend([
+                    ModelBase._renameONNXValue(x, renameDict, outputName)
+                    for x in node.input
+                ])
+                del newNode.output[:]
+                newNode.output.extend([
+                    ModelBase._renameONNXValue(x, renameDict, outputName)
+                    for x in node.output
+                ])
+
+            for valueInfo in graph.value_info:
+                newInfo = bundleGraph.value_info.add()
+                newInfo.CopyFrom(valueInfo)
+                newInfo.name = ModelBase._renameONNXValue(
+                    valueInfo.name, renameDict, outputName
+                )
+
+            newOutput = bundleGraph.output.add()
+            newOutput.CopyFrom(graph.output[0])
+            newOutput.name = outputName
+
+            for opset in model.opset_import:
+                opsets[opset.domain] = max(
+                    opsets.get(opset.domain, 0),
+                    opset.version
+                )
+
+        bundle = onnx.ModelProto()
+        bundle.CopyFrom(firstModel)
+        bundle.graph.CopyFrom(bundleGraph)
+        del bundle.opset_import[:]
+        for domain, version in opsets.items():
+            opset = bundle.opset_import.add()
+            opset.domain = domain
+            opset.version = version
+
+        if sourceHash is not None:
+            # replace hash the first model might carry
+            metadata = [
+                prop for prop in bundle.metadata_props
+                if prop.key != ModelBase.onnxSourceHashKey
+            ]
+            del bundle.metadata_props[:]
+            bundle.metadata_props.extend(metadata)
+            prop = bundle.metadata_props.add()
+            prop.key = ModelBase.onnxSourceHashKey
+            prop.value = sourceHash
+
+        return bundle
+
+    @staticmethod
+    def _renameONNXValue(
+        name,
+        renameDict,
+        prefix,
+    ):
+        """
+        Return new name for ONNX value and remember it in renameDict.
+        Names not yet in renameDict get prefixed.
+        """
+        if name == '':
+            # optional inputs stay empty
+            return name
+        if name not in renameDict:
+            renameDict[name] = prefix + '_' + name
+
+        return renameDict[name]
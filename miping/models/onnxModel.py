@@ -1,6 +1,8 @@
-
 import onnxruntime as oonxrt
 import numpy
+import hashlib
+
+from os import path
 
 from .modelBase import ModelBase
 
@@ -11,14 +13,25 @@ class OnnxModel(ModelBase):
     Used when reimporting ONNX models and used just for prediction
     not for training, since ONNX models do not offer the full features
     their original models had.
+    The InferenceSession is created once on import and reused
+    for every prediction.
     """
 
+    # map config strings to onnxruntime optimization levels
+    graphOptimizationLevels = {
+        'disable': oonxrt.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        'basic': oonxrt.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        'extended': oonxrt.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        'all': oonxrt.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+    """Allowed values for graphOptimizationLevel"""
+
     def importModelONNX(
         self,
         path
     ):
         """
-        Import model from ONNX file.
+        Import model from ONNX file and create InferenceSession.
 
         Parameters
         ----------
@@ -36,6 +49,9 @@ class OnnxModel(ModelBase):
 
         self._trainedOnnxModel = data
 
+        # session is created once and reused for predictions
+        self._create_session()
+
         return
 
     def __init__(
@@ -43,6 +59,10 @@ class OnnxModel(ModelBase):
         modelName,
         labelName,
         trainedOnnxModel=None,
+        intraOpNumThreads=0,
+        interOpNumThreads=0,
+        graphOptimizationLevel='all',
+        optimizedModelFilePath=None,
     ):
         """
         Init function where super constrcutor is passed with reference
@@ -54,12 +74,46 @@ class OnnxModel(ModelBase):
             Model algorithm type (e.g. linear, SVM).
         labelName : string, default=None, required
             Big Five dimension this model was trained for.
-        trainedOnnxModel : string, default=None
-            Full absolute path for file to be loaded via yaml.safe_load().
+        trainedOnnxModel : bytes, default=None
+            Serialized ONNX model. If passed, the session is created
+            right away.
+        intraOpNumThreads : integer, default=0
+            Number of threads used within an operator.
+            0 lets onnxruntime decide.
+        interOpNumThreads : integer, default=0
+            Number of threads used to run operators in parallel.
+            0 lets onnxruntime decide.
+        graphOptimizationLevel : string, default='all'
+            One of 'disable', 'basic', 'extended', 'all'.
+        optimizedModelFilePath : string, default=None
+            If set, the optimized graph is serialized to a file next
+            to this path on first import. A hash of the model bytes,
+            the onnxruntime version and the optimization level is
+            added to the file name (see get_optimized_model_path),
+            so a changed model is optimized again instead of loading
+            the outdated graph.
         """
         # onnx model just for internal use
         self._trainedOnnxModel = trainedOnnxModel
 
+        if graphOptimizationLevel not in self.graphOptimizationLevels:
+            raise ValueError(
+                "Unknown graphOptimizationLevel " +
+                str(graphOptimizationLevel)
+            )
+
+        # session configuration
+        self.intraOpNumThreads = intraOpNumThreads
+        self.interOpNumThreads = interOpNumThreads
+        self.graphOptimizationLevel = graphOptimizationLevel
+        self.optimizedModelFilePath = optimizedModelFilePath
+
+        # will hold inference session and its input and output names
+        self._session = None
+        self._input_name = None
+        self._label_name = None
+        self._output_names = None
+
         super().__init__(
             modelName=modelName,
             labelName=labelName,
@@ -69,6 +123,103 @@ class OnnxModel(ModelBase):
             model=self,
         )
 
+        if self._trainedOnnxModel is not None:
+            self._create_session()
+
+        return
+
+    def _get_session_options(
+        self,
+    ):
+        """
+        Build SessionOptions based on the configuration of this instance.
+
+        Returns
+        -------
+        sessOptions : onnxruntime.SessionOptions
+            Options to pass into InferenceSession.
+        """
+        sessOptions = oonxrt.SessionOptions()
+        sessOptions.intra_op_num_threads = self.intraOpNumThreads
+        sessOptions.inter_op_num_threads = self.interOpNumThreads
+        sessOptions.graph_optimization_level = (
+            self.graphOptimizationLevels[self.graphOptimizationLevel]
+        )
+
+        return sessOptions
+
+    def get_optimized_model_path(
+        self,
+    ):
+        """
+        Return path of the optimized graph for the imported model.
+
+        E.g. 'big5_openness.optimized.ONNX' becomes
+        'big5_openness.optimized.<hash>.ONNX'.
+
+        Returns
+        -------
+        optimizedPath : string
+            Path including hash, None if no optimizedModelFilePath
+            is configured.
+        """
+        if self.optimizedModelFilePath is None:
+            return None
+
+        digest = hashlib.sha256(self._trainedOnnxModel)
+        digest.update(
+            (
+                '\x00' + oonxrt.__version__ +
+                '\x00' + self.graphOptimizationLevel
+            ).encode('utf-8')
+        )
+        root, extension = path.splitext(str(self.optimizedModelFilePath))
+
+        return root + '.' + digest.hexdigest()[:16] + extension
+
+    def _create_session(
+        self,
+    ):
+        """
+        Create InferenceSession from imported model bytes and save
+        session, input name and output name in instance.
+
+        If the optimized model file for these model bytes exists, it is
+        loaded directly and graph optimizations are skipped. Otherwise,
+        the optimized model is written to that path (if configured).
+        """
+        if self._trainedOnnxModel is None:
+            raise Exception("Empty ONNX Model")
+
+        sessOptions = self._get_session_options()
+        optimizedPath = self.get_optimized_model_path()
+
+        if optimizedPath is not None and path.exists(optimizedPath):
+            # graph is already optimized
+            sessOptions.graph_optimization_level = (
+                self.graphOptimizationLevels['disable']
+            )
+            sess = oonxrt.InferenceSession(
+                optimizedPath,
+                sessOptions
+            )
+        else:
+            if optimizedPath is not None:
+                # save optimized graph for the next import
+                sessOptions.optimized_model_filepath = optimizedPath
+            sess = oonxrt.InferenceSession(
+                self._trainedOnnxModel,
+                sessOptions
+            )
+
+        self._session = sess
+        self._input_name = sess.get_inputs()[0].name
+        self._label_name = sess.get_outputs()[0].name
+        # bundles have one output per dimension
+        self._output_names = [
+            output.name for output in sess.get_outputs()
+        ]
+
         return
 
     def predict(
@@ -94,22 +245,56 @@ class OnnxModel(ModelBase):
             Array containing the Big Five dimension predictions based on
             input X.
         """
-        if self._trainedOnnxModel is None:
-            raise Exception("Empty ONNX Model")
+        if self._session is None:
+            # session was not created yet, e.g. bytes were set manually
+            self._create_session()
 
-        # prepare sessions for onnx
-        sess = oonxrt.InferenceSession(self._trainedOnnxModel)
-        input_name = sess.get_inputs()[0].name
-        label_name = sess.get_outputs()[0].name
         # perform prediction with onnx model
-        pred_onx = sess.run(
-            [label_name], {input_name: X.astype(numpy.float32)}
+        # astype copies only if X is not already float32
+        pred_onx = self._session.run(
+            [self._label_name],
+            {self._input_name: X.astype(numpy.float32, copy=False)}
         )[0]
 
         pred_onx_flat = pred_onx.flatten()
 
         return pred_onx_flat
 
+    def predict_all(
+        self,
+        X
+    ):
+        """
+        Run all outputs of the model with one session run.
+
+        Useful for ONNX bundles, which contain one output per
+        Big Five dimension.
+
+        Parameters
+        ----------
+        X : features, default=None, required
+            Features need to match the shape this model was originally
+            trained with (e.g. GloVe 900 dimensions).
+
+        Returns
+        -------
+        predictionDict : dict
+            Output name as key and flattened numpy array as value.
+        """
+        if self._session is None:
+            self._create_session()
+
+        results = self._session.run(
+            self._output_names,
+            {self._input_name: X.astype(numpy.float32, copy=False)}
+        )
+
+        predictionDict = {}
+        for outputName, result in zip(self._output_names, results):
+            predictionDict[outputName] = result.flatten()
+
+        return predictionDict
+
     def fit(
         self,
         X,
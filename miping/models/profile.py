@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class Profile:
     """
     Data class containing the final structure used to derive features.
@@ -47,6 +50,13 @@ class Profile:
     ]
     """Full list of attributes including IBM Big Five facets."""
 
+    # no per-instance dict, so many profiles need less memory
+    # LIWC categories are stored in _liwcValues
+    # _tokens holds text and its tokens, see set_tokens
+    __slots__ = tuple(attributeNameList) + (
+        '_liwcValues', '_liwcOwner', '_tokens'
+    )
+
     liwc_category_list = [
         'WC',
         'Analytic',
@@ -144,6 +154,12 @@ class Profile:
     ]
     """All 93 LIWC categories, for easier loop."""
 
+    # LIWC categories are not stored as single attributes but in one
+    # float32 row, see get_liwc_values. Attribute access is provided
+    # by properties created below the class. They return float or
+    # None, other types (e.g. Decimal, strings read from CSV) are
+    # converted on assignment and '' is treated as None.
+
     def __str__(
         self
     ):
@@ -194,9 +210,19 @@ class Profile:
         for attr in Profile.attributeNameList:
             setattr(self, attr, None)
 
-        # initialize all liwc attributes
-        for attr in Profile.liwc_category_list:
-            setattr(self, attr, None)
+        # initialize all liwc attributes, NaN stands for None
+        # once the profile is added to a ProfileCollection
+        # this row becomes a view into the collection's LIWC matrix
+        self._liwcValues = np.full(
+            len(Profile.liwc_category_list),
+            np.nan,
+            dtype=np.float32
+        )
+        # collection and row number the LIWC row belongs to
+        self._liwcOwner = None
+
+        # tokens are only known if set_tokens is called
+        self._tokens = None
 
         # if main attributes are given, save them
         self.userID = userID
@@ -213,6 +239,92 @@ class Profile:
 
         return
 
+    def set_tokens(
+        self,
+        tokenList,
+    ):
+        """
+        Set text from tokens of cleaned text and keep the tokens.
+
+        Used with DataPreparation.tokenize_text, so feature extraction
+        does not have to split the text again.
+
+        Parameters
+        ----------
+        tokenList : list, default=None, required
+            Tokens of cleaned text, text is joined with spaces.
+        """
+
+        self.text = ' '.join(tokenList)
+        self._tokens = (self.text, tokenList)
+
+        return
+
+    def get_tokens(
+        self,
+    ):
+        """
+        Return tokens of text (separated by space).
+
+        Tokens passed to set_tokens are returned as long as text
+        was not changed afterwards.
+
+        Returns
+        -------
+        tokenList : list
+            Tokens of text.
+        """
+
+        if self._tokens is not None and self._tokens[0] is self.text:
+            return self._tokens[1]
+
+        return self.text.split(' ')
+
+    def get_liwc_values(
+        self,
+    ):
+        """
+        Return LIWC categories as float32 row (NaN if not set).
+
+        The order is given by liwc_category_list. Changing the
+        returned array changes the profile's LIWC attributes.
+
+        Returns
+        -------
+        liwcValues : numpy.array
+            One value for each LIWC category.
+        """
+
+        return self._liwcValues
+
+    def set_liwc_values(
+        self,
+        liwcValues,
+        owner=None,
+    ):
+        """
+        Bind LIWC categories to liwcValues without copying.
+
+        Used by ProfileCollection to make the profile a view of
+        one row of its LIWC matrix. The collection previously owning
+        the row is told that its row is no longer bound.
+
+        Parameters
+        ----------
+        liwcValues : numpy.array, default=None, required
+            Float32 array with one value for each LIWC category.
+        owner : tuple, default=None
+            ProfileCollection and row number liwcValues belong to.
+        """
+
+        previousOwner = self._liwcOwner
+        self._liwcValues = liwcValues
+        self._liwcOwner = owner
+        if previousOwner is not None and previousOwner != owner:
+            previousOwner[0].release_liwc_row(previousOwner[1])
+
+        return
+
     def load_ibm_json(
         self,
         ibmJson,
@@ -389,3 +501,32 @@ class Profile:
                 self.facet_vulnerability = facet['percentile']
 
         return
+
+
+def _liwc_property(
+    column,
+):
+    """
+    Create property for one LIWC category reading and writing
+    column of the profile's LIWC row. None is saved as NaN.
+    """
+
+    def getter(self):
+        value = self._liwcValues[column]
+        if np.isnan(value):
+            return None
+        return float(value)
+
+    def setter(self, value):
+        # CSV files contain empty strings for missing values
+        if value is None or value == '':
+            self._liwcValues[column] = np.nan
+        else:
+            self._liwcValues[column] = float(value)
+
+    return property(getter, setter)
+
+
+# attribute interface for LIWC categories, e.g. profile.WC
+for _column, _attrName in enumerate(Profile.liwc_category_list):
+    setattr(Profile, _attrName, _liwc_property(_column))
@@ -1,5 +1,8 @@
 import csv
+import numpy as np
+
 from .profile import Profile
+from .columnarFile import ColumnarFile
 
 
 class ProfileCollection:
@@ -16,6 +19,24 @@ class ProfileCollection:
         # initialize empty list to collect profiles
         self.profileList = []
 
+        # LIWC categories of all profiles, column-wise in one float32
+        # matrix aligned to profileList. It has spare rows so adding
+        # profiles does not copy it each time, see get_liwc_matrix.
+        self._liwcBuffer = np.empty(
+            (0, len(Profile.liwc_category_list)),
+            dtype=np.float32
+        )
+
+        # userID to list of positions in profileList
+        # built on first lookup, see _get_user_index
+        self._userIndex = None
+        # number of profiles covered by _userIndex
+        self._indexedCount = 0
+
+        # rows whose profiles were bound elsewhere afterwards,
+        # see release_liwc_row
+        self._releasedRows = set()
+
         return
 
     def add_profile(
@@ -25,6 +46,9 @@ class ProfileCollection:
         """
         Add Profile to profileList.
 
+        The profile's LIWC values are copied into the collection's
+        LIWC matrix and the profile becomes a view of its row.
+
         Parameters
         ----------
         profileObj : Profile, default=None, required
@@ -32,6 +56,85 @@ class ProfileCollection:
         """
 
         self.profileList.append(profileObj)
+        self._bind_liwc_row(len(self.profileList) - 1)
+        if self._userIndex is not None:
+            self._update_user_index()
+
+        return
+
+    def get_liwc_matrix(
+        self,
+    ):
+        """
+        Return LIWC categories of all profiles as float32 matrix.
+
+        Rows are in order of profileList, columns in order of
+        Profile.liwc_category_list, missing values are NaN.
+        No copy is made, the matrix is shared with the profiles.
+
+        Returns
+        -------
+        liwcMatrix : numpy.array
+            Matrix with shape (number of profiles, 93).
+        """
+
+        # rows of profiles bound to another collection (or another
+        # row) afterwards, their current values are taken over
+        releasedRows = self._releasedRows
+        self._releasedRows = set()
+        for rowNum in releasedRows:
+            self._bind_liwc_row(rowNum)
+
+        return self._liwcBuffer[:len(self.profileList)]
+
+    def release_liwc_row(
+        self,
+        rowNum,
+    ):
+        """
+        Note that profile at rowNum is no longer a view of the LIWC
+        matrix, called by Profile.set_liwc_values.
+
+        Parameters
+        ----------
+        rowNum : integer, default=None, required
+            Row of the LIWC matrix.
+        """
+
+        self._releasedRows.add(rowNum)
+
+        return
+
+    def _bind_liwc_row(
+        self,
+        rowNum,
+    ):
+        """
+        Copy LIWC values of profile at rowNum into the LIWC matrix
+        and make the profile a view of this row.
+        """
+
+        if rowNum >= self._liwcBuffer.shape[0]:
+            # grow geometrically and rebind the existing views
+            oldBuffer = self._liwcBuffer
+            self._liwcBuffer = np.empty(
+                (max(2 * rowNum, 64), oldBuffer.shape[1]),
+                dtype=np.float32
+            )
+            self._liwcBuffer[:oldBuffer.shape[0]] = oldBuffer
+            for num, profile in enumerate(self.profileList[:rowNum]):
+                if num not in self._releasedRows:
+                    profile.set_liwc_values(
+                        self._liwcBuffer[num],
+                        owner=(self, num)
+                    )
+
+        profile = self.profileList[rowNum]
+        self._liwcBuffer[rowNum] = profile.get_liwc_values()
+        profile.set_liwc_values(
+            self._liwcBuffer[rowNum],
+            owner=(self, rowNum)
+        )
 
         return
 
@@ -42,11 +145,17 @@ class ProfileCollection:
         """
         Export profiles in profile list to one CSV file.
 
+        If full_path ends with '.parquet', a Parquet file is written
+        instead, see write_profile_list_parquet.
+
         Parameters
         ----------
         full_path : string, default='profilelist.csv'
             Full path for export file.
         """
+        if ColumnarFile.is_columnar_path(full_path):
+            self.write_profile_list_parquet(full_path=full_path)
+            return
 
         # write output csv file
         with open(full_path, "w", newline='', encoding='utf-8') as outfile:
@@ -66,8 +175,10 @@ class ProfileCollection:
                     basicList.append(getattr(entry, attr))
 
                 # write liwc categories (even if they are empty)
-                for attr in Profile.liwc_category_list:
-                    basicList.append(getattr(entry, attr))
+                # float32 values are written with their shortest
+                # representation, so reading them gives the same values
+                for value in entry.get_liwc_values():
+                    basicList.append('' if np.isnan(value) else str(value))
 
                 writer.writerow(basicList)
 
@@ -81,6 +192,9 @@ class ProfileCollection:
         """
         Import profiles to profile list from one CSV file.
 
+        If full_path ends with '.parquet', a Parquet file is read
+        instead, see read_profile_list_parquet.
+
         Parameters
         ----------
         full_path : string, default='profilelist.csv'
@@ -88,6 +202,15 @@ class ProfileCollection:
         idsonly : boolean, default=False
             Indicates if file contains only user ids.
         """
+        if ColumnarFile.is_columnar_path(full_path):
+            columns = None
+            if idsonly is True:
+                columns = ['userID']
+            self.read_profile_list_parquet(
+                full_path=full_path,
+                columns=columns
+            )
+            return
 
         # read csv file
         with open(full_path, "r", newline='', encoding='utf-8') as infile:
@@ -132,6 +255,108 @@ class ProfileCollection:
 
         return
 
+    def write_profile_list_parquet(
+        self,
+        full_path='profilelist.parquet',
+    ):
+        """
+        Export profiles in profile list to Parquet file (requires pyarrow).
+
+        Columns are the same as in the CSV file. Word and tweet
+        numbers are stored as integers, Big Five values as float64
+        and LIWC categories as float32, missing values as null.
+        Except LIWC categories, they are read as strings again,
+        like from CSV.
+
+        Parameters
+        ----------
+        full_path : string, default='profilelist.parquet'
+            Full path for export file.
+        """
+        columnList = []
+        for attr in Profile.attributeNameList:
+            values = [getattr(profile, attr) for profile in self.profileList]
+            if attr in ('numberWords', 'numberTweets'):
+                columnList.append(
+                    (attr, 'int64', ColumnarFile.to_int_list(values))
+                )
+            elif attr.startswith(('big5_', 'facet_')):
+                columnList.append(
+                    (attr, 'float64', ColumnarFile.to_float_list(values))
+                )
+            else:
+                columnList.append(
+                    (attr, 'string', ColumnarFile.to_string_list(values))
+                )
+
+        # LIWC columns are taken from the matrix directly
+        liwcMatrix = self.get_liwc_matrix()
+        for num, attr in enumerate(Profile.liwc_category_list):
+            columnList.append((attr, 'float32', liwcMatrix[:, num]))
+
+        ColumnarFile.write_columns(
+            full_path=full_path,
+            columnList=columnList
+        )
+
+        return
+
+    def read_profile_list_parquet(
+        self,
+        full_path='profilelist.parquet',
+        columns=None,
+    ):
+        """
+        Import profiles to profile list from Parquet file.
+
+        Only the given columns are read, e.g. ['userID'] +
+        Profile.liwc_category_list loads the LIWC categories without
+        the profile texts. Attributes of columns not read are None.
+        Values are converted to the strings read from CSV, so
+        numberWords is '12' (not 12) and missing Big Five values
+        are ''. LIWC categories are floats, NaN if missing.
+
+        Parameters
+        ----------
+        full_path : string, default='profilelist.parquet'
+            Full path for import file.
+        columns : list, default=None
+            Names of attributes (incl. LIWC categories) to read,
+            all if None.
+        """
+        table = ColumnarFile.read_columns(
+            full_path=full_path,
+            columns=columns
+        )
+
+        columnDict = {
+            attr: ColumnarFile.to_csv_value_list(
+                table.column(attr).to_pylist()
+            )
+            for attr in Profile.attributeNameList
+            if attr in table.column_names
+        }
+
+        startRow = len(self.profileList)
+        for row in range(table.num_rows):
+            profileInst = Profile()
+            for attr, values in columnDict.items():
+                setattr(profileInst, attr, values[row])
+
+            # add profile to collection
+            self.add_profile(profileInst)
+
+        # LIWC columns are written into the matrix directly,
+        # nulls become NaN
+        liwcMatrix = self.get_liwc_matrix()
+        for num, attr in enumerate(Profile.liwc_category_list):
+            if attr in table.column_names:
+                liwcMatrix[startRow:, num] = (
+                    table.column(attr).to_numpy(zero_copy_only=False)
+                )
+
+        return
+
     def get_profile_by_user_id(
         self,
         userID
@@ -139,6 +364,10 @@ class ProfileCollection:
         """
         Search and return profile in profile list with given user id.
 
+        The user index is checked against the profiles' current
+        userIDs. If a userID was changed after the index was built,
+        the index is rebuilt once before the lookup fails.
+
         Parameters
         ----------
         userID : string, default=None, required
@@ -150,11 +379,20 @@ class ProfileCollection:
             Profile with matching user id.
         """
 
-        # filter current profile list to get profile
-        # with corresponding userID
+        # look up profiles with corresponding userID in index
+        rowList = self._get_user_index().get(userID, [])
         userProfileList = [
-            profile for profile in self.profileList if profile.userID == userID
+            self.profileList[row]
+            for row in rowList
+            if self.profileList[row].userID == userID
         ]
+        if len(rowList) == 0 or len(userProfileList) < len(rowList):
+            # index may be stale, userIDs changed after indexing
+            self._userIndex = None
+            userProfileList = [
+                self.profileList[row]
+                for row in self._get_user_index().get(userID, [])
+            ]
 
         # if more than one profile, something went wrong
         if len(userProfileList) > 1:
@@ -167,3 +405,44 @@ class ProfileCollection:
         userProfile = userProfileList[0]
 
         return userProfile
+
+    def _get_user_index(
+        self,
+    ):
+        """
+        Return mapping of userID to positions in profileList.
+
+        Built on first call, then kept up to date by add_profile.
+        Profiles appended to profileList directly are indexed on
+        the next call. Changing the userID of an indexed profile is
+        not noticed here, see get_profile_by_user_id.
+        """
+        if (
+            self._userIndex is None or
+            self._indexedCount > len(self.profileList)
+        ):
+            # profileList was replaced or shortened, build from scratch
+            self._userIndex = {}
+            self._indexedCount = 0
+        if self._indexedCount < len(self.profileList):
+            self._update_user_index()
+
+        return self._userIndex
+
+    def _update_user_index(
+        self,
+    ):
+        """
+        Add profiles not yet covered by the user index.
+        """
+        userIndex = self._userIndex
+        for row in range(self._indexedCount, len(self.profileList)):
+            userID = self.profileList[row].userID
+            rowList = userIndex.get(userID)
+            if rowList is None:
+                userIndex[userID] = [row]
+            else:
+                rowList.append(row)
+        self._indexedCount = len(self.profileList)
+
+        return
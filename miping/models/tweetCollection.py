@@ -1,5 +1,6 @@
 import csv
 from .tweetObj import TweetObj
+from .columnarFile import ColumnarFile
 
 
 class TweetCollection:
@@ -18,6 +19,12 @@ class TweetCollection:
         # initialize empty list to collect tweets
         self.tweetList = []
 
+        # user_id to list of positions in tweetList
+        # built on first lookup, see _get_user_index
+        self._userIndex = None
+        # number of tweets covered by _userIndex
+        self._indexedCount = 0
+
         # if any attributes are given, add them
         if additionalAttributes is not None:
             self.additionalAttributes = additionalAttributes
@@ -34,6 +41,8 @@ class TweetCollection:
         """
 
         self.tweetList.append(tweetObj)
+        if self._userIndex is not None:
+            self._update_user_index()
 
         return
 
@@ -45,26 +54,51 @@ class TweetCollection:
         Add tweetCollection to tweetlist by extending it.
         """
         self.tweetList.extend(tweetCol.tweetList)
+        if self._userIndex is not None:
+            self._update_user_index()
 
         return
 
     def write_tweet_list_file(
         self,
         full_path='tweetlist.csv',
-        ids_only=False
+        ids_only=False,
+        append=False,
     ):
         """
         Export objects in tweetlist to CSV file.
 
+        If full_path ends with '.parquet', a Parquet file is written
+        instead, see write_tweet_list_parquet.
+
         Parameters
         ----------
         full_path : string, default='tweetlist.csv'
             Full path for export file.
         ids_only : boolean, default=False
             If True only one column for ids will be written.
+        append : boolean, default=False
+            If True, tweets are appended to the CSV file, so it can be
+            written batch by batch without keeping all tweets.
         """
+        if ColumnarFile.is_columnar_path(full_path):
+            if append is True:
+                raise ValueError("Parquet files cannot be appended.")
+            self.write_tweet_list_parquet(
+                full_path=full_path,
+                ids_only=ids_only
+            )
+            return
+
+        if append is True:
+            fileMode = "a"
+        else:
+            fileMode = "w"
+
         # write output csv file
-        with open(full_path, "w", newline='', encoding='utf-8') as outfile:
+        with open(
+            full_path, fileMode, newline='', encoding='utf-8'
+        ) as outfile:
             # initialize csv writer
             writer = csv.writer(
                 outfile,
@@ -105,6 +139,42 @@ class TweetCollection:
         """
         Import tweet objects to tweetlist from CSV file.
 
+        If full_path ends with '.parquet', a Parquet file is read
+        instead. To process large files in batches use
+        iter_tweet_list_file.
+
+        Parameters
+        ----------
+        full_path : string, default='tweetlist.csv'
+            Full path for import file.
+        ids_only : boolean, default=False
+            If True only one column for ids will be written.
+        removeNewLineChar : boolean, default=True
+            Remove new line characters from texts in tweets.
+        """
+        for batchCol in self.iter_tweet_list_file(
+            full_path=full_path,
+            ids_only=ids_only,
+            removeNewLineChar=removeNewLineChar
+        ):
+            self.add_tweet_collection(batchCol)
+
+        return
+
+    def iter_tweet_list_file(
+        self,
+        full_path='tweetlist.csv',
+        ids_only=False,
+        removeNewLineChar=True,
+        batchSize=10000,
+    ):
+        """
+        Read tweet objects from CSV (or Parquet) file in batches.
+
+        Only one batch is kept in memory at a time. Tweets are not
+        added to this collection, each batch is a new TweetCollection
+        with the same additional attributes.
+
         Parameters
         ----------
         full_path : string, default='tweetlist.csv'
@@ -113,7 +183,30 @@ class TweetCollection:
             If True only one column for ids will be written.
         removeNewLineChar : boolean, default=True
             Remove new line characters from texts in tweets.
+        batchSize : integer, default=10000
+            Maximum number of tweets per batch.
+
+        Yields
+        ------
+        batchCol : TweetCollection
+            Collection with the next tweets of the file.
         """
+        if ColumnarFile.is_columnar_path(full_path):
+            columns = None
+            if ids_only is True:
+                columns = ['id_str']
+            for table in ColumnarFile.iter_columns(
+                full_path=full_path,
+                columns=columns,
+                batchSize=batchSize
+            ):
+                batchCol = self._create_sub_collection([])
+                batchCol._add_tweets_from_table(
+                    table=table,
+                    removeNewLineChar=removeNewLineChar
+                )
+                yield batchCol
+            return
 
         # read csv file
         with open(full_path, "r", newline='', encoding='utf-8') as infile:
@@ -124,6 +217,7 @@ class TweetCollection:
                 quotechar='"',
                 quoting=csv.QUOTE_MINIMAL
             )
+            batchCol = self._create_sub_collection([])
             for row in reader:
                 # convert to custom tweet object
                 twInstance = TweetObj(removeNewLineChar=removeNewLineChar)
@@ -149,8 +243,175 @@ class TweetCollection:
                         for num, attr in enumerate(self.additionalAttributes):
                             setattr(twInstance, attr, row[num+5])
 
-                # add tweet to collection
-                self.funcAddTweet(twInstance)
+                # add tweet to batch
+                batchCol.funcAddTweet(twInstance)
+                if len(batchCol.tweetList) >= batchSize:
+                    yield batchCol
+                    batchCol = self._create_sub_collection([])
+
+            if len(batchCol.tweetList) > 0:
+                yield batchCol
+
+    def write_tweet_list_parquet(
+        self,
+        full_path='tweetlist.parquet',
+        ids_only=False,
+    ):
+        """
+        Export objects in tweetlist to Parquet file (requires pyarrow).
+
+        Columns are the same as in the CSV file, isRetweet is
+        stored as integer, all other columns as strings.
+
+        Parameters
+        ----------
+        full_path : string, default='tweetlist.parquet'
+            Full path for export file.
+        ids_only : boolean, default=False
+            If True only one column for ids will be written.
+        """
+        ColumnarFile.write_columns(
+            full_path=full_path,
+            columnList=self._get_parquet_columns(ids_only=ids_only)
+        )
+
+        return
+
+    def append_tweet_list_parquet(
+        self,
+        writer,
+        full_path='tweetlist.parquet',
+    ):
+        """
+        Write objects in tweetlist as new row group to Parquet file.
+
+        Used to write large files batch by batch, columns are the
+        same as for write_tweet_list_parquet.
+
+        Parameters
+        ----------
+        writer : pyarrow.parquet.ParquetWriter, default=None, required
+            Writer returned by the previous call for this file,
+            None to create the file.
+        full_path : string, default='tweetlist.parquet'
+            Full path for export file.
+
+        Returns
+        -------
+        writer : pyarrow.parquet.ParquetWriter
+            Writer for further batches, call close() when done.
+        """
+
+        return ColumnarFile.append_columns(
+            writer=writer,
+            full_path=full_path,
+            columnList=self._get_parquet_columns()
+        )
+
+    def _get_parquet_columns(
+        self,
+        ids_only=False,
+    ):
+        """
+        Return columns of tweetlist for ColumnarFile.
+        """
+        columnNames = ['id_str']
+        if ids_only is False:
+            columnNames.extend(
+                ['created_at', 'user_id', 'isRetweet', 'text']
+            )
+            if self.addAttrBool:
+                columnNames.extend(self.additionalAttributes)
+
+        columnList = []
+        for attr in columnNames:
+            values = [getattr(tweet, attr) for tweet in self.tweetList]
+            if attr == 'isRetweet':
+                columnList.append(
+                    (attr, 'int8', ColumnarFile.to_int_list(values))
+                )
+            else:
+                columnList.append(
+                    (attr, 'string', ColumnarFile.to_string_list(values))
+                )
+
+        return columnList
+
+    def read_tweet_list_parquet(
+        self,
+        full_path='tweetlist.parquet',
+        columns=None,
+        removeNewLineChar=True,
+    ):
+        """
+        Import tweet objects to tweetlist from Parquet file.
+
+        Only the given columns are read, e.g. ['id_str', 'user_id']
+        loads the tweets without parsing their texts. Attributes of
+        columns not read are None.
+
+        Parameters
+        ----------
+        full_path : string, default='tweetlist.parquet'
+            Full path for import file.
+        columns : list, default=None
+            Names of attributes to read, all if None.
+        removeNewLineChar : boolean, default=True
+            Remove new line characters from texts in tweets.
+        """
+        table = ColumnarFile.read_columns(
+            full_path=full_path,
+            columns=columns
+        )
+        self._add_tweets_from_table(
+            table=table,
+            removeNewLineChar=removeNewLineChar
+        )
+
+        return
+
+    def _add_tweets_from_table(
+        self,
+        table,
+        removeNewLineChar=True,
+    ):
+        """
+        Add a tweet object for each row of pyarrow table.
+
+        Values are converted to the strings read from CSV, so
+        isRetweet is '0' (not 0) and missing values are ''.
+        """
+        attrList = ['id_str', 'created_at', 'user_id', 'isRetweet', 'text']
+        if self.addAttrBool:
+            attrList.extend(self.additionalAttributes)
+        columnDict = {
+            attr: ColumnarFile.to_csv_value_list(
+                table.column(attr).to_pylist()
+            )
+            for attr in attrList
+            if attr in table.column_names
+        }
+
+        if removeNewLineChar is True and 'text' in columnDict:
+            columnDict['text'] = [
+                text.replace("\n", " ").replace("\r", " ")
+                for text in columnDict['text']
+            ]
+
+        for row in range(table.num_rows):
+            twInstance = TweetObj(
+                additionalAttributeList=(
+                    self.additionalAttributes if self.addAttrBool else None
+                ),
+                removeNewLineChar=removeNewLineChar
+            )
+            for attr, values in columnDict.items():
+                setattr(twInstance, attr, values[row])
+
+            # add tweet to collection
+            self.funcAddTweet(twInstance)
+
+        return
 
     def get_id_list(
         self,
@@ -195,6 +456,57 @@ class TweetCollection:
         twCol : TweetCollection
             Another Tweetcollection containing only tweet from the given user.
         """
+        # look up positions of the user's tweets in index
+        rowList = self._get_user_index().get(userID, [])
+
+        return self._create_sub_collection(
+            [self.tweetList[row] for row in rowList]
+        )
+
+    def combine_tweet_text(
+        self,
+    ):
+        """
+        Takes all tweets of tweetlist and combines the text in one string.
+        Separated by space.
+        """
+        # join tweet texts with space in one string
+        # it will access each tweets text attribute
+        # of the tweetList
+        totalText = ' '.join(tweet.text for tweet in self.tweetList)
+
+        return totalText
+
+    def group_by_user(
+        self,
+    ):
+        """
+        Iterate over tweets grouped by user id.
+
+        Groups are in order of the user's first tweet in tweetList,
+        tweets within a group keep their order.
+
+        Yields
+        ------
+        userID : string
+            User id of the group.
+        twCol : TweetCollection
+            Another TweetCollection containing only tweets of userID.
+        """
+        for userID, rowList in self._get_user_index().items():
+            twCol = self._create_sub_collection(
+                [self.tweetList[row] for row in rowList]
+            )
+            yield userID, twCol
+
+    def _create_sub_collection(
+        self,
+        tweetList,
+    ):
+        """
+        Return new TweetCollection with same additional attributes
+        containing tweetList.
+        """
         # initialize new tweet collection
         if self.addAttrBool:
             twCol = TweetCollection(
@@ -203,27 +515,50 @@ class TweetCollection:
         else:
             twCol = TweetCollection()
 
-        # filter current tweet list to get only tweets
-        # relevant to userID
-        userTweetList = [
-            tweet for tweet in self.tweetList if tweet.user_id == userID
-        ]
-
         # assign filtered list to new collection
-        twCol.tweetList = userTweetList
+        twCol.tweetList = tweetList
 
         return twCol
 
-    def combine_tweet_text(
+    def _get_user_index(
         self,
     ):
         """
-        Takes all tweets of tweetlist and combines the text in one string.
-        Separated by space.
+        Return mapping of user_id to positions in tweetList.
+
+        Built on first call, then kept up to date by funcAddTweet and
+        add_tweet_collection. Tweets appended to tweetList directly
+        are indexed on the next call. The index is only rebuilt if
+        tweetList gets shorter, so changing user_id of a tweet after
+        a lookup leaves the index stale. Create a new collection for
+        the changed tweets in this case.
         """
-        # join tweet texts with space in one string
-        # it will access each tweets text attribute
-        # of the tweetList
-        totalText = ' '.join(tweet.text for tweet in self.tweetList)
+        if (
+            self._userIndex is None or
+            self._indexedCount > len(self.tweetList)
+        ):
+            # tweetList was replaced or shortened, build from scratch
+            self._userIndex = {}
+            self._indexedCount = 0
+        if self._indexedCount < len(self.tweetList):
+            self._update_user_index()
+
+        return self._userIndex
+
+    def _update_user_index(
+        self,
+    ):
+        """
+        Add tweets not yet covered by the user index.
+        """
+        userIndex = self._userIndex
+        for row in range(self._indexedCount, len(self.tweetList)):
+            userID = self.tweetList[row].user_id
+            rowList = userIndex.get(userID)
+            if rowList is None:
+                userIndex[userID] = [row]
+            else:
+                rowList.append(row)
+        self._indexedCount = len(self.tweetList)
 
-        return totalText
+        return
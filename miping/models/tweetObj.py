@@ -3,6 +3,20 @@ class TweetObj:
     Data model for Tweets
     """
 
+    # no per-instance dict for the common attributes, so many tweets
+    # need less memory. 'lang' and 'is_quote_status' are the usual
+    # additional attributes (see config), others are stored in __dict__
+    __slots__ = (
+        'id_str',
+        'created_at',
+        'user_id',
+        'isRetweet',
+        'text',
+        'lang',
+        'is_quote_status',
+        '__dict__',
+    )
+
     def __str__(
         self
     ):
@@ -3,6 +3,15 @@ class User:
     Data model class for user objects.
     """
 
+    # no per-instance dict, so many users need less memory
+    __slots__ = (
+        'id_str',
+        'screen_name',
+        'followers',
+        'tweet_count',
+        'location',
+    )
+
     def __str__(
         self
     ):
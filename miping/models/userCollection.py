@@ -1,5 +1,6 @@
 import csv
 from .user import User
+from .columnarFile import ColumnarFile
 
 
 class UserCollection:
@@ -31,21 +32,43 @@ class UserCollection:
     def write_user_list_file(
         self,
         full_path='userlist.csv',
-        ids_only=False
+        ids_only=False,
+        append=False,
     ):
         """
         Export userlist to CSV file.
 
+        If full_path ends with '.parquet', a Parquet file is written
+        instead, see write_user_list_parquet.
+
         Parameters
         ----------
         full_path : string, default='userlist.csv'
             Full path for export file.
         ids_only : boolean, default=False
             If True, will export only user ids.
+        append : boolean, default=False
+            If True, users are appended to the CSV file, so it can be
+            written batch by batch without keeping all users.
         """
+        if ColumnarFile.is_columnar_path(full_path):
+            if append is True:
+                raise ValueError("Parquet files cannot be appended.")
+            self.write_user_list_parquet(
+                full_path=full_path,
+                ids_only=ids_only
+            )
+            return
+
+        if append is True:
+            fileMode = "a"
+        else:
+            fileMode = "w"
 
         # write output csv file
-        with open(full_path, "w", newline='', encoding='utf-8') as outfile:
+        with open(
+            full_path, fileMode, newline='', encoding='utf-8'
+        ) as outfile:
             # initialize csv writer
             writer = csv.writer(
                 outfile,
@@ -77,6 +100,10 @@ class UserCollection:
         """
         Import userlist from CSV file.
 
+        If full_path ends with '.parquet', a Parquet file is read
+        instead. To process large files in batches use
+        iter_user_list_file.
+
         Parameters
         ----------
         full_path : string, default='userlist.csv'
@@ -84,6 +111,53 @@ class UserCollection:
         ids_only : boolean, default=False
             If True, will import only user ids.
         """
+        for batchCol in self.iter_user_list_file(
+            full_path=full_path,
+            ids_only=ids_only
+        ):
+            self.userList.extend(batchCol.userList)
+
+        return
+
+    def iter_user_list_file(
+        self,
+        full_path='userlist.csv',
+        ids_only=False,
+        batchSize=10000,
+    ):
+        """
+        Read users from CSV (or Parquet) file in batches.
+
+        Only one batch is kept in memory at a time. Users are not
+        added to this collection, each batch is a new UserCollection.
+
+        Parameters
+        ----------
+        full_path : string, default='userlist.csv'
+            Full path for import file.
+        ids_only : boolean, default=False
+            If True, will import only user ids.
+        batchSize : integer, default=10000
+            Maximum number of users per batch.
+
+        Yields
+        ------
+        batchCol : UserCollection
+            Collection with the next users of the file.
+        """
+        if ColumnarFile.is_columnar_path(full_path):
+            columns = None
+            if ids_only is True:
+                columns = ['id_str']
+            for table in ColumnarFile.iter_columns(
+                full_path=full_path,
+                columns=columns,
+                batchSize=batchSize
+            ):
+                batchCol = UserCollection()
+                batchCol._add_users_from_table(table)
+                yield batchCol
+            return
 
         # read csv file
         with open(full_path, "r", newline='', encoding='utf-8') as infile:
@@ -94,6 +168,7 @@ class UserCollection:
                 quotechar='"',
                 quoting=csv.QUOTE_MINIMAL
             )
+            batchCol = UserCollection()
             for row in reader:
                 # convert to custom user object
                 userInstance = User()
@@ -106,8 +181,112 @@ class UserCollection:
                     userInstance.tweet_count = row[3]
                     userInstance.location = row[4]
 
-                # add user to collection
-                self.funcAddUser(userInstance)
+                # add user to batch
+                batchCol.funcAddUser(userInstance)
+                if len(batchCol.userList) >= batchSize:
+                    yield batchCol
+                    batchCol = UserCollection()
+
+            if len(batchCol.userList) > 0:
+                yield batchCol
+
+    def write_user_list_parquet(
+        self,
+        full_path='userlist.parquet',
+        ids_only=False,
+    ):
+        """
+        Export userlist to Parquet file (requires pyarrow).
+
+        Columns are the same as in the CSV file, followers and
+        tweet_count are stored as integers. They are read as strings
+        again, like from CSV.
+
+        Parameters
+        ----------
+        full_path : string, default='userlist.parquet'
+            Full path for export file.
+        ids_only : boolean, default=False
+            If True, will export only user ids.
+        """
+        columnNames = ['id_str']
+        if ids_only is False:
+            columnNames.extend(
+                ['screen_name', 'followers', 'tweet_count', 'location']
+            )
+
+        columnList = []
+        for attr in columnNames:
+            values = [getattr(user, attr) for user in self.userList]
+            if attr in ('followers', 'tweet_count'):
+                columnList.append(
+                    (attr, 'int64', ColumnarFile.to_int_list(values))
+                )
+            else:
+                columnList.append(
+                    (attr, 'string', ColumnarFile.to_string_list(values))
+                )
+
+        ColumnarFile.write_columns(
+            full_path=full_path,
+            columnList=columnList
+        )
+
+        return
+
+    def read_user_list_parquet(
+        self,
+        full_path='userlist.parquet',
+        columns=None,
+    ):
+        """
+        Import userlist from Parquet file.
+
+        Only the given columns are read, attributes of columns
+        not read are None.
+
+        Parameters
+        ----------
+        full_path : string, default='userlist.parquet'
+            Full path for import file.
+        columns : list, default=None
+            Names of attributes to read, all if None.
+        """
+        table = ColumnarFile.read_columns(
+            full_path=full_path,
+            columns=columns
+        )
+        self._add_users_from_table(table)
+
+        return
+
+    def _add_users_from_table(
+        self,
+        table,
+    ):
+        """
+        Add a user object for each row of pyarrow table.
+
+        Values are converted to the strings read from CSV, so
+        followers is '12' (not 12) and missing values are ''.
+        """
+        columnDict = {
+            attr: ColumnarFile.to_csv_value_list(
+                table.column(attr).to_pylist()
+            )
+            for attr in User.__slots__
+            if attr in table.column_names
+        }
+
+        for row in range(table.num_rows):
+            userInstance = User()
+            for attr, values in columnDict.items():
+                setattr(userInstance, attr, values[row])
+
+            # add user to collection
+            self.funcAddUser(userInstance)
+
+        return
 
     def get_id_list(
         self,
@@ -1,4 +1,8 @@
 import os
+import onnx
+
+from ..models.modelBase import ModelBase
+from ..models.gloveOnnxModel import GloVeOnnxModel
 
 
 class TrainedModels:
@@ -30,6 +34,8 @@ class TrainedModels:
             },
             ...
         }
+        The bundle containing all dimensions in one ONNX graph is
+        saved under /miping/trainedModels/glovebig5_bundle.ONNX.
         """
 
         # identify current directory
@@ -54,6 +60,12 @@ class TrainedModels:
                 ('glove' + str(dimension) + '.pickle')
             )
 
+        # single file with all dimensions
+        self.bundle_file_path = os.path.join(
+            directory,
+            'glovebig5_bundle.ONNX'
+        )
+
         return
 
     def get_file_path_dict(
@@ -64,3 +76,105 @@ class TrainedModels:
         """
 
         return self.file_path_dict
+
+    def get_bundle_file_path(
+        self,
+    ):
+        """
+        Get precalculated path of ONNX bundle file.
+        """
+
+        return self.bundle_file_path
+
+    def build_onnx_bundle(
+        self,
+        path=None,
+    ):
+        """
+        Merge the single ONNX models of each dimension into one bundle
+        and save it.
+
+        The bundle has the same input as the single models and one
+        output per Big Five dimension, named after the dimension.
+        Has to be called again after the single models changed,
+        otherwise ModelApplication ignores the outdated bundle.
+
+        Parameters
+        ----------
+        path : string, default=None
+            Export path. If None, bundle_file_path is used.
+
+        Returns
+        -------
+        bundle : onnx.ModelProto
+            Merged ONNX model.
+        """
+        if path is None:
+            path = self.bundle_file_path
+
+        bundle = ModelBase.exportONNXBundleFromFiles(
+            pathDict=self.get_onnx_path_dict(),
+            path=path,
+        )
+
+        return bundle
+
+    def get_onnx_path_dict(
+        self,
+    ):
+        """
+        Get paths of single ONNX models with dimension as key.
+        """
+
+        return {
+            dimension: self.file_path_dict[dimension]['onnx']
+            for dimension in self.big5List
+        }
+
+    def build_end_to_end_onnx(
+        self,
+        glove,
+        path,
+    ):
+        """
+        Build end-to-end ONNX model from token ids to Big Five scores.
+
+        The GloVe matrix is embedded in the graph in front of the
+        bundle. If the bundle does not exist yet, it is built from the
+        single models first. Vocabulary is saved to path + '.vocab'.
+
+        Parameters
+        ----------
+        glove : GloVe, default=None, required
+            Initialized GloVe interface, source of the GloVe matrix.
+        path : string, default=None, required
+            Export path, e.g. 'data/glove/glovebig5_end_to_end.ONNX'.
+            The file is as large as the GloVe matrix, so it is not saved
+            inside the miping module.
+
+        Returns
+        -------
+        model : onnx.ModelProto
+            End-to-end ONNX model.
+        """
+        if (
+            os.path.exists(self.bundle_file_path) and
+            ModelBase.isONNXBundleCurrent(
+                self.bundle_file_path,
+                self.get_onnx_path_dict()
+            )
+        ):
+            bundle = onnx.load(self.bundle_file_path)
+        else:
+            bundle = self.build_onnx_bundle()
+
+        wordList, gloveMatrix = glove.getGloVeMatrix()
+
+        model = GloVeOnnxModel.exportEndToEndONNX(
+            bundle=bundle,
+            wordList=wordList,
+            gloveMatrix=gloveMatrix,
+            path=path,
+        )
+
+        return model
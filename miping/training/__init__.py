@@ -1,4 +1,6 @@
 from .dataPreparation import DataPreparation
 from .features import Features
+from .featureCache import FeatureCache
+from .featureStore import FeatureStore
 from .modelTraining import ModelTraining
 from .noGloveValueError import NoGloveValueError
\ No newline at end of file
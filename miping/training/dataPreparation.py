@@ -1,5 +1,35 @@
+import os
 import re
 
+from multiprocessing import Pool
+
+
+# patterns are compiled once, see DataPreparation.clean_text
+# for what they remove
+_httpPattern = re.compile(
+    (
+        r'https?:\/\/(www\.)?[-a-zA-Z0–9@:%._\+~#=]' +
+        r'{1,256}\.[a-z]{2,6}' +
+        r'\b([-a-zA-Z0–9@:%_\+.~#?&//=]*)\S+'
+    ),
+    re.MULTILINE
+)
+_urlPattern = re.compile(
+    (
+        r'[-a-zA-Z0–9@:%._\+~#=]{1,256}\.[a-z]{2,6}' +
+        r'\b([-a-zA-Z0–9@:%_\+.~#?&//=]*)\S+'
+    ),
+    re.MULTILINE
+)
+_mentionPattern = re.compile(r'\s@\S+')
+_multiSpacePattern = re.compile(r'\s{2,}')
+# splits like collapsing spaces followed by split(' ')
+_tokenSplitPattern = re.compile(r'\s{2,}| ')
+
+# punctuations excluding @ and # (the range )-[ includes
+# digits, upper case letters and @ as well)
+_punctuationPattern = re.compile(r'([!()-[\]{};:+\'"\,<>./?$%^&*_~])')
+
 
 class DataPreparation:
     """
@@ -36,29 +66,91 @@ class DataPreparation:
             Cleaned text.
         """
 
+        textString = self._pad_text(textString)
+
+        # remove succeeding spaces, so always only one space
+        return _multiSpacePattern.sub(' ', textString)
+
+    def tokenize_text(
+        self,
+        textString,
+    ):
+        """
+        Apply data cleansing and return tokens.
+
+        Result equals clean_text(textString).split(' '), but the
+        cleaned string is not built.
+
+        Parameters
+        ----------
+        textString : string, default=None, required
+            Text that should be cleaned.
+
+        Returns
+        -------
+        tokenList : list
+            Tokens of cleaned text.
+        """
+
+        textString = self._pad_text(textString)
+
+        # collapsing spaces and splitting in one pass
+        return _tokenSplitPattern.split(textString)
+
+    def clean_many(
+        self,
+        textList,
+        n_jobs=1,
+    ):
+        """
+        Apply clean_text to all texts in textList.
+
+        Parameters
+        ----------
+        textList : list, default=None, required
+            Texts that should be cleaned.
+        n_jobs : integer, default=1
+            Number of processes, -1 for all cores.
+
+        Returns
+        -------
+        cleanedList : list
+            Cleaned texts in order of textList.
+        """
+
+        if n_jobs < 0:
+            n_jobs = os.cpu_count()
+
+        if n_jobs > 1 and len(textList) >= 2 * n_jobs:
+            with Pool(processes=n_jobs) as pool:
+                cleanedList = pool.map(
+                    self.clean_text,
+                    textList,
+                    chunksize=max(1, len(textList) // (4 * n_jobs))
+                )
+        else:
+            cleanedList = [
+                self.clean_text(textString) for textString in textList
+            ]
+
+        return cleanedList
+
+    def _pad_text(
+        self,
+        textString,
+    ):
+        """
+        All cleaning steps of clean_text except removing
+        succeeding spaces.
+        """
+
         # set to lower case
         textString = textString.lower()
 
-        # remove URLs
-        httpPattern = re.compile(
-            (
-                r'https?:\/\/(www\.)?[-a-zA-Z0–9@:%._\+~#=]' +
-                r'{1,256}\.[a-z]{2,6}' +
-                r'\b([-a-zA-Z0–9@:%_\+.~#?&//=]*)\S+'
-            ),
-            re.MULTILINE
-        )
-        urlPattern = re.compile(
-            (
-                r'[-a-zA-Z0–9@:%._\+~#=]{1,256}\.[a-z]{2,6}' +
-                r'\b([-a-zA-Z0–9@:%_\+.~#?&//=]*)\S+'
-            ),
-            re.MULTILINE
-        )
         # to remove links that start with HTTP/HTTPS in the tweet
-        textString = re.sub(httpPattern, '', textString)
+        textString = _httpPattern.sub('', textString)
         # to remove other url links (like linkshortener URLs)
-        textString = re.sub(urlPattern, '', textString)
+        textString = _urlPattern.sub('', textString)
 
         # replace # symbol with ' # ' (space hashtag and space)
         # so we can count number of hashtags and have
@@ -68,17 +160,12 @@ class DataPreparation:
         # remove mentions
         # starts with whitespace and @
         # then include everything until next whitespace
-        textString = re.sub(r'\s@\S+', '', textString)
+        textString = _mentionPattern.sub('', textString)
 
         # add spaces around punctuations
         # helps when applying word embeddings
-        # punctuations excluding @ and #
-        textString = re.sub(
-            r'([!()-[\]{};:+\'"\,<>./?$%^&*_~])',
-            r' \1 ',
-            textString
-        )
-        # remove succeeding spaces, so always only one space
-        textString = re.sub(r'\s{2,}', ' ', textString)
+        # split keeps the punctuations, so joining with a space
+        # pads them (faster than sub with a group template)
+        textString = ' '.join(_punctuationPattern.split(textString))
 
         return textString
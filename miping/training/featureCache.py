@@ -0,0 +1,281 @@
+import time
+import sqlite3
+import hashlib
+import numpy as np
+
+
+class FeatureCache:
+    """
+    On-disk cache for calculated features of single profiles.
+
+    Entries are content-addressed: the key is a hash over the
+    pipeline name and version, a fingerprint of the used resources
+    (e.g. GloVe store) and the profile content. If one of these
+    changes, the old entry is simply not found anymore and will be
+    evicted eventually.
+    Entries are saved in a SQLite database. If the total size
+    exceeds maxBytes, least recently used entries are deleted.
+    """
+
+    # sqlite limit for variables per statement is 999 in old versions
+    _chunkSize = 500
+
+    def __init__(
+        self,
+        filePath,
+        maxBytes=1024 * 1024 * 1024,
+    ):
+        """
+        Open (or create) cache database.
+
+        Parameters
+        ----------
+        filePath : string, default=None, required
+            Full path to SQLite file of the cache.
+        maxBytes : integer, default=1073741824
+            Maximum total size of cached features in bytes.
+        """
+        self.filePath = str(filePath)
+        self.maxBytes = maxBytes
+
+        # counters for cache usage
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.connection = sqlite3.connect(self.filePath)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS feature_cache (" +
+                "key TEXT PRIMARY KEY, " +
+                "features BLOB, " +
+                "dtype TEXT, " +
+                "coverage REAL, " +
+                "word_count INTEGER, " +
+                "size INTEGER, " +
+                "last_access REAL);"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS feature_cache_access " +
+                "ON feature_cache (last_access);"
+            )
+
+        return
+
+    @staticmethod
+    def create_key(
+        namespace,
+        version,
+        fingerprint,
+        content,
+    ):
+        """
+        Create cache key as hex digest over all parts.
+
+        Parameters
+        ----------
+        namespace : string, default=None, required
+            Name of feature pipeline, e.g. 'glove'.
+        version : string, default=None, required
+            Version of feature calculation, has to be changed
+            if the calculation changes.
+        fingerprint : string, default=None, required
+            Fingerprint of used resources, e.g. GloVe store.
+        content : string, default=None, required
+            Profile content the features are calculated from.
+
+        Returns
+        -------
+        key : string
+            Hex digest identifying the features.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (namespace, version, fingerprint, content):
+            digest.update(str(part).encode('utf-8'))
+            # separator, so parts cannot be shifted
+            digest.update(b'\x00')
+
+        return digest.hexdigest()
+
+    def get_many(
+        self,
+        keyList,
+    ):
+        """
+        Look up features for keys and update hit and miss counters.
+
+        Parameters
+        ----------
+        keyList : list, default=None, required
+            Keys as returned by create_key.
+
+        Returns
+        -------
+        entries : dict
+            Key as key and tuple of features (numpy.array), coverage
+            and word count as value. Only contains found keys.
+        """
+        entries = {}
+        distinctKeys = list(dict.fromkeys(keyList))
+        for start in range(0, len(distinctKeys), self._chunkSize):
+            chunk = distinctKeys[start:start + self._chunkSize]
+            cursor = self.connection.execute(
+                "SELECT key, features, dtype, coverage, word_count " +
+                "FROM feature_cache WHERE key IN (" +
+                ",".join("?" * len(chunk)) +
+                ");",
+                chunk
+            )
+            for key, blob, dtype, coverage, wordCount in cursor:
+                entries[key] = (
+                    np.frombuffer(blob, dtype=dtype),
+                    coverage,
+                    wordCount
+                )
+
+        # mark found entries as recently used
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "UPDATE feature_cache SET last_access = ? WHERE key = ?;",
+                ((now, key) for key in entries)
+            )
+
+        for key in keyList:
+            if key in entries:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return entries
+
+    def put_many(
+        self,
+        keyList,
+        featureMatrix,
+        coverageList=None,
+        wordCountList=None,
+    ):
+        """
+        Save features for keys, then evict entries if cache is too large.
+
+        Parameters
+        ----------
+        keyList : list, default=None, required
+            Keys as returned by create_key.
+        featureMatrix : numpy.array, default=None, required
+            One row of features for each key.
+        coverageList : list, default=None
+            GloVe word coverage for each key.
+        wordCountList : list, default=None
+            Word count for each key.
+        """
+        if coverageList is None:
+            coverageList = [None] * len(keyList)
+        if wordCountList is None:
+            wordCountList = [None] * len(keyList)
+
+        featureMatrix = np.ascontiguousarray(featureMatrix)
+        dtype = featureMatrix.dtype.str
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO feature_cache " +
+                "(key, features, dtype, coverage, word_count, size, " +
+                "last_access) VALUES (?, ?, ?, ?, ?, ?, ?);",
+                (
+                    (
+                        key,
+                        featureMatrix[num].tobytes(),
+                        dtype,
+                        coverageList[num],
+                        wordCountList[num],
+                        featureMatrix[num].nbytes,
+                        now,
+                    )
+                    for num, key in enumerate(keyList)
+                )
+            )
+
+        self._evict()
+
+        return
+
+    def _evict(
+        self,
+    ):
+        """
+        Delete least recently used entries until total size is
+        below maxBytes.
+        """
+        totalSize = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM feature_cache;"
+        ).fetchone()[0]
+        if totalSize <= self.maxBytes:
+            return
+
+        evictKeys = []
+        cursor = self.connection.execute(
+            "SELECT key, size FROM feature_cache ORDER BY last_access;"
+        )
+        for key, size in cursor:
+            if totalSize <= self.maxBytes:
+                break
+            evictKeys.append((key,))
+            totalSize -= size
+
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM feature_cache WHERE key = ?;",
+                evictKeys
+            )
+        self.evictions += len(evictKeys)
+
+        return
+
+    def get_statistics(
+        self,
+    ):
+        """
+        Return cache counters and current size.
+
+        Returns
+        -------
+        statistics : dict
+            hits, misses, evictions, entries and size in bytes.
+        """
+        entries, size = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM feature_cache;"
+        ).fetchone()
+        statistics = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': entries,
+            'size': size,
+        }
+
+        return statistics
+
+    def __getstate__(
+        self,
+    ):
+        """
+        Connection cannot be pickled, it's reopened after unpickling.
+        """
+        state = self.__dict__.copy()
+        del state['connection']
+
+        return state
+
+    def __setstate__(
+        self,
+        state,
+    ):
+        """
+        Reopen connection after unpickling.
+        """
+        self.__dict__.update(state)
+        self.connection = sqlite3.connect(self.filePath)
+
+        return
@@ -0,0 +1,273 @@
+import os
+import json
+import hashlib
+import numpy as np
+
+
+class FeatureStore:
+    """
+    Appendable on-disk store for calculated features of profiles.
+
+    The store is a directory with three files:
+    features.bin: raw matrix with one row per stored profile, rows are
+    only appended and read via memory map.
+    index.tsv: one line per row with userID and hash of profile text.
+    meta.json: feature type, dimension, dtype and GloVe fingerprint.
+    If a profile is stored again (e.g. changed text), a new row is
+    appended and the index points to the latest row.
+    """
+
+    def __init__(
+        self,
+        directory,
+        featureType='glove',
+        dim=900,
+        dtype='float32',
+    ):
+        """
+        Open store in directory, create it if it does not exist.
+
+        An exception is raised if an existing store has a different
+        feature type, dimension or dtype.
+
+        Parameters
+        ----------
+        directory : string, default=None, required
+            Directory of the store.
+        featureType : string, default='glove'
+            Type of features.
+        dim : integer, default=900
+            Dimension of features.
+        dtype : string, default='float32'
+            Type of feature values.
+        """
+        self.directory = str(directory)
+        self.featurePath = os.path.join(self.directory, 'features.bin')
+        self.indexPath = os.path.join(self.directory, 'index.tsv')
+        self.metaPath = os.path.join(self.directory, 'meta.json')
+
+        if os.path.exists(self.metaPath) is False:
+            os.makedirs(self.directory, exist_ok=True)
+            self.meta = {
+                'featureType': featureType,
+                'dim': dim,
+                'dtype': dtype,
+                'gloveFingerprint': '',
+            }
+            self._write_meta()
+            # create empty files
+            open(self.featurePath, 'wb').close()
+            open(self.indexPath, 'w', encoding='utf-8').close()
+        else:
+            with open(self.metaPath, 'r', encoding='utf-8') as infile:
+                self.meta = json.load(infile)
+
+            requested = {
+                'featureType': featureType,
+                'dim': dim,
+                'dtype': np.dtype(dtype).name,
+            }
+            for key, value in requested.items():
+                storedValue = self.meta[key]
+                if key == 'dtype':
+                    storedValue = np.dtype(storedValue).name
+                if storedValue != value:
+                    eString = (
+                        "Feature store " +
+                        self.directory +
+                        " has " +
+                        key +
+                        " " +
+                        str(self.meta[key]) +
+                        ", but " +
+                        str(value) +
+                        " was requested."
+                    )
+                    raise Exception(eString)
+
+        self.dim = self.meta['dim']
+        self.dtype = np.dtype(self.meta['dtype'])
+
+        # userID to (row, content hash), latest row wins
+        self.index = {}
+        self.rowCount = 0
+        with open(
+            self.indexPath, 'r', newline='\n', encoding='utf-8'
+        ) as infile:
+            for line in infile:
+                userID, contentHash = line.rstrip('\n').split('\t')
+                self.index[userID] = (self.rowCount, contentHash)
+                self.rowCount += 1
+
+        # opened on first read
+        self._matrix = None
+
+        return
+
+    def __len__(
+        self,
+    ):
+        """
+        Number of stored profiles.
+        """
+        return len(self.index)
+
+    @staticmethod
+    def get_content_hash(
+        profile,
+    ):
+        """
+        Return hash of profile text, to recognize changed profiles.
+        """
+        digest = hashlib.blake2b(
+            profile.text.encode('utf-8'),
+            digest_size=16
+        )
+
+        return digest.hexdigest()
+
+    def check_fingerprint(
+        self,
+        fingerprint,
+    ):
+        """
+        Check that stored features were calculated with same GloVe.
+
+        A store without fingerprint (e.g. imported from old .npy file)
+        adopts the passed one.
+
+        Parameters
+        ----------
+        fingerprint : string, default=None, required
+            Fingerprint as returned by GloVe.get_fingerprint.
+        """
+        if self.meta['gloveFingerprint'] == '':
+            self.meta['gloveFingerprint'] = fingerprint
+            self._write_meta()
+        elif self.meta['gloveFingerprint'] != fingerprint:
+            eString = (
+                "Feature store " +
+                self.directory +
+                " was calculated with different GloVe file."
+            )
+            raise Exception(eString)
+
+        return
+
+    def get_missing_profiles(
+        self,
+        profileList,
+    ):
+        """
+        Return profiles which are not stored or whose text changed.
+
+        Parameters
+        ----------
+        profileList : list, default=None, required
+            Profiles to check.
+
+        Returns
+        -------
+        missingProfiles : list
+            Profiles which need feature calculation.
+        """
+        missingProfiles = []
+        for profile in profileList:
+            entry = self.index.get(str(profile.userID))
+            if (
+                entry is None or
+                entry[1] != self.get_content_hash(profile)
+            ):
+                missingProfiles.append(profile)
+
+        return missingProfiles
+
+    def append(
+        self,
+        profileList,
+        featureMatrix,
+    ):
+        """
+        Append features of profiles to the store.
+
+        Parameters
+        ----------
+        profileList : list, default=None, required
+            Profiles the features belong to.
+        featureMatrix : numpy.array, default=None, required
+            One row of features for each profile.
+        """
+        featureMatrix = np.ascontiguousarray(featureMatrix, dtype=self.dtype)
+        if featureMatrix.shape != (len(profileList), self.dim):
+            raise ValueError("Feature shape does not match store.")
+
+        rowBytes = self.dim * self.dtype.itemsize
+        with open(self.featurePath, 'r+b') as outfile:
+            # drop rows of an interrupted append, index defines rows
+            outfile.truncate(self.rowCount * rowBytes)
+            outfile.seek(0, os.SEEK_END)
+            outfile.write(featureMatrix.tobytes())
+
+        # index is written last, so rows exist before they are referenced
+        lines = []
+        for profile in profileList:
+            userID = str(profile.userID)
+            contentHash = self.get_content_hash(profile)
+            self.index[userID] = (self.rowCount, contentHash)
+            self.rowCount += 1
+            lines.append(userID + '\t' + contentHash + '\n')
+        with open(
+            self.indexPath, 'a', newline='\n', encoding='utf-8'
+        ) as outfile:
+            outfile.write(''.join(lines))
+
+        # matrix has to be mapped again
+        self._matrix = None
+
+        return
+
+    def get_features(
+        self,
+        userIDList,
+    ):
+        """
+        Read features for userIDs, only those rows are loaded.
+
+        Parameters
+        ----------
+        userIDList : list, default=None, required
+            UserIDs to get features for, all must be stored.
+
+        Returns
+        -------
+        features : numpy.array
+            One row of features for each userID.
+        """
+        rows = np.fromiter(
+            (self.index[str(userID)][0] for userID in userIDList),
+            dtype=np.int64,
+            count=len(userIDList)
+        )
+        if len(rows) == 0:
+            return np.empty((0, self.dim), dtype=self.dtype)
+
+        if self._matrix is None:
+            self._matrix = np.memmap(
+                self.featurePath,
+                dtype=self.dtype,
+                mode='r',
+                shape=(self.rowCount, self.dim)
+            )
+
+        return self._matrix[rows]
+
+    def _write_meta(
+        self,
+    ):
+        """
+        Save metadata as json.
+        """
+        with open(self.metaPath, 'w', encoding='utf-8') as outfile:
+            json.dump(self.meta, outfile, indent=4)
+
+        return
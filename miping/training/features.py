@@ -1,5 +1,9 @@
+import os
+import tempfile
 import numpy as np
 
+from multiprocessing import Pool
+
 from sklearn.preprocessing import FunctionTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.pipeline import FeatureUnion
@@ -9,6 +13,7 @@ from ..models.profile import Profile
 from ..interfaces.helper import Helper
 from ..interfaces.glove import GloVe
 from .noGloveValueError import NoGloveValueError
+from .featureCache import FeatureCache
 
 
 class Features:
@@ -16,9 +21,22 @@ class Features:
     Contains all pipeline functions for both LIWC and glove.
     """
 
+    # version of GloVe feature calculation for FeatureCache keys
+    # must be increased if the calculation changes
+    gloveFeatureVersion = '1'
+
+    # set in worker processes of parallel GloVe featurization
+    _workerVectors = None
+    _workerWordRows = None
+
     def __init__(
         self,
     ):
+        # number of processes for GloVe featurization
+        self.n_jobs = 1
+        # optional FeatureCache, see createGloVeFeaturePipeline
+        self.featureCache = None
+
         return
 
     def featureLIWC(
@@ -29,35 +47,59 @@ class Features:
         Extract LIWC features (namely LIWC categories) from
         each profile in list as feature.
 
+        Preferably a LIWC matrix as returned by
+        ProfileCollection.get_liwc_matrix is passed, it is used
+        without copying.
+
         Parameters
         ----------
-        profileCol : list, default=None, required
-            List with profiles to generate features for.
+        profileCol : numpy.array or list, default=None, required
+            LIWC matrix or list with profiles to generate features for.
 
         Returns
         -------
-        np.array(outputList) : numpy.array
-            Generated features in numpy format.
+        liwcMatrix : numpy.array
+            Generated features in numpy format (float32).
         """
-        # will contain the LIWC measures for each profile
-        outputList = []
+        liwcMatrix = self.getLIWCMatrix(profileCol)
+
+        if np.isnan(liwcMatrix).any():
+            raise ValueError(
+                "LIWC features require LIWC values for all profiles."
+            )
+
+        # categories are the features, numpy format as scikit needs it
+        return liwcMatrix
+
+    def getLIWCMatrix(
+        self,
+        profileCol,
+    ):
+        """
+        Return LIWC categories as float32 matrix.
 
-        # loop over profileCollection
-        for profile in profileCol:
-            # create row
-            liwc_data = []
-            # get names of liwc categories
-            for attrName in Profile.liwc_category_list:
-                # get value of current category
-                attr = getattr(profile, attrName)
-                # append to current profile
-                # and convert to float
-                liwc_data.append(np.float(attr))
+        Parameters
+        ----------
+        profileCol : numpy.array or list, default=None, required
+            LIWC matrix (returned as is) or list of profiles.
 
-            outputList.append(liwc_data)
+        Returns
+        -------
+        liwcMatrix : numpy.array
+            One row of LIWC categories for each profile.
+        """
+        if isinstance(profileCol, np.ndarray):
+            # no copy if already float32
+            return profileCol.astype(np.float32, copy=False)
 
-        # create numpy array, as scikit needs this format
-        return np.array(outputList)
+        liwcMatrix = np.empty(
+            (len(profileCol), len(Profile.liwc_category_list)),
+            dtype=np.float32
+        )
+        for num, profile in enumerate(profileCol):
+            liwcMatrix[num] = profile.get_liwc_values()
+
+        return liwcMatrix
 
     def createLIWCFeaturePipeline(
         self,
@@ -67,6 +109,12 @@ class Features:
         this is just a blueprint for calculating the features
         no features are calculated yet!
 
+        The pipeline should be called with the LIWC matrix of a
+        ProfileCollection (get_liwc_matrix), a list of profiles
+        works as well.
+        LIWC features are the LIWC values themselves, so they
+        are not cached.
+
         Returns
         -------
         featurePipeline : Pipeline
@@ -79,14 +127,11 @@ class Features:
         # extract features
         liwc_Trans = FunctionTransformer(self.featureLIWC, validate=False)
 
-        # Combine feature(s) with FeatureUnion
-        featureTransformer = FeatureUnion([
-                                ('liwc', liwc_Trans),
-                                ], n_jobs=-1)  # parallelize via multiprocess
-
-        # combine into a pipeline including scaling
+        # LIWC is the only feature, so no FeatureUnion is needed.
+        # This way the LIWC matrix reaches the scaler without copy
+        # and it is not sent to other processes.
         featurePipeline = Pipeline([
-                ('features', featureTransformer),
+                ('features', liwc_Trans),
                 ("stdScaler", StandardScaler())
         ])
 
@@ -94,35 +139,148 @@ class Features:
 
     def _condenseGloVeVectors(
         self,
-        vectorList,
+        vectorBlocks,
+        outputRow,
     ):
         """
-        For each user a vectorList is passed in with different length.
-        This will be condensed into a single 900 dim vector.
+        For each user the GloVe vectors are passed in as blocks.
+        They are condensed into a single 900 dim vector
+        (mean, max, min of each dimension) written into outputRow.
+
+        Running sum, maximum and minimum are kept in preallocated
+        buffers, so memory does not grow with the number of words.
+
+        Parameters
+        ----------
+        vectorBlocks : iterable, default=None, required
+            Float32 arrays of shape (x, 300).
+        outputRow : numpy.array, default=None, required
+            900 dim row of the feature matrix to write into.
+
+        Returns
+        -------
+        count : integer
+            Number of vectors condensed.
+        """
+        dim = outputRow.shape[0] // 3
+        # sum in float64 to avoid drift for users with many words
+        sumVector = np.zeros(dim, dtype=np.float64)
+        maxVector = outputRow[dim:2 * dim]
+        minVector = outputRow[2 * dim:]
+        maxVector.fill(-np.inf)
+        minVector.fill(np.inf)
+        count = 0
+
+        for block in vectorBlocks:
+            sumVector += block.sum(axis=0, dtype=np.float64)
+            np.maximum(maxVector, block.max(axis=0), out=maxVector)
+            np.minimum(minVector, block.min(axis=0), out=minVector)
+            count += block.shape[0]
+
+        outputRow[:dim] = sumVector / count
+
+        return count
+
+    def _poolGloVeSegments(
+        self,
+        vectors,
+        profileRows,
+        outputMatrix,
+        blockSize=65536,
+        showProgress=True,
+    ):
         """
+        Condense the vectors of all profiles into outputMatrix.
 
-        # convert to np array for mean,max,min functions
-        vectorList = np.array(vectorList)
+        Row numbers of consecutive profiles are concatenated until
+        blockSize rows are reached, gathered once and reduced per
+        profile on its slice of the block (mean, max, min).
+        Profiles with more than blockSize rows are condensed alone
+        by _condenseGloVeVectors.
 
-        # correct structure from (1,x,300) to (x,300)
-        vectorList = vectorList[0]
+        Parameters
+        ----------
+        vectors : numpy.array, default=None, required
+            Float32 matrix with distinct GloVe vectors.
+        profileRows : list, default=None, required
+            For each profile a non-empty int64 array of rows in vectors.
+        outputMatrix : numpy.array, default=None, required
+            Matrix with one 900 dim row per profile to write into.
+        blockSize : integer, default=65536
+            Maximum number of gathered vectors at once.
+        showProgress : boolean, default=True
+            If True print progress bar.
+        """
+        dim = vectors.shape[1]
+        numProfiles = len(profileRows)
 
-        # for each dimension identify mean,max,min
-        # and save in separate vector
-        meanVector = vectorList.mean(axis=0)
-        maxVector = np.amax(a=vectorList, axis=0)
-        minVector = np.amin(a=vectorList, axis=0)
+        # initialize progress bar
+        helper = Helper()
+        if showProgress is True:
+            helper.printProgressBar(
+                0,
+                numProfiles,
+                prefix='Progress:',
+                suffix='Complete',
+                length=50
+            )
 
-        # combine all 300 dim vectors in 900 dim vector
-        returnVector = []
-        returnVector.extend(meanVector)
-        returnVector.extend(maxVector)
-        returnVector.extend(minVector)
+        chunkStart = 0
+        while chunkStart < numProfiles:
+            rows = profileRows[chunkStart]
+            if len(rows) > blockSize:
+                # long profile is streamed block by block
+                self._condenseGloVeVectors(
+                    vectorBlocks=(
+                        vectors[rows[start:start + blockSize]]
+                        for start in range(0, len(rows), blockSize)
+                    ),
+                    outputRow=outputMatrix[chunkStart]
+                )
+                chunkEnd = chunkStart + 1
+            else:
+                # add profiles as long as block is not full
+                chunkEnd = chunkStart + 1
+                chunkSize = len(rows)
+                while (
+                    chunkEnd < numProfiles and
+                    chunkSize + len(profileRows[chunkEnd]) <= blockSize
+                ):
+                    chunkSize += len(profileRows[chunkEnd])
+                    chunkEnd += 1
+
+                chunkRows = profileRows[chunkStart:chunkEnd]
+                lengths = np.array([len(rows) for rows in chunkRows])
+                # first row of each profile in gathered block
+                offsets = np.zeros(len(lengths), dtype=np.int64)
+                offsets[1:] = np.cumsum(lengths[:-1])
+
+                block = vectors[np.concatenate(chunkRows)]
+                output = outputMatrix[chunkStart:chunkEnd]
+                # reductions on contiguous slices are much faster
+                # than reduceat along axis 0
+                for num, (offset, length) in enumerate(zip(offsets, lengths)):
+                    segment = block[offset:offset + length]
+                    # sum in float64 as in _condenseGloVeVectors
+                    output[num, :dim] = segment.sum(
+                        axis=0, dtype=np.float64
+                    ) / length
+                    output[num, dim:2 * dim] = segment.max(axis=0)
+                    output[num, 2 * dim:] = segment.min(axis=0)
+
+            chunkStart = chunkEnd
 
-        # convert to numpy array for scikit
-        returnVector = np.array(returnVector)
+            # Update Progress Bar
+            if showProgress is True:
+                helper.printProgressBar(
+                    chunkStart,
+                    numProfiles,
+                    prefix='Progress:',
+                    suffix='Complete',
+                    length=50
+                )
 
-        return returnVector
+        return
 
     def featureGloVe(
         self,
@@ -131,12 +289,50 @@ class Features:
         """
         For each profile in profile list generate GloVe features.
 
+        Used by the GloVe feature pipeline. Features are calculated by
+        featureGloVeWithStatistics. The word coverageStatistics and
+        wordCounts for each user are saved in this feature object
+        instance to be retrieved later. If one Features object is used
+        by several threads, call featureGloVeWithStatistics instead.
+
+        Parameters
+        ----------
+        profileList : list, default=None, required
+            List containing relevant profiles for which to extract features.
+
+        Returns
+        -------
+        outputMatrix : numpy.array
+            Float32 features with one 900 dim row per profile.
+        """
+        outputMatrix, coverageStatistics, wordCounts = (
+            self.featureGloVeWithStatistics(profileList)
+        )
+
+        # save coverage statistics in class attribute to be accessible
+        self.coverageStatistics = coverageStatistics
+        self.wordCounts = wordCounts
+
+        # numpy array, as scikit needs this format
+        return outputMatrix
+
+    def featureGloVeWithStatistics(
+        self,
+        profileList,
+    ):
+        """
+        For each profile in profile list generate GloVe features and
+        return them together with the word statistics.
+
         Each profile contains text and for this text the glove vectors
         are retrieved and condensed into one single vector for this user.
-        All user vectors are appended into the outputList.
+        All profiles are processed as one batch: the distinct words of
+        all texts are fetched once from GloVe, then each profile is
+        pooled by row numbers into this shared matrix.
+        All user vectors are written into one preallocated matrix.
 
-        The word coverageStatistics and wordCounts for each user
-        are saved in this feature object instance to be retrieved later.
+        Nothing is saved in this instance, so concurrent calls do not
+        interfere (without FeatureCache, which is not thread-safe).
 
         Parameters
         ----------
@@ -145,111 +341,366 @@ class Features:
 
         Returns
         -------
-        np.array(outputList) : numpy.array
-            Features in correct output format.
+        outputMatrix : numpy.array
+            Float32 features with one 900 dim row per profile.
+        coverageStatistics : list
+            Share of tokens with GloVe vector for each profile.
+        wordCounts : list
+            Number of tokens for each profile.
         """
 
         if self.glove is None:
             raise Exception("GloVe not loaded.")
 
-        # will contain the GloVe measures for each profile
-        outputList = []
+        if self.featureCache is not None and len(profileList) > 0:
+            # cleaned text is the content
+            fingerprint = self.glove.get_fingerprint()
+            keyList = [
+                FeatureCache.create_key(
+                    namespace='glove',
+                    version=self.gloveFeatureVersion,
+                    fingerprint=fingerprint,
+                    content=profile.text
+                )
+                for profile in profileList
+            ]
+            return self._featuresWithCache(
+                profileList=profileList,
+                keyList=keyList,
+                featureFunction=self._featureGloVeProfiles
+            )
 
-        # get index as list, for faster lookup
-        index_as_list = self.glove.get_index_list()
+        return self._featureGloVeProfiles(profileList)
 
-        # initialize progress bar
-        helper = Helper()
-        numProfiles = len(profileList)
-        helper.printProgressBar(
-            0,
-            numProfiles,
-            prefix='Progress:',
-            suffix='Complete',
-            length=50
+    def _featureGloVeProfiles(
+        self,
+        profileList,
+    ):
+        """
+        Generate GloVe features without cache, see
+        featureGloVeWithStatistics.
+        """
+        # tokenize text in tweets
+        # separated by space, tokens from tokenize_text are reused
+        profileTokens = [profile.get_tokens() for profile in profileList]
+
+        # union vocabulary of all profiles
+        # each distinct vector is fetched exactly once
+        vocabulary = dict.fromkeys(
+            token for tokens in profileTokens for token in tokens
+        )
+        foundWords, vectors = self.glove.getGloVeMatrixByWordList(
+            wordList=list(vocabulary)
         )
+        wordRows = {word: num for num, word in enumerate(foundWords)}
+
+        n_jobs = self.n_jobs
+        if n_jobs < 0:
+            n_jobs = os.cpu_count()
+        # parallel only if each process gets some profiles
+        if n_jobs > 1 and len(profileTokens) >= 2 * n_jobs:
+            outputMatrix, coverageStatistics, wordCounts = (
+                self._featureGloVeParallel(
+                    profileTokens=profileTokens,
+                    vectors=vectors,
+                    wordRows=wordRows,
+                    n_jobs=n_jobs
+                )
+            )
+        else:
+            outputMatrix, coverageStatistics, wordCounts = (
+                self._featureGloVeTokens(
+                    profileTokens=profileTokens,
+                    vectors=vectors,
+                    wordRows=wordRows
+                )
+            )
+
+        return outputMatrix, coverageStatistics, wordCounts
+
+    def _featureGloVeTokens(
+        self,
+        profileTokens,
+        vectors,
+        wordRows,
+        showProgress=True,
+    ):
+        """
+        Generate GloVe features for tokenized profiles.
 
+        Parameters
+        ----------
+        profileTokens : list, default=None, required
+            Tokens for each profile.
+        vectors : numpy.array, default=None, required
+            Float32 matrix with distinct GloVe vectors.
+        wordRows : dict, default=None, required
+            Word as key and row in vectors as value.
+        showProgress : boolean, default=True
+            If True print progress bar.
+
+        Returns
+        -------
+        outputMatrix : numpy.array
+            Float32 features with one 900 dim row per profile.
+        coverageStatistics : list
+            Share of tokens with GloVe vector for each profile.
+        wordCounts : list
+            Number of tokens for each profile.
+        """
         # list for saving coverage statistics
         coverageStatistics = []
         # word count, that are included, for profiles
         wordCounts = []
+        # rows in vectors for each profile
+        profileRows = []
 
-        # loop over profileList
-        for num, profile in enumerate(profileList):
-            # tokenize text in tweets
-            # separated by space
-            tokens = profile.text.split(' ')
-
-            profile_vectors = []
-
+        for tokens in profileTokens:
             # for each word lookup glove vector
             # if no match -> ignore it
-            # first identify set of words not in glove
-            not_in_glove = set(np.setdiff1d(tokens, index_as_list))
-
-            # get words in glove, indcluding duplicates
-            # so if words exist n times in text, they will be n times in list
-            in_glove = [word for word in tokens if word not in not_in_glove]
+            # duplicates are kept, so if words exist n times in text,
+            # they will be n times in rows
+            rows = np.fromiter(
+                (wordRows[word] for word in tokens if word in wordRows),
+                dtype=np.int64
+            )
 
-            if len(in_glove) == 0:
+            if len(rows) == 0:
                 # es konnte kein wort in glove gefunden werden
                 # raise Exception
                 eString = (
                     "Could not find any glove values for given words"
                 )
                 raise NoGloveValueError(eString)
-            else:
-                # mind. ein Wort wurde gefunden
-                # lookup glove vectors
-                # should return duplicates!
-                glove_values = self.glove.getGloVeByWordList(
-                    wordList=in_glove
-                )
-                converted_vals = np.array(glove_values)
-                # add vectors to list of this profile's vectors
-                profile_vectors.append(converted_vals)
 
-                # fill coverage statistics as share of tokens (=words)
-                # that exist in glove in comparison to total tokens
-                profile_coverage = len(converted_vals) / len(tokens)
-                # add to global list
-                coverageStatistics.append(profile_coverage)
-                wordCounts.append(len(tokens))
+            profileRows.append(rows)
+            # fill coverage statistics as share of tokens (=words)
+            # that exist in glove in comparison to total tokens
+            coverageStatistics.append(len(rows) / len(tokens))
+            wordCounts.append(len(tokens))
 
-                # after all vectors for this profile are retrieved
-                # condense with maximum, minimum, average in 900 dim vector
-                final_vector = self._condenseGloVeVectors(profile_vectors)
+        # will contain the GloVe measures for each profile
+        # one 900 dim row per profile, filled in place
+        outputMatrix = np.empty(
+            (len(profileTokens), 3 * vectors.shape[1]),
+            dtype=np.float32
+        )
+        # condense with maximum, minimum, average in 900 dim vector
+        self._poolGloVeSegments(
+            vectors=vectors,
+            profileRows=profileRows,
+            outputMatrix=outputMatrix,
+            showProgress=showProgress
+        )
 
-                # add 900 dim to output list
-                outputList.append(final_vector)
+        return outputMatrix, coverageStatistics, wordCounts
 
-            # Update Progress Bar
-            helper.printProgressBar(
-                num + 1,
-                numProfiles,
-                prefix='Progress:',
-                suffix='Complete',
-                length=50
+    def _featureGloVeParallel(
+        self,
+        profileTokens,
+        vectors,
+        wordRows,
+        n_jobs,
+    ):
+        """
+        Generate GloVe features for tokenized profiles in n_jobs
+        processes.
+
+        The vectors are written once to a temporary .npy file, which
+        every worker opens read-only as memory map, so the matrix is
+        shared via the page cache instead of being copied.
+        The profiles are split into chunks, results are gathered in
+        input order.
+
+        Parameters
+        ----------
+        profileTokens : list, default=None, required
+            Tokens for each profile.
+        vectors : numpy.array, default=None, required
+            Float32 matrix with distinct GloVe vectors.
+        wordRows : dict, default=None, required
+            Word as key and row in vectors as value.
+        n_jobs : integer, default=None, required
+            Number of worker processes.
+
+        Returns
+        -------
+        outputMatrix : numpy.array
+            Float32 features with one 900 dim row per profile.
+        coverageStatistics : list
+            Share of tokens with GloVe vector for each profile.
+        wordCounts : list
+            Number of tokens for each profile.
+        """
+        # several chunks per process to balance different profile sizes
+        numChunks = min(len(profileTokens), 4 * n_jobs)
+        bounds = np.linspace(0, len(profileTokens), numChunks + 1)
+        bounds = bounds.astype(np.int64)
+        chunks = [
+            profileTokens[bounds[num]:bounds[num + 1]]
+            for num in range(numChunks)
+        ]
+
+        # initialize progress bar
+        helper = Helper()
+        numProfiles = len(profileTokens)
+        helper.printProgressBar(
+            0,
+            numProfiles,
+            prefix='Progress:',
+            suffix='Complete',
+            length=50
+        )
+
+        outputList = []
+        coverageStatistics = []
+        wordCounts = []
+        with tempfile.TemporaryDirectory() as tempDir:
+            vectorPath = os.path.join(tempDir, 'vectors.npy')
+            np.save(vectorPath, vectors, allow_pickle=False)
+
+            with Pool(
+                processes=n_jobs,
+                initializer=Features._initGloVeWorker,
+                initargs=(vectorPath, wordRows)
+            ) as pool:
+                # imap keeps input order
+                for chunkResult in pool.imap(
+                    Features._featureGloVeChunk,
+                    chunks
+                ):
+                    outputList.append(chunkResult[0])
+                    coverageStatistics.extend(chunkResult[1])
+                    wordCounts.extend(chunkResult[2])
+
+                    # Update Progress Bar
+                    helper.printProgressBar(
+                        len(wordCounts),
+                        numProfiles,
+                        prefix='Progress:',
+                        suffix='Complete',
+                        length=50
+                    )
+
+        outputMatrix = np.concatenate(outputList)
+
+        return outputMatrix, coverageStatistics, wordCounts
+
+    @staticmethod
+    def _initGloVeWorker(
+        vectorPath,
+        wordRows,
+    ):
+        """
+        Open shared vectors in worker process of
+        _featureGloVeParallel.
+        """
+        Features._workerVectors = np.load(
+            vectorPath,
+            mmap_mode='r',
+            allow_pickle=False
+        )
+        Features._workerWordRows = wordRows
+
+        return
+
+    @staticmethod
+    def _featureGloVeChunk(
+        profileTokens,
+    ):
+        """
+        Generate GloVe features for one chunk in worker process of
+        _featureGloVeParallel.
+        """
+        features = Features()
+
+        return features._featureGloVeTokens(
+            profileTokens=profileTokens,
+            vectors=Features._workerVectors,
+            wordRows=Features._workerWordRows,
+            showProgress=False
+        )
+
+    def _featuresWithCache(
+        self,
+        profileList,
+        keyList,
+        featureFunction,
+    ):
+        """
+        Serve features from FeatureCache and calculate only misses.
+
+        Calculated features are saved in the cache. Coverage statistics
+        and word counts are cached next to GloVe features.
+
+        Parameters
+        ----------
+        profileList : list, default=None, required
+            Profiles to generate features for.
+        keyList : list, default=None, required
+            Cache key for each profile.
+        featureFunction : function, default=None, required
+            Feature calculation for a list of profiles without cache,
+            returns features, coverage statistics and word counts.
+
+        Returns
+        -------
+        outputMatrix : numpy.array
+            Features with one row per profile.
+        coverageStatistics : list
+            Coverage for each profile.
+        wordCounts : list
+            Word count for each profile.
+        """
+        entries = self.featureCache.get_many(keyList)
+
+        # calculate each missing key once
+        missingKeys = {}
+        for num, key in enumerate(keyList):
+            if key not in entries and key not in missingKeys:
+                missingKeys[key] = num
+
+        if len(missingKeys) > 0:
+            missingProfiles = [
+                profileList[num] for num in missingKeys.values()
+            ]
+            missingMatrix, coverageList, wordCountList = (
+                featureFunction(missingProfiles)
             )
+            self.featureCache.put_many(
+                keyList=list(missingKeys),
+                featureMatrix=missingMatrix,
+                coverageList=coverageList,
+                wordCountList=wordCountList
+            )
+            for row, key in enumerate(missingKeys):
+                entries[key] = (
+                    missingMatrix[row],
+                    coverageList[row],
+                    wordCountList[row]
+                )
 
-        # save coverage statistics in class attribute to be accessible
-        self.coverageStatistics = coverageStatistics
-        self.wordCounts = wordCounts
+        outputMatrix = np.stack([entries[key][0] for key in keyList])
+        coverageStatistics = [entries[key][1] for key in keyList]
+        wordCounts = [entries[key][2] for key in keyList]
 
-        # create numpy array, as scikit needs this format
-        return np.array(outputList)
+        return outputMatrix, coverageStatistics, wordCounts
 
     def createGloVeFeaturePipeline(
         self,
         glovePath='data/glove/glove.db',
         dataBaseMode=True,
+        n_jobs=1,
+        featureCache=None,
     ):
         """
         Create pipeline that can be passed into multiple training procceses
         this is just a blueprint for calculating the features
         no features are calculated yet!
 
-        No parallelization (n_jobs=1) due to GloVe lookup in database.
+        No parallelization in FeatureUnion (n_jobs=1) due to GloVe lookup
+        in database. Instead featureGloVe fetches the vectors once
+        and pools the profiles in n_jobs processes.
 
         Parameters
         ----------
@@ -257,6 +708,10 @@ class Features:
             Path to GloVe flat or database file.
         dataBaseMode : boolean, default=True
             If True path points to SQLite database file.
+        n_jobs : integer, default=1
+            Number of processes for featurization, -1 for all cores.
+        featureCache : FeatureCache, default=None
+            If set, features are read from and written to this cache.
 
         Returns
         -------
@@ -269,6 +724,8 @@ class Features:
             dataBaseMode=dataBaseMode,
         )
         self.glove = glove
+        self.n_jobs = n_jobs
+        self.featureCache = featureCache
 
         # Create skicit-learn compatible FunctionTransformers
         # for usage with other sklearn functions
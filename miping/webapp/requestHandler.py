@@ -89,6 +89,15 @@ class RequestHandler:
             self.config['glove_file_path'],
         )
 
+        # optional end-to-end model, same relative path logic as glove
+        onnx_end_to_end_path = None
+        if self.config.get('onnx_end_to_end_path'):
+            onnx_end_to_end_path = os.path.join(
+                directory,
+                '../../',
+                self.config['onnx_end_to_end_path'],
+            )
+
         trainedModelPaths = TrainedModels()
 
         # initialize modelApplication class
@@ -102,7 +111,9 @@ class RequestHandler:
             glove_file_path=glove_file_path,
             dataBaseMode=self.config['glove_database_mode'],
             modelPathDict=trainedModelPaths.get_file_path_dict(),
-            use_onnx_models=True
+            use_onnx_models=True,
+            onnx_bundle_path=trainedModelPaths.get_bundle_file_path(),
+            onnx_end_to_end_path=onnx_end_to_end_path
         )
 
         return
@@ -23,6 +23,9 @@ app.config['glove_file_path'] = (
 app.config['glove_database_mode'] = (
     RequestHandler.loadKey(name="glove_database_mode")
 )
+app.config['onnx_end_to_end_path'] = (
+    RequestHandler.loadKey(name="onnx_end_to_end_path")
+)
 
 
 @app.route("/test")
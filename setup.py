@@ -27,6 +27,9 @@ setuptools.setup(
     ],
     python_requires='>=3.6',
     install_requires=requirements,
+    extras_require={
+        'parquet': ['pyarrow'],
+    },
     setup_requires=['flake8'],
     package_data={
         'miping': [
@@ -0,0 +1,69 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope='session')
+def gloveFiles(tmp_path_factory):
+    """
+    Small synthetic GloVe as flat file and SQLite database
+    (one column per dimension), same values in both.
+    """
+    directory = tmp_path_factory.mktemp('glove')
+    random = np.random.RandomState(2020)
+    wordList = ['wort' + str(num) for num in range(2000)]
+    lines = [
+        word + ' ' + ' '.join('%.6f' % value for value in row)
+        for word, row in zip(
+            wordList,
+            random.normal(scale=0.3, size=(len(wordList), 300))
+        )
+    ]
+
+    filePath = directory / 'glove.txt'
+    filePath.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    dbPath = directory / 'glove.db'
+    connection = sqlite3.connect(str(dbPath))
+    with connection:
+        connection.execute(
+            'CREATE TABLE glove (words TEXT PRIMARY KEY, ' +
+            ', '.join('"' + str(num) + '" REAL' for num in range(1, 301)) +
+            ');'
+        )
+        connection.executemany(
+            'INSERT INTO glove VALUES (' + ', '.join(['?'] * 301) + ');',
+            (
+                [values[0]] + [float(value) for value in values[1:]]
+                for values in (line.split(' ') for line in lines)
+            )
+        )
+    connection.close()
+
+    return {
+        'directory': directory,
+        'file': str(filePath),
+        'db': str(dbPath),
+        'wordList': wordList,
+    }
+
+
+@pytest.fixture
+def gloveProfiles(gloveFiles):
+    """
+    Profiles with known and unknown words, duplicates included.
+    """
+    from miping.models import Profile
+
+    random = np.random.RandomState(7)
+    wordList = gloveFiles['wordList'] + ['unbekannt' + str(num)
+                                         for num in range(200)]
+    profileList = []
+    for num, numberTokens in enumerate([5, 300, 3000]):
+        tokens = random.choice(wordList, size=numberTokens)
+        profileList.append(
+            Profile(userID=str(num), text=' '.join(tokens))
+        )
+
+    return profileList
@@ -0,0 +1,122 @@
+import pytest
+
+from miping.models import Profile, ProfileCollection
+from miping.models import TweetCollection, TweetObj
+from miping.models import User, UserCollection
+
+pytest.importorskip('pyarrow')
+
+attributeList = ['lang']
+
+
+def _read_both(collectionClass, readName, tmp_path, writeFunction):
+    """
+    Write with writeFunction to CSV and Parquet and read both back.
+    """
+    collectionList = []
+    for suffix in ['.csv', '.parquet']:
+        path = tmp_path / ('collection' + suffix)
+        writeFunction(path)
+        collection = collectionClass()
+        getattr(collection, readName)(full_path=path)
+        collectionList.append(collection)
+
+    return collectionList
+
+
+def test_tweets_read_from_parquet_equal_csv(tmp_path):
+    tweetCol = TweetCollection(attributeList)
+    for num in range(3):
+        tweet = TweetObj(additionalAttributeList=attributeList)
+        tweet.id_str = str(100 + num)
+        tweet.created_at = '2020-08-0' + str(num + 1)
+        tweet.user_id = str(num % 2)
+        tweet.isRetweet = num % 2
+        tweet.text = 'Tweet\nNummer ' + str(num)
+        tweet.lang = None if num == 1 else 'de'
+        tweetCol.funcAddTweet(tweet)
+
+    csvCol, parquetCol = _read_both(
+        lambda: TweetCollection(attributeList),
+        'read_tweet_list_file',
+        tmp_path,
+        lambda path: tweetCol.write_tweet_list_file(full_path=path)
+    )
+
+    attrList = [
+        'id_str', 'created_at', 'user_id', 'isRetweet', 'text', 'lang'
+    ]
+    for csvTweet, parquetTweet in zip(csvCol.tweetList, parquetCol.tweetList):
+        for attr in attrList:
+            assert getattr(parquetTweet, attr) == getattr(csvTweet, attr)
+    assert len(parquetCol.tweetList) == 3
+    assert parquetCol.tweetList[1].isRetweet == '1'
+    assert parquetCol.tweetList[1].lang == ''
+    assert parquetCol.tweetList[0].text == 'Tweet Nummer 0'
+
+
+def test_users_read_from_parquet_equal_csv(tmp_path):
+    userCol = UserCollection()
+    for num in range(3):
+        user = User()
+        user.id_str = str(num)
+        user.screen_name = 'nutzer' + str(num)
+        user.followers = 10 * num
+        user.tweet_count = 100 + num
+        user.location = None if num == 2 else 'Berlin'
+        userCol.funcAddUser(user)
+
+    csvCol, parquetCol = _read_both(
+        UserCollection,
+        'read_user_list_file',
+        tmp_path,
+        lambda path: userCol.write_user_list_file(full_path=path)
+    )
+
+    for csvUser, parquetUser in zip(csvCol.userList, parquetCol.userList):
+        for attr in User.__slots__:
+            assert getattr(parquetUser, attr) == getattr(csvUser, attr)
+    assert len(parquetCol.userList) == 3
+    assert parquetCol.userList[1].followers == '10'
+    assert parquetCol.userList[1].tweet_count == '101'
+    assert parquetCol.userList[2].location == ''
+
+
+def test_profiles_read_from_parquet_equal_csv(tmp_path):
+    profileCol = ProfileCollection()
+    for num in range(3):
+        profile = Profile(
+            userID=str(num),
+            text='hallo welt',
+            numberWords=2,
+            numberTweets=num + 1,
+            language='de'
+        )
+        if num != 1:
+            profile.big5_openness = 0.25 * num
+            profile.facet_trust = 0.5
+        profile.WC = num
+        profile.Analytic = 12.5
+        profileCol.add_profile(profile)
+
+    csvCol, parquetCol = _read_both(
+        ProfileCollection,
+        'read_profile_list_file',
+        tmp_path,
+        lambda path: profileCol.write_profile_list_file(full_path=path)
+    )
+
+    attrList = Profile.attributeNameList + Profile.liwc_category_list
+    for csvProfile, parquetProfile in zip(
+        csvCol.profileList,
+        parquetCol.profileList
+    ):
+        for attr in attrList:
+            assert getattr(parquetProfile, attr) == getattr(csvProfile, attr)
+    assert len(parquetCol.profileList) == 3
+    assert parquetCol.profileList[0].numberTweets == '1'
+    assert parquetCol.profileList[2].big5_openness == '0.5'
+    # empty Big Five values are '' and LIWC values None, as from CSV
+    assert parquetCol.profileList[1].big5_openness == ''
+    assert parquetCol.profileList[1].Tone is None
+    assert parquetCol.profileList[1].Analytic == 12.5
@@ -0,0 +1,54 @@
+import os
+import json
+import pytest
+
+from miping.models import Profile
+from miping.training.dataPreparation import DataPreparation
+
+# outputs of clean_text before patterns were precompiled,
+# for German tweets and generated edge cases
+goldenPath = os.path.join(
+    os.path.dirname(__file__), 'data', 'cleanTextGolden.json'
+)
+
+
+@pytest.fixture(scope='module')
+def golden():
+    with open(goldenPath, 'r', encoding='utf-8') as in_file:
+        return json.load(in_file)
+
+
+def test_clean_text_is_byte_identical(golden):
+    dataPre = DataPreparation()
+    for entry in golden:
+        cleaned = dataPre.clean_text(entry['text'])
+        assert cleaned.encode('utf-8') == entry['cleaned'].encode('utf-8')
+
+
+def test_tokenize_text_equals_split_of_clean_text(golden):
+    dataPre = DataPreparation()
+    for entry in golden:
+        tokenList = dataPre.tokenize_text(entry['text'])
+        assert tokenList == entry['cleaned'].split(' ')
+
+
+def test_clean_many_keeps_order(golden):
+    dataPre = DataPreparation()
+    textList = [entry['text'] for entry in golden]
+    expected = [entry['cleaned'] for entry in golden]
+    assert dataPre.clean_many(textList) == expected
+    assert dataPre.clean_many(textList, n_jobs=2) == expected
+
+
+def test_profile_reuses_tokens(golden):
+    dataPre = DataPreparation()
+    entry = golden[0]
+    tokenList = dataPre.tokenize_text(entry['text'])
+    profile = Profile(userID='1')
+    profile.set_tokens(tokenList)
+    assert profile.text == entry['cleaned']
+    assert profile.get_tokens() is tokenList
+
+    # changed text is split again
+    profile.text = 'neuer text'
+    assert profile.get_tokens() == ['neuer', 'text']
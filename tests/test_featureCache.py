@@ -0,0 +1,183 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import miping.training.featureCache as featureCacheModule
+from miping.models import Profile
+from miping.training.featureCache import FeatureCache
+from miping.training.features import Features
+
+
+class FakeTime:
+    """
+    Replaces time module of featureCache, access times are set by test.
+    """
+    def __init__(self):
+        self.now = 1.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def fakeTime(monkeypatch):
+    fakeTime = FakeTime()
+    monkeypatch.setattr(featureCacheModule, 'time', fakeTime)
+
+    return fakeTime
+
+
+def test_key_changes_with_each_part():
+    parts = ['glove', '1', 'glove.db:10:20', 'hallo welt']
+    key = FeatureCache.create_key(*parts)
+
+    assert FeatureCache.create_key(*parts) == key
+    for num in range(len(parts)):
+        changedParts = list(parts)
+        changedParts[num] = changedParts[num] + 'x'
+        assert FeatureCache.create_key(*changedParts) != key
+    # parts cannot be shifted into each other
+    assert (
+        FeatureCache.create_key('glove', '1', 'ab', 'c') !=
+        FeatureCache.create_key('glove', '1', 'a', 'bc')
+    )
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float16, np.float64])
+def test_round_trip(tmp_path, dtype):
+    featureCache = FeatureCache(tmp_path / 'cache.db')
+    featureMatrix = np.arange(3 * 900).reshape(3, 900).astype(dtype)
+    featureCache.put_many(
+        keyList=['a', 'b', 'c'],
+        featureMatrix=featureMatrix,
+        coverageList=[0.5, 1.0, 0.25],
+        wordCountList=[10, 20, 30]
+    )
+
+    # reopened cache, duplicate and unknown keys
+    featureCache = FeatureCache(tmp_path / 'cache.db')
+    entries = featureCache.get_many(['c', 'x', 'a', 'c'])
+
+    assert set(entries) == {'a', 'c'}
+    for key, row in [('a', 0), ('c', 2)]:
+        features, coverage, wordCount = entries[key]
+        assert features.dtype == dtype
+        np.testing.assert_array_equal(features, featureMatrix[row])
+    assert entries['a'][1:] == (0.5, 10)
+    assert entries['c'][1:] == (0.25, 30)
+
+    statistics = featureCache.get_statistics()
+    assert statistics['hits'] == 3
+    assert statistics['misses'] == 1
+    assert statistics['entries'] == 3
+    assert statistics['size'] == featureMatrix.nbytes
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, fakeTime):
+    rowBytes = 900 * 4
+    featureCache = FeatureCache(tmp_path / 'cache.db', maxBytes=2 * rowBytes)
+
+    def put(key):
+        featureCache.put_many([key], np.zeros((1, 900), dtype=np.float32))
+
+    put('a')
+    fakeTime.now = 2.0
+    put('b')
+    # reading a makes b the least recently used entry
+    fakeTime.now = 3.0
+    featureCache.get_many(['a'])
+    fakeTime.now = 4.0
+    put('c')
+
+    assert set(featureCache.get_many(['a', 'b', 'c'])) == {'a', 'c'}
+    statistics = featureCache.get_statistics()
+    assert statistics['evictions'] == 1
+    assert statistics['size'] == 2 * rowBytes
+
+    # several entries at once, only the newest fits
+    fakeTime.now = 5.0
+    featureCache.put_many(
+        ['d', 'e'],
+        np.zeros((2, 900), dtype=np.float32)
+    )
+    assert set(featureCache.get_many(['a', 'c', 'd', 'e'])) == {'d', 'e'}
+    assert featureCache.get_statistics()['evictions'] == 3
+
+
+def _create_features(glovePath, featureCache, n_jobs=1):
+    features = Features()
+    features.createGloVeFeaturePipeline(
+        glovePath=glovePath,
+        dataBaseMode=True,
+        n_jobs=n_jobs,
+        featureCache=featureCache
+    )
+
+    return features
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_cached_features_equal_calculated(
+    tmp_path,
+    gloveFiles,
+    gloveProfiles,
+    n_jobs,
+):
+    reference = _create_features(gloveFiles['db'], None, n_jobs)
+    expected = reference.featureGloVeWithStatistics(gloveProfiles)
+
+    featureCache = FeatureCache(tmp_path / 'cache.db')
+    for run in range(2):
+        features = _create_features(gloveFiles['db'], featureCache, n_jobs)
+        result = features.featureGloVeWithStatistics(gloveProfiles)
+        np.testing.assert_array_equal(result[0], expected[0])
+        assert result[1] == expected[1]
+        assert result[2] == expected[2]
+
+    statistics = featureCache.get_statistics()
+    assert statistics['misses'] == len(gloveProfiles)
+    assert statistics['hits'] == len(gloveProfiles)
+
+
+def test_changes_invalidate_entries(
+    tmp_path,
+    monkeypatch,
+    gloveFiles,
+    gloveProfiles,
+):
+    glovePath = str(tmp_path / 'glove.db')
+    shutil.copyfile(gloveFiles['db'], glovePath)
+    featureCache = FeatureCache(tmp_path / 'cache.db')
+
+    def countMisses(profileList):
+        misses = featureCache.misses
+        features = _create_features(glovePath, featureCache)
+        features.featureGloVeWithStatistics(profileList)
+        return featureCache.misses - misses
+
+    assert countMisses(gloveProfiles) == 3
+    assert countMisses(gloveProfiles) == 0
+
+    # changed text
+    changedProfiles = [
+        Profile(userID=profile.userID, text=profile.text)
+        for profile in gloveProfiles
+    ]
+    changedProfiles[1].text = changedProfiles[1].text + ' wort1'
+    assert countMisses(changedProfiles) == 1
+
+    # changed calculation
+    monkeypatch.setattr(Features, 'gloveFeatureVersion', 'test')
+    assert countMisses(gloveProfiles) == 3
+    monkeypatch.undo()
+    assert countMisses(gloveProfiles) == 0
+
+    # rewritten GloVe file
+    fileStat = os.stat(glovePath)
+    os.utime(
+        glovePath,
+        ns=(fileStat.st_atime_ns, fileStat.st_mtime_ns + 10 ** 9)
+    )
+    assert countMisses(gloveProfiles) == 3
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from miping.models import Profile
+from miping.training.featureStore import FeatureStore
+
+
+def _create_profiles(numberProfiles):
+    return [
+        Profile(userID=str(num), text='text ' + str(num))
+        for num in range(numberProfiles)
+    ]
+
+
+def test_features_are_kept_after_reopening(tmp_path):
+    profileList = _create_profiles(5)
+    featureMatrix = np.arange(5 * 4, dtype=np.float32).reshape(5, 4)
+    featureStore = FeatureStore(tmp_path, dim=4)
+    featureStore.append(profileList, featureMatrix)
+
+    featureStore = FeatureStore(tmp_path, dim=4)
+    assert featureStore.get_missing_profiles(profileList) == []
+    np.testing.assert_array_equal(
+        featureStore.get_features(['4', '0']),
+        featureMatrix[[4, 0]]
+    )
+
+    # changed text leads to new row
+    profileList[2].text = 'changed'
+    assert featureStore.get_missing_profiles(profileList) == [
+        profileList[2]
+    ]
+    featureStore.append([profileList[2]], -np.ones((1, 4)))
+    np.testing.assert_array_equal(
+        featureStore.get_features(['2']),
+        -np.ones((1, 4))
+    )
+
+
+@pytest.mark.parametrize('options', [
+    {'featureType': 'liwc'},
+    {'dim': 300},
+    {'dtype': 'float16'},
+])
+def test_mismatching_meta_raises(tmp_path, options):
+    FeatureStore(tmp_path, featureType='glove', dim=4, dtype='float32')
+
+    with pytest.raises(Exception, match='Feature store'):
+        FeatureStore(tmp_path, **dict(
+            {'featureType': 'glove', 'dim': 4, 'dtype': 'float32'},
+            **options
+        ))
+
+
+def test_different_fingerprint_raises(tmp_path):
+    featureStore = FeatureStore(tmp_path, dim=4)
+    featureStore.check_fingerprint('first')
+
+    with pytest.raises(Exception, match='different GloVe'):
+        FeatureStore(tmp_path, dim=4).check_fingerprint('second')
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from miping.interfaces import GloVe
+from miping.training.features import Features
+
+
+def _get_features(glovePath, dataBaseMode, profileList):
+    pipeline = Features().createGloVeFeaturePipeline(
+        glovePath=glovePath,
+        dataBaseMode=dataBaseMode
+    )
+
+    return pipeline.fit_transform(profileList)
+
+
+@pytest.fixture(scope='module')
+def exportedStores(gloveFiles):
+    """
+    BLOB databases and memory-mapped stores exported from glove.db.
+    """
+    directory = gloveFiles['directory']
+    glove = GloVe(gloveFiles['db'], dataBaseMode=True)
+    storeDict = {}
+    for dtype in ['float32', 'float16']:
+        storeDict['blob_' + dtype] = str(directory / ('blob_' + dtype + '.db'))
+        glove.exportBlobDatabase(storeDict['blob_' + dtype], dtype=dtype)
+    for dtype in ['float32', 'float16', 'int8']:
+        storeDict['memmap_' + dtype] = str(
+            directory / ('memmap_' + dtype + '.npy')
+        )
+        glove.exportMemmapStore(storeDict['memmap_' + dtype], dtype=dtype)
+
+    return storeDict
+
+
+def test_backends_give_same_features(
+    gloveFiles,
+    exportedStores,
+    gloveProfiles,
+):
+    reference = _get_features(gloveFiles['db'], True, gloveProfiles)
+    assert reference.shape == (3, 900)
+
+    # mean, max and min of the vectors of all known tokens
+    vectorDict = {}
+    with open(gloveFiles['file'], encoding='utf-8') as infile:
+        for line in infile:
+            values = line.split(' ')
+            vectorDict[values[0]] = np.array(values[1:], dtype=np.float32)
+    for num, profile in enumerate(gloveProfiles):
+        vectors = np.array([
+            vectorDict[token] for token in profile.text.split(' ')
+            if token in vectorDict
+        ])
+        np.testing.assert_allclose(
+            reference[num],
+            np.concatenate([
+                vectors.mean(axis=0),
+                vectors.max(axis=0),
+                vectors.min(axis=0)
+            ]),
+            rtol=1e-5,
+            atol=1e-6
+        )
+
+    np.testing.assert_array_equal(
+        _get_features(gloveFiles['file'], False, gloveProfiles),
+        reference
+    )
+    np.testing.assert_array_equal(
+        _get_features(exportedStores['blob_float32'], True, gloveProfiles),
+        reference
+    )
+    np.testing.assert_array_equal(
+        _get_features(exportedStores['memmap_float32'], True, gloveProfiles),
+        reference
+    )
+
+
+@pytest.mark.parametrize('storeName, atol', [
+    ('blob_float16', 2.5e-3),
+    ('memmap_float16', 2.5e-3),
+    ('memmap_int8', 2.5e-2),
+])
+def test_quantized_backends_stay_close(
+    gloveFiles,
+    exportedStores,
+    gloveProfiles,
+    storeName,
+    atol,
+):
+    reference = _get_features(gloveFiles['db'], True, gloveProfiles)
+
+    np.testing.assert_allclose(
+        _get_features(exportedStores[storeName], True, gloveProfiles),
+        reference,
+        rtol=0,
+        atol=atol
+    )
+
+
+def test_word_statistics(gloveFiles, gloveProfiles):
+    features = Features()
+    features.createGloVeFeaturePipeline(
+        glovePath=gloveFiles['db'],
+        dataBaseMode=True
+    )
+    outputMatrix, coverageStatistics, wordCounts = (
+        features.featureGloVeWithStatistics(gloveProfiles)
+    )
+
+    knownWords = set(gloveFiles['wordList'])
+    for num, profile in enumerate(gloveProfiles):
+        tokens = profile.text.split(' ')
+        known = [token for token in tokens if token in knownWords]
+        assert wordCounts[num] == len(tokens)
+        assert coverageStatistics[num] == len(known) / len(tokens)
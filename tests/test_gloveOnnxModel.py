@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from miping.interfaces import GloVe
+from miping.models import OnnxModel, GloVeOnnxModel
+from miping.training.features import Features
+from miping.trainedModels.trainedModels import TrainedModels
+
+
+@pytest.fixture(scope='module')
+def endToEndModel(gloveFiles):
+    path = str(gloveFiles['directory'] / 'glovebig5_end_to_end.ONNX')
+    TrainedModels().build_end_to_end_onnx(
+        GloVe(gloveFiles['db'], dataBaseMode=True),
+        path
+    )
+    model = GloVeOnnxModel('ONNX End-to-End Model', 'big5')
+    model.importModelONNX(path)
+
+    return model
+
+
+def test_end_to_end_matches_pipeline(
+    gloveFiles,
+    gloveProfiles,
+    endToEndModel,
+):
+    pipeline = Features().createGloVeFeaturePipeline(
+        glovePath=gloveFiles['db'],
+        dataBaseMode=True
+    )
+    bundle = OnnxModel('ONNX Bundle', 'big5')
+    bundle.importModelONNX(TrainedModels().get_bundle_file_path())
+    reference = bundle.predict_all(pipeline.fit_transform(gloveProfiles))
+
+    for num, profile in enumerate(gloveProfiles):
+        prediction = endToEndModel.predict_token_ids(
+            endToEndModel.get_token_ids(profile.get_tokens())
+        )
+        assert set(prediction) == set(reference)
+        for dimension, values in prediction.items():
+            np.testing.assert_allclose(
+                values,
+                reference[dimension][num:num + 1],
+                rtol=1e-5,
+                atol=1e-5
+            )
+
+
+def test_token_ids(gloveFiles, endToEndModel):
+    tokenIds = endToEndModel.get_token_ids(
+        ['wort5', 'unbekannt', 'wort1999', 'wort5']
+    )
+
+    vocabulary = endToEndModel.vocabulary
+    assert len(vocabulary) == len(gloveFiles['wordList'])
+    np.testing.assert_array_equal(
+        tokenIds,
+        [vocabulary['wort5'], vocabulary['wort1999'], vocabulary['wort5']]
+    )
+    assert tokenIds.dtype == np.int64
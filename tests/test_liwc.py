@@ -0,0 +1,52 @@
+import csv
+
+from miping.interfaces import LiwcAPI
+from miping.models import Profile, ProfileCollection
+
+
+def _write_liwc_file(path, header, rowList):
+    with open(path, 'w', newline='', encoding='utf-8') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(header)
+        writer.writerows(rowList)
+
+
+def test_import_maps_aliases_and_skips_other_columns(tmp_path):
+    profileCol = ProfileCollection()
+    for userID in ['7', '3']:
+        profileCol.add_profile(Profile(userID=userID, text='hallo'))
+    path = tmp_path / 'liwc.csv'
+    # German LIWC export, decimal comma and an unknown column
+    _write_liwc_file(path, ['Filename', 'WC', 'you_total', 'achiev', 'x'], [
+        ['3', '12', '1,5', '2', '9'],
+        ['7', '4', '0', '0,25', '9'],
+    ])
+
+    returnCol = LiwcAPI().import_liwc_result(
+        fullPath=path,
+        profileCol=profileCol
+    )
+
+    assert returnCol is profileCol
+    first, second = profileCol.profileList
+    assert (first.WC, first.you, first.achieve) == (4.0, 0.0, 0.25)
+    assert (second.WC, second.you, second.achieve) == (12.0, 1.5, 2.0)
+    # categories not in the file stay empty
+    assert first.Analytic is None
+    assert profileCol.get_liwc_matrix()[1, 0] == 12
+
+
+def test_import_uses_last_of_duplicate_columns(tmp_path):
+    profileCol = ProfileCollection()
+    profileCol.add_profile(Profile(userID='1', text='hallo'))
+    path = tmp_path / 'liwc.csv'
+    # 'you' and its alias as well as 'WC' twice
+    _write_liwc_file(path, ['Filename', 'WC', 'you', 'you_total', 'WC'], [
+        ['1', '1', '2', '3', '4'],
+    ])
+
+    LiwcAPI().import_liwc_result(fullPath=path, profileCol=profileCol)
+
+    profile = profileCol.profileList[0]
+    assert profile.WC == 4.0
+    assert profile.you == 3.0
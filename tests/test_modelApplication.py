@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from miping.application.modelApplication import ModelApplication
+from miping.models import OnnxModel, Profile
+from miping.training.features import Features
+from miping.trainedModels.trainedModels import TrainedModels
+
+
+@pytest.fixture(params=[True, False], ids=['database', 'flatFile'])
+def application(request, monkeypatch, gloveFiles):
+    """
+    ModelApplication with GloVe pipeline and bundle, without Twitter.
+    """
+    dataBaseMode = request.param
+    features = Features()
+    pipeline = features.createGloVeFeaturePipeline(
+        glovePath=gloveFiles['db'] if dataBaseMode else gloveFiles['file'],
+        dataBaseMode=dataBaseMode
+    )
+    bundle = OnnxModel('ONNX Bundle', 'big5')
+    bundle.importModelONNX(TrainedModels().get_bundle_file_path())
+
+    monkeypatch.setattr(ModelApplication, 'glove_pipeline', pipeline)
+    monkeypatch.setattr(ModelApplication, 'featuresObj', features)
+    monkeypatch.setattr(ModelApplication, 'big5_bundle', bundle)
+    monkeypatch.setattr(ModelApplication, 'big5_end_to_end', None)
+
+    return ModelApplication.__new__(ModelApplication)
+
+
+def test_concurrent_predictions_are_not_mixed_up(gloveFiles, application):
+    # profiles differ in coverage and word count
+    random = np.random.RandomState(14)
+    requestList = []
+    for num in range(40):
+        numberTokens = 20 + 10 * num
+        tokens = list(random.choice(gloveFiles['wordList'], numberTokens))
+        tokens += ['unbekannt'] * num
+        requestList.append(
+            [Profile(userID=str(num), text=' '.join(tokens))]
+        )
+
+    expected = [application.get_personality(req) for req in requestList]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for repetition in range(3):
+            resultList = list(
+                executor.map(application.get_personality, requestList)
+            )
+            for result, expectedResult in zip(resultList, expected):
+                assert result['wordCount'] == expectedResult['wordCount']
+                assert result['coverage'] == expectedResult['coverage']
+                for dimension in ModelApplication.big5List:
+                    np.testing.assert_allclose(
+                        result[dimension],
+                        expectedResult[dimension],
+                        rtol=1e-6
+                    )
@@ -0,0 +1,52 @@
+import shutil
+import numpy as np
+
+from miping.models import ModelBase, OnnxModel
+from miping.trainedModels.trainedModels import TrainedModels
+
+
+def _copy_single_models(tmp_path):
+    pathDict = {}
+    for dimension, modelPath in TrainedModels().get_onnx_path_dict().items():
+        pathDict[dimension] = tmp_path / (dimension + '.ONNX')
+        shutil.copyfile(modelPath, pathDict[dimension])
+
+    return pathDict
+
+
+def test_bundle_matches_single_models(tmp_path):
+    pathDict = _copy_single_models(tmp_path)
+    bundlePath = tmp_path / 'bundle.ONNX'
+    ModelBase.exportONNXBundleFromFiles(pathDict, bundlePath)
+
+    X = np.random.RandomState(0).rand(5, 900).astype(np.float32)
+    bundle = OnnxModel('bundle', 'big5')
+    bundle.importModelONNX(bundlePath)
+    predictionDict = bundle.predict_all(X)
+    for dimension, modelPath in pathDict.items():
+        model = OnnxModel('single', dimension)
+        model.importModelONNX(modelPath)
+        np.testing.assert_allclose(
+            predictionDict[dimension], model.predict(X), atol=1e-5
+        )
+
+
+def test_outdated_bundle_is_detected(tmp_path):
+    pathDict = _copy_single_models(tmp_path)
+    bundlePath = tmp_path / 'bundle.ONNX'
+    ModelBase.exportONNXBundleFromFiles(pathDict, bundlePath)
+    assert ModelBase.isONNXBundleCurrent(bundlePath, pathDict)
+
+    # retrained model replaces one single file
+    shutil.copyfile(
+        pathDict['big5_openness'], pathDict['big5_neuroticism']
+    )
+    assert not ModelBase.isONNXBundleCurrent(bundlePath, pathDict)
+
+
+def test_shipped_bundle_is_current():
+    trainedModels = TrainedModels()
+    assert ModelBase.isONNXBundleCurrent(
+        trainedModels.get_bundle_file_path(),
+        trainedModels.get_onnx_path_dict()
+    )
@@ -0,0 +1,46 @@
+import numpy as np
+
+from miping.models import OnnxModel
+from miping.trainedModels.trainedModels import TrainedModels
+
+
+def test_optimized_graph_is_not_reused_for_other_model(tmp_path):
+    pathDict = TrainedModels().get_onnx_path_dict()
+    X = np.random.RandomState(0).rand(3, 900).astype(np.float32)
+    optimizedPath = tmp_path / 'model.optimized.ONNX'
+
+    first = OnnxModel(
+        'ONNX Model', 'first', optimizedModelFilePath=optimizedPath
+    )
+    first.importModelONNX(pathDict['big5_openness'])
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # e.g. retrained model with the same configured path
+    second = OnnxModel(
+        'ONNX Model', 'second', optimizedModelFilePath=optimizedPath
+    )
+    second.importModelONNX(pathDict['big5_neuroticism'])
+    assert len(list(tmp_path.iterdir())) == 2
+
+    reference = OnnxModel('ONNX Model', 'reference')
+    reference.importModelONNX(pathDict['big5_neuroticism'])
+    np.testing.assert_allclose(
+        second.predict(X), reference.predict(X), rtol=1e-5
+    )
+
+
+def test_optimized_graph_is_reused_for_same_model(tmp_path):
+    pathDict = TrainedModels().get_onnx_path_dict()
+    X = np.random.RandomState(0).rand(3, 900).astype(np.float32)
+    optimizedPath = tmp_path / 'model.optimized.ONNX'
+
+    predictions = []
+    for num in range(2):
+        model = OnnxModel(
+            'ONNX Model', 'model', optimizedModelFilePath=optimizedPath
+        )
+        model.importModelONNX(pathDict['big5_openness'])
+        predictions.append(model.predict(X))
+
+    assert len(list(tmp_path.iterdir())) == 1
+    np.testing.assert_allclose(predictions[0], predictions[1], rtol=1e-5)
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from miping.models import Profile
+from miping.models import ProfileCollection
+
+
+def _create_collection(numberProfiles):
+    profileCol = ProfileCollection()
+    for num in range(numberProfiles):
+        profile = Profile(userID=str(num), text='hallo welt')
+        profile.WC = num
+        profile.Analytic = num / 3
+        profileCol.add_profile(profile)
+
+    return profileCol
+
+
+def test_liwc_getters_return_float_or_none():
+    profile = Profile()
+    assert profile.WC is None
+
+    profile.WC = '12.5'
+    assert type(profile.WC) is float
+    assert profile.WC == 12.5
+
+    profile.WC = ''
+    assert profile.WC is None
+
+
+def test_liwc_matrix_follows_rebound_profiles():
+    first = _create_collection(100)
+    second = ProfileCollection()
+    for profile in first.profileList[::2]:
+        second.add_profile(profile)
+
+    # values changed via second collection are taken over by first
+    second.get_liwc_matrix()[:, 0] = -1
+    liwcMatrix = first.get_liwc_matrix()
+    assert np.all(liwcMatrix[::2, 0] == -1)
+    assert np.all(liwcMatrix[1::2, 0] == np.arange(1, 100, 2))
+
+    # and the other way round
+    liwcMatrix[:, 0] = -2
+    assert np.all(second.get_liwc_matrix()[:, 0] == -2)
+    assert all(profile.WC == -2 for profile in first.profileList)
+
+
+def test_csv_round_trip(tmp_path):
+    profileCol = _create_collection(5)
+    profileCol.profileList[0].WC = None
+    profileCol.profileList[1].Analytic = 0.1
+    fullPath = str(tmp_path / 'profiles.csv')
+    profileCol.write_profile_list_file(full_path=fullPath)
+
+    readCol = ProfileCollection()
+    readCol.read_profile_list_file(full_path=fullPath)
+
+    np.testing.assert_array_equal(
+        readCol.get_liwc_matrix(),
+        profileCol.get_liwc_matrix()
+    )
+    assert readCol.profileList[0].WC is None
+    assert readCol.profileList[0].Sixltr is None
+    assert (
+        readCol.profileList[1].Analytic ==
+        profileCol.profileList[1].Analytic
+    )
+
+    # writing again gives the same file
+    secondPath = str(tmp_path / 'profiles2.csv')
+    readCol.write_profile_list_file(full_path=secondPath)
+    with open(fullPath, 'rb') as first, open(secondPath, 'rb') as second:
+        assert first.read() == second.read()
+
+
+def test_user_index_follows_added_profiles():
+    profileCol = _create_collection(3)
+    # first lookup builds the index
+    assert profileCol.get_profile_by_user_id('1') is (
+        profileCol.profileList[1]
+    )
+
+    profileCol.add_profile(Profile(userID='3', text='neu'))
+    # appended directly, indexed on next lookup
+    profileCol.profileList.append(Profile(userID='4', text='direkt'))
+
+    assert profileCol.get_profile_by_user_id('3').text == 'neu'
+    assert profileCol.get_profile_by_user_id('4').text == 'direkt'
+    assert profileCol.get_profile_by_user_id('0') is (
+        profileCol.profileList[0]
+    )
+    with pytest.raises(IndexError):
+        profileCol.get_profile_by_user_id('5')
+
+    profileCol.add_profile(Profile(userID='3', text='doppelt'))
+    with pytest.raises(Exception, match='More than one profile'):
+        profileCol.get_profile_by_user_id('3')
+
+
+def test_user_index_after_changed_user_id():
+    profileCol = _create_collection(3)
+    profile = profileCol.get_profile_by_user_id('1')
+
+    profile.userID = 'neu'
+
+    assert profileCol.get_profile_by_user_id('neu') is profile
+    with pytest.raises(IndexError):
+        profileCol.get_profile_by_user_id('1')
+    assert profileCol.get_profile_by_user_id('2') is (
+        profileCol.profileList[2]
+    )
@@ -0,0 +1,191 @@
+import threading
+
+import pytest
+
+from miping.interfaces import RateLimiter, TwitterAPI
+
+
+class FakeClock:
+    """
+    Simulated time, sleeping only moves the clock forward.
+    """
+    def __init__(self):
+        self.now = 1600000000.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, url, headers):
+        self.url = url
+        self.headers = headers
+
+
+class FakeTwitterServer:
+    """
+    Enforces Twitter's fixed 15 minute windows per endpoint and
+    answers with rate limit headers. Calls over the limit are counted
+    as violations (Twitter would answer with 429).
+    """
+    limits = {
+        'followers/ids': 15,
+        'users/lookup': 300,
+        'statuses/user_timeline': 900,
+    }
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.windows = {}
+        self.calls = 0
+        self.violations = 0
+
+    def hit(self, endpoint):
+        start, used = self.windows.get(endpoint, (None, 0))
+        if start is None or self.clock.now >= start + 900:
+            start, used = self.clock.now, 0
+        used += 1
+        self.calls += 1
+        self.windows[endpoint] = (start, used)
+        limit = self.limits[endpoint]
+        if used > limit:
+            self.violations += 1
+
+        return FakeResponse(
+            'https://api.twitter.com/1.1/' + endpoint + '.json',
+            {
+                'x-rate-limit-limit': str(limit),
+                'x-rate-limit-remaining': str(max(limit - used, 0)),
+                'x-rate-limit-reset': str(int(start + 900)),
+            }
+        )
+
+
+class FakeAPI:
+    """
+    Replaces tweepy.API, every call is sent to the fake server.
+    """
+    def __init__(self, server):
+        self.server = server
+        self.last_response = None
+
+    def followers_ids(self, user_id, cursor=-1):
+        self.last_response = self.server.hit('followers/ids')
+        # one page of followers per user
+        return [int(user_id) * 10 + num for num in range(3)], (0, 0)
+
+    followers_ids.pagination_mode = 'cursor'
+
+    def lookup_users(self, user_ids):
+        self.last_response = self.server.hit('users/lookup')
+        return []
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def rateLimiter(clock):
+    return RateLimiter(clock=clock.time, sleep=clock.sleep)
+
+
+def test_empty_bucket_only_delays_its_endpoint(clock, rateLimiter):
+    for num in range(15):
+        assert rateLimiter.try_acquire('/followers/ids') == 0
+
+    assert rateLimiter.try_acquire('/followers/ids') == 901
+    assert rateLimiter.try_acquire('/users/lookup') == 0
+    assert rateLimiter.try_acquire('/unknown/endpoint') == 0
+
+    clock.sleep(600)
+    assert rateLimiter.try_acquire('/followers/ids') == 301
+    rateLimiter.acquire('/followers/ids')
+    assert clock.now == 1600000000.0 + 901
+    assert rateLimiter.waitCounter == 1
+    assert rateLimiter.get_remaining('/followers/ids') == 14
+
+
+def test_buckets_are_corrected_by_twitter(clock, rateLimiter):
+    reset = int(clock.now) + 300
+    rateLimiter.update_from_headers('/users/lookup', {
+        'x-rate-limit-limit': '300',
+        'x-rate-limit-remaining': '5',
+        'x-rate-limit-reset': str(reset),
+    })
+    assert rateLimiter.get_remaining('/users/lookup') == 5
+
+    # same window keeps the lower number, calls might still run
+    rateLimiter.update('/users/lookup', 300, 20, reset)
+    assert rateLimiter.get_remaining('/users/lookup') == 5
+
+    rateLimiter.update_from_status({'resources': {
+        'users': {
+            '/users/lookup': {'limit': 300, 'remaining': 0, 'reset': reset}
+        },
+        'statuses': {
+            '/statuses/lookup': {
+                'limit': 300, 'remaining': 100, 'reset': reset
+            }
+        },
+    }})
+    assert rateLimiter.try_acquire('/users/lookup') == 301
+    assert rateLimiter.get_remaining('/statuses/lookup') == 100
+
+    # missing headers do not change anything
+    rateLimiter.update_from_headers('/users/lookup', {})
+    assert rateLimiter.get_remaining('/users/lookup') == 0
+
+
+def test_threads_do_not_take_more_than_limit(rateLimiter):
+    acquiredList = []
+
+    def takeCalls():
+        acquired = 0
+        for num in range(200):
+            if rateLimiter.try_acquire('/users/lookup') == 0:
+                acquired += 1
+        acquiredList.append(acquired)
+
+    threadList = [threading.Thread(target=takeCalls) for num in range(8)]
+    for thread in threadList:
+        thread.start()
+    for thread in threadList:
+        thread.join()
+
+    assert sum(acquiredList) == 300
+
+
+def test_fake_server_limits_are_kept(clock, rateLimiter):
+    server = FakeTwitterServer(clock)
+    twitter = TwitterAPI.__new__(TwitterAPI)
+    twitter.api = FakeAPI(server)
+    twitter.rateLimiter = rateLimiter
+
+    # keys were used for followers shortly before
+    for num in range(10):
+        server.hit('followers/ids')
+    clock.sleep(300)
+    startTime = clock.now
+
+    followerIDs = twitter.get_followers_of_user(
+        [str(num) for num in range(40)],
+        limit=5000
+    )
+
+    assert len(followerIDs) == 120
+    assert server.violations == 0
+    # 5 calls are left in the running window, which resets after
+    # 600 seconds, then 15 calls per window (one extra second each)
+    assert rateLimiter.waitCounter == 3
+    assert clock.now - startTime == 601 + 901 + 901
+
+    # other endpoint has its own budget, no waiting
+    startTime = clock.now
+    twitter.getUsersByList([str(num) for num in range(5000)])
+    assert clock.now == startTime
+    assert server.violations == 0
@@ -0,0 +1,71 @@
+import pytest
+
+from helper import Scraping
+from miping.interfaces import TweetSink
+from miping.models import TweetCollection, TweetObj
+
+attributeList = ['lang']
+
+
+def _create_tweet(num):
+    tweet = TweetObj(additionalAttributeList=attributeList)
+    tweet.id_str = str(num)
+    tweet.created_at = '2020-08-01'
+    tweet.user_id = str(num % 7)
+    tweet.isRetweet = 0
+    tweet.text = 'Tweet Nummer ' + str(num)
+    tweet.lang = 'de'
+
+    return tweet
+
+
+@pytest.mark.parametrize('fileSuffix', ['.csv', '.parquet'])
+def test_sink_parts_are_appended_to_export(tmp_path, fileSuffix):
+    if fileSuffix == '.parquet':
+        pytest.importorskip('pyarrow')
+    sink = TweetSink(tmp_path / 'parts', attributeList, rotateTweets=20)
+    for num in range(50):
+        sink.put(_create_tweet(num))
+    sink.close()
+    scraping = Scraping(
+        config={'twitter': {'add_attributes': attributeList}},
+        twitter=None,
+        fileSuffix=fileSuffix
+    )
+    filePath = tmp_path / ('tweet' + fileSuffix)
+    # existing export must be replaced, not extended
+    TweetCollection(attributeList).write_tweet_list_file(full_path=filePath)
+
+    userTweetCol = scraping.collectUserTweets(
+        batchIter=sink.iter_tweets(batchSize=8),
+        file_path=filePath
+    )
+
+    # only the first tweet of each user is kept
+    assert [tweet.id_str for tweet in userTweetCol.tweetList] == [
+        str(num) for num in range(7)
+    ]
+    tweetCol = TweetCollection(attributeList)
+    tweetCol.read_tweet_list_file(full_path=filePath)
+    assert [tweet.id_str for tweet in tweetCol.tweetList] == [
+        str(num) for num in range(50)
+    ]
+    assert tweetCol.tweetList[-1].lang == 'de'
+
+
+def test_empty_sink_writes_empty_export(tmp_path):
+    scraping = Scraping(
+        config={'twitter': {'add_attributes': attributeList}},
+        twitter=None
+    )
+    filePath = tmp_path / 'tweet.csv'
+
+    userTweetCol = scraping.collectUserTweets(
+        batchIter=iter([]),
+        file_path=filePath
+    )
+
+    assert userTweetCol.tweetList == []
+    tweetCol = TweetCollection(attributeList)
+    tweetCol.read_tweet_list_file(full_path=filePath)
+    assert tweetCol.tweetList == []
@@ -0,0 +1,162 @@
+import pytest
+
+from miping.models import TweetCollection, TweetObj
+
+attributeList = ['lang']
+
+
+def _create_tweet(num, userID):
+    tweet = TweetObj(additionalAttributeList=attributeList)
+    tweet.id_str = str(num)
+    tweet.created_at = '2020-08-01'
+    tweet.user_id = userID
+    tweet.isRetweet = 0
+    tweet.text = 'Tweet Nummer ' + str(num)
+    tweet.lang = 'de'
+
+    return tweet
+
+
+def _get_ids(tweetCol):
+    return [tweet.id_str for tweet in tweetCol.tweetList]
+
+
+def test_index_follows_added_tweets():
+    tweetCol = TweetCollection(attributeList)
+    for num, userID in enumerate(['b', 'a', 'b']):
+        tweetCol.funcAddTweet(_create_tweet(num, userID))
+
+    # first lookup builds the index
+    assert _get_ids(tweetCol.get_tweets_of_userid('b')) == ['0', '2']
+    assert _get_ids(tweetCol.get_tweets_of_userid('c')) == []
+
+    tweetCol.funcAddTweet(_create_tweet(3, 'c'))
+    otherCol = TweetCollection(attributeList)
+    otherCol.funcAddTweet(_create_tweet(4, 'a'))
+    tweetCol.add_tweet_collection(otherCol)
+    # appended directly, indexed on next lookup
+    tweetCol.tweetList.append(_create_tweet(5, 'b'))
+
+    assert _get_ids(tweetCol.get_tweets_of_userid('a')) == ['1', '4']
+    assert _get_ids(tweetCol.get_tweets_of_userid('b')) == ['0', '2', '5']
+    assert _get_ids(tweetCol.get_tweets_of_userid('c')) == ['3']
+    assert tweetCol.get_tweets_of_userid('a').additionalAttributes == (
+        attributeList
+    )
+
+
+def test_index_is_rebuilt_for_shorter_list():
+    tweetCol = TweetCollection(attributeList)
+    for num, userID in enumerate(['a', 'b', 'a']):
+        tweetCol.funcAddTweet(_create_tweet(num, userID))
+    assert _get_ids(tweetCol.get_tweets_of_userid('a')) == ['0', '2']
+
+    tweetCol.tweetList = tweetCol.tweetList[1:]
+
+    assert _get_ids(tweetCol.get_tweets_of_userid('a')) == ['2']
+    assert _get_ids(tweetCol.get_tweets_of_userid('b')) == ['1']
+
+
+def test_group_by_user_keeps_order():
+    tweetCol = TweetCollection(attributeList)
+    for num, userID in enumerate(['c', 'a', 'c', 'b', 'a', 'c']):
+        tweetCol.funcAddTweet(_create_tweet(num, userID))
+
+    groupList = [
+        (userID, _get_ids(twCol))
+        for userID, twCol in tweetCol.group_by_user()
+    ]
+
+    # order of first tweet per user, tweets in list order
+    assert groupList == [
+        ('c', ['0', '2', '5']),
+        ('a', ['1', '4']),
+        ('b', ['3']),
+    ]
+    # each tweet in exactly one group
+    assert sorted(
+        tweetId for userID, idList in groupList for tweetId in idList
+    ) == _get_ids(tweetCol)
+
+
+@pytest.mark.parametrize('fileSuffix', ['.csv', '.parquet'])
+@pytest.mark.parametrize('batchSize', [1, 4, 5, 12])
+def test_batches_cover_file(tmp_path, fileSuffix, batchSize):
+    if fileSuffix == '.parquet':
+        pytest.importorskip('pyarrow')
+    tweetCol = TweetCollection(attributeList)
+    for num in range(10):
+        tweetCol.funcAddTweet(_create_tweet(num, str(num % 3)))
+    path = tmp_path / ('tweets' + fileSuffix)
+    tweetCol.write_tweet_list_file(full_path=path)
+
+    batchList = list(tweetCol.iter_tweet_list_file(
+        full_path=path,
+        batchSize=batchSize
+    ))
+
+    assert [len(batchCol.tweetList) for batchCol in batchList] == [
+        min(batchSize, 10 - start) for start in range(0, 10, batchSize)
+    ]
+    assert [
+        tweetId for batchCol in batchList for tweetId in _get_ids(batchCol)
+    ] == _get_ids(tweetCol)
+    assert batchList[-1].tweetList[-1].lang == 'de'
+    # read_tweet_list_file gives the same tweets
+    readCol = TweetCollection(attributeList)
+    readCol.read_tweet_list_file(full_path=path)
+    assert _get_ids(readCol) == _get_ids(tweetCol)
+
+
+def test_appended_batches_equal_one_write(tmp_path):
+    tweetCol = TweetCollection(attributeList)
+    for num in range(7):
+        tweetCol.funcAddTweet(_create_tweet(num, str(num % 2)))
+    onePath = tmp_path / 'one.csv'
+    tweetCol.write_tweet_list_file(full_path=onePath)
+
+    appendPath = tmp_path / 'append.csv'
+    for start in range(0, 7, 3):
+        batchCol = TweetCollection(attributeList)
+        for tweet in tweetCol.tweetList[start:start + 3]:
+            batchCol.funcAddTweet(tweet)
+        batchCol.write_tweet_list_file(
+            full_path=appendPath,
+            append=(start > 0)
+        )
+
+    assert appendPath.read_bytes() == onePath.read_bytes()
+    readCol = TweetCollection(attributeList)
+    readCol.read_tweet_list_file(full_path=appendPath)
+    assert _get_ids(readCol) == _get_ids(tweetCol)
+    with pytest.raises(ValueError):
+        tweetCol.write_tweet_list_file(
+            full_path=tmp_path / 'tweets.parquet',
+            append=True
+        )
+
+
+def test_parquet_appended_batches_equal_one_write(tmp_path):
+    pytest.importorskip('pyarrow')
+    tweetCol = TweetCollection(attributeList)
+    for num in range(7):
+        tweetCol.funcAddTweet(_create_tweet(num, str(num % 2)))
+    path = tmp_path / 'tweets.parquet'
+
+    writer = None
+    for start in range(0, 7, 3):
+        batchCol = TweetCollection(attributeList)
+        for tweet in tweetCol.tweetList[start:start + 3]:
+            batchCol.funcAddTweet(tweet)
+        writer = batchCol.append_tweet_list_parquet(
+            writer=writer,
+            full_path=path
+        )
+    writer.close()
+
+    readCol = TweetCollection(attributeList)
+    readCol.read_tweet_list_file(full_path=path)
+    assert _get_ids(readCol) == _get_ids(tweetCol)
+    assert [tweet.text for tweet in readCol.tweetList] == [
+        tweet.text for tweet in tweetCol.tweetList
+    ]
@@ -0,0 +1,116 @@
+import os
+import time
+
+import pytest
+
+from miping.models import TweetObj
+from miping.interfaces import TweetSink
+
+attributeList = ['lang']
+
+
+def _create_tweet(num):
+    tweet = TweetObj(additionalAttributeList=attributeList)
+    tweet.id_str = str(num)
+    tweet.created_at = '2020-08-01'
+    tweet.user_id = str(num % 7)
+    tweet.isRetweet = 0
+    tweet.text = 'Tweet Nummer ' + str(num)
+    tweet.lang = 'de'
+
+    return tweet
+
+
+@pytest.mark.parametrize('fileSuffix', ['.csv', '.parquet'])
+def test_sink_writes_all_tweets(tmp_path, fileSuffix):
+    sink = TweetSink(
+        tmp_path,
+        attributeList,
+        fileSuffix,
+        batchSize=10,
+        queueSize=1000,
+        rotateTweets=100
+    )
+    for num in range(250):
+        sink.put(_create_tweet(num))
+    statistics = sink.close()
+
+    assert statistics['written'] == 250
+    assert statistics['dropped'] == 0
+    assert [os.path.basename(path) for path in sink.partPathList] == [
+        'part0000' + str(num) + fileSuffix for num in range(1, 4)
+    ]
+    tweetCol = sink.read_tweets()
+    assert [tweet.id_str for tweet in tweetCol.tweetList] == [
+        str(num) for num in range(250)
+    ]
+    assert tweetCol.tweetList[-1].lang == 'de'
+
+
+def test_parquet_part_is_written_in_row_groups(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    sink = TweetSink(tmp_path, fileSuffix='.parquet', batchSize=10)
+    for num in range(35):
+        sink.put(_create_tweet(num))
+    sink.close()
+
+    parquetFile = pq.ParquetFile(sink.partPathList[0])
+    assert parquetFile.num_row_groups == 4
+    assert parquetFile.metadata.num_rows == 35
+
+
+def test_existing_parts_are_not_overwritten(tmp_path):
+    # gaps and other files must not lead to reused numbers
+    for fileName in ['part00002.csv', 'part00007.parquet', 'notes.txt']:
+        (tmp_path / fileName).write_text('keep')
+
+    sink = TweetSink(tmp_path, batchSize=10)
+    for num in range(5):
+        sink.put(_create_tweet(num))
+    sink.close()
+
+    assert os.path.basename(sink.partPathList[0]) == 'part00008.csv'
+    for fileName in ['part00002.csv', 'part00007.parquet', 'notes.txt']:
+        assert (tmp_path / fileName).read_text() == 'keep'
+
+
+def test_close_waits_for_last_batch(tmp_path):
+    sink = TweetSink(tmp_path, batchSize=10, queueSize=1)
+    writeBatch = sink._write_batch
+
+    def slowWriteBatch(batch):
+        time.sleep(0.05)
+        writeBatch(batch)
+
+    sink._write_batch = slowWriteBatch
+    for num in range(205):
+        sink.put(_create_tweet(num))
+    statistics = sink.close()
+
+    # full batches are dropped while streaming, but not the last one
+    assert statistics['dropped'] > 0
+    assert statistics['written'] + statistics['dropped'] == 205
+    tweetCol = sink.read_tweets()
+    assert tweetCol.tweetList[-1].id_str == '204'
+
+
+def test_iter_tweets_reads_parts_in_batches(tmp_path):
+    sink = TweetSink(
+        tmp_path, attributeList, batchSize=5, rotateTweets=25
+    )
+    for num in range(60):
+        sink.put(_create_tweet(num))
+    sink.close()
+
+    batchList = list(sink.iter_tweets(batchSize=10))
+
+    # batches do not span part files of 25, 25 and 10 tweets
+    assert [len(batchCol.tweetList) for batchCol in batchList] == [
+        10, 10, 5, 10, 10, 5, 10
+    ]
+    assert [
+        tweet.id_str
+        for batchCol in batchList
+        for tweet in batchCol.tweetList
+    ] == [str(num) for num in range(60)]
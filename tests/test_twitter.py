@@ -0,0 +1,145 @@
+import os
+
+import pytest
+
+import miping.interfaces.twitter as twitter
+from miping.interfaces import TweetSink
+from miping.models import TweetCollection
+
+attributeList = ['lang']
+
+locationDict = {
+    'Germany': [7.5117568, 47.5323664, 14.4122569, 54.6847005],
+    'USA': [-124.482003, 32.528832, -66.885417, 47.459833],
+    'Bavaria': [8.97, 47.27, 13.84, 50.56],
+}
+
+# last digits of the recorded status ids per location
+expectedDict = {
+    'Germany': {1, 2, 4, 9},
+    'USA': {3, 7, 10},
+    'Bavaria': {2, 9},
+}
+
+
+@pytest.fixture(scope='module')
+def recordedData():
+    """
+    Raw messages of a recorded location stream, incl. limit and
+    delete notices and a retweet.
+    """
+    path = os.path.join(
+        os.path.dirname(__file__), 'data', 'streamStatuses.jsonl'
+    )
+    with open(path, 'r', encoding='utf-8') as infile:
+        return infile.read().splitlines()
+
+
+def _get_numbers(tweetCol):
+    return {int(tweet.id_str) % 100 for tweet in tweetCol.tweetList}
+
+
+def _create_listener(locationDict, timeLimit=100):
+    return twitter._MyStreamListener(
+        tweetCollectDict={
+            name: TweetCollection(attributeList) for name in locationDict
+        },
+        additionalAttributes=attributeList,
+        locationDict=locationDict,
+        time_limit=timeLimit
+    )
+
+
+def test_tweets_are_dispatched_to_locations(recordedData):
+    listener = _create_listener(locationDict)
+    for data in recordedData:
+        assert listener.on_data(data) is not False
+
+    for name, expected in expectedDict.items():
+        assert _get_numbers(listener.tweetCollectDict[name]) == expected
+    assert listener.locationCounter == {
+        name: len(expected) for name, expected in expectedDict.items()
+    }
+    # status 5 with place outside, 6 with coordinates outside
+    assert listener.skipLocationCounter == 2
+
+    tweetDict = {
+        int(tweet.id_str) % 100: tweet
+        for tweet in listener.tweetCollectDict['Germany'].tweetList
+    }
+    assert tweetDict[9].text.startswith('Ein langer Tweet 9')
+    assert tweetDict[1].lang == 'de'
+
+
+def test_single_location_accepts_all_tweets(recordedData):
+    listener = _create_listener({'location': locationDict['Germany']})
+    for data in recordedData:
+        listener.on_data(data)
+
+    # everything except the retweet
+    assert _get_numbers(listener.tweetCollectDict['location']) == (
+        set(range(1, 11)) - {8}
+    )
+
+
+def test_stream_ends_after_time_limit(recordedData):
+    listener = _create_listener(locationDict, timeLimit=0)
+
+    assert listener.on_data(recordedData[0]) is False
+    assert _get_numbers(listener.tweetCollectDict['Germany']) == set()
+
+
+def test_one_stream_for_all_locations(recordedData, monkeypatch, tmp_path):
+    streamList = []
+
+    class ReplayStream:
+        def __init__(self, auth, listener):
+            self.listener = listener
+            streamList.append(self)
+
+        def filter(self, locations):
+            self.locations = locations
+            for data in recordedData:
+                if self.listener.on_data(data) is False:
+                    break
+
+    monkeypatch.setattr(twitter.tweepy, 'Stream', ReplayStream)
+    api = twitter.TwitterAPI.__new__(twitter.TwitterAPI)
+    api.api = type('FakeAPI', (), {'auth': None})()
+    api.streaming_enabled = True
+    api.additionalAttributes = attributeList
+    api.removeNewLineChar = True
+    api.ignoreRetweets = True
+
+    tweetSinkDict = {
+        name: TweetSink(tmp_path / name, attributeList, batchSize=2)
+        for name in locationDict
+    }
+    returnDict = api.stream_tweets_by_locations(
+        locationDict,
+        timeLimit=100,
+        tweetSinkDict=tweetSinkDict
+    )
+    # sinks are returned instead of reading all tweets into memory
+    assert returnDict == tweetSinkDict
+    tweetColDict = {
+        name: tweetSink.read_tweets()
+        for name, tweetSink in returnDict.items()
+    }
+
+    assert len(streamList) == 1
+    assert streamList[0].locations == (
+        locationDict['Germany'] +
+        locationDict['USA'] +
+        locationDict['Bavaria']
+    )
+    for name, expected in expectedDict.items():
+        assert _get_numbers(tweetColDict[name]) == expected
+        assert tweetSinkDict[name].get_statistics()['written'] == (
+            len(expected)
+        )
+    tweetDict = {
+        int(tweet.id_str) % 100: tweet
+        for tweet in tweetColDict['USA'].tweetList
+    }
+    assert '\n' not in tweetDict[10].text
@@ -0,0 +1,73 @@
+import pytest
+
+from miping.models import User, UserCollection
+
+
+def _create_collection(numberUsers):
+    userCol = UserCollection()
+    for num in range(numberUsers):
+        user = User()
+        user.id_str = str(num)
+        user.screen_name = 'nutzer' + str(num)
+        user.followers = str(10 * num)
+        user.tweet_count = str(100 + num)
+        user.location = 'Berlin'
+        userCol.funcAddUser(user)
+
+    return userCol
+
+
+def _get_ids(userCol):
+    return [user.id_str for user in userCol.userList]
+
+
+@pytest.mark.parametrize('fileSuffix', ['.csv', '.parquet'])
+@pytest.mark.parametrize('batchSize', [1, 4, 5, 12])
+def test_batches_cover_file(tmp_path, fileSuffix, batchSize):
+    if fileSuffix == '.parquet':
+        pytest.importorskip('pyarrow')
+    userCol = _create_collection(10)
+    path = tmp_path / ('users' + fileSuffix)
+    userCol.write_user_list_file(full_path=path)
+
+    batchList = list(userCol.iter_user_list_file(
+        full_path=path,
+        batchSize=batchSize
+    ))
+
+    assert [len(batchCol.userList) for batchCol in batchList] == [
+        min(batchSize, 10 - start) for start in range(0, 10, batchSize)
+    ]
+    assert [
+        userId for batchCol in batchList for userId in _get_ids(batchCol)
+    ] == _get_ids(userCol)
+    assert batchList[-1].userList[-1].followers == '90'
+    # iterating does not add users to the collection itself
+    assert len(userCol.userList) == 10
+
+
+def test_appended_batches_equal_one_write(tmp_path):
+    userCol = _create_collection(7)
+    onePath = tmp_path / 'one.csv'
+    userCol.write_user_list_file(full_path=onePath)
+
+    appendPath = tmp_path / 'append.csv'
+    for start in range(0, 7, 3):
+        batchCol = UserCollection()
+        for user in userCol.userList[start:start + 3]:
+            batchCol.funcAddUser(user)
+        batchCol.write_user_list_file(
+            full_path=appendPath,
+            append=(start > 0)
+        )
+
+    assert appendPath.read_bytes() == onePath.read_bytes()
+    readCol = UserCollection()
+    readCol.read_user_list_file(full_path=appendPath)
+    assert _get_ids(readCol) == _get_ids(userCol)
+    assert readCol.userList[6].screen_name == 'nutzer6'
+    with pytest.raises(ValueError):
+        userCol.write_user_list_file(
+            full_path=tmp_path / 'users.parquet',
+            append=True
+        )